@@ -1,40 +1,79 @@
+from io import BytesIO
 from typing import List
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
 from application.dto.vacancy import VacancyOutput
 from application.errors.media import NotFoundPdfMediaToGenerate
 from domain.interfaces.pdf_generator import IPDFGenerator
 
+REPORT_TITLE = "Relatório de gastos"
+TABLE_HEADER = ["Descrição", "Setor", "Gerente", "Expectativa de salário"]
+COLUMN_WIDTHS = [180, 80, 160, 135]
+
+# Built once per process and shared by every report.
+STYLES = getSampleStyleSheet()
+TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.gray),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("ALIGN", (5, 1), (-1, -1), "RIGHT"),
+        ("BACKGROUND", (0, -1), (-1, -1), colors.lightgrey),
+    ]
+)
+
+# Above this amount of vacancies the report is drawn straight on the canvas.
+LARGE_REPORT_ROWS = 500
+
+# Geometry of the canvas renderer, matching the layout of the platypus table.
+PAGE_WIDTH, PAGE_HEIGHT = A4
+PAGE_MARGIN = 72
+ROW_HEIGHT = 18
+CELL_PADDING = 6
+TEXT_OFFSET = 5
+FONT_SIZE = 10
+TITLE_FONT_SIZE = 18
+TITLE_BASELINE = 24
+TITLE_HEIGHT = 46
+
 
 class ReportLabAdapter(IPDFGenerator):
     """
     Adapter for generating PDF reports using ReportLab.
+    Small reports are laid out by platypus, large ones are drawn page by page
+    on the canvas, whose cost grows linearly with the amount of rows.
     """
 
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.output_filename = "report.pdf"
-
-    def generate_pdf(self, vacancies: List[VacancyOutput]) -> str:
-        total_salary = 0
+    def __init__(self, large_report_rows: int = LARGE_REPORT_ROWS):
+        """
+        :param large_report_rows: Amount of vacancies from which the canvas renderer is used.
+        """
 
-        if len(vacancies) == 0:
-            raise NotFoundPdfMediaToGenerate("No vacancies to generate report.")
+        self.styles = STYLES
+        self.large_report_rows = large_report_rows
 
-        document_template = SimpleDocTemplate(self.output_filename, pagesize=A4)
-        elements = []
+    def __getstate__(self) -> dict:
+        # Stylesheets can't be pickled, a render worker process uses its own.
+        state = self.__dict__.copy()
+        del state["styles"]
+        return state
 
-        elements.append(Paragraph("Relatório de gastos", self.styles["Title"]))
-        elements.append(Spacer(1, 12))
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.styles = STYLES
 
-        table_data = [["Descrição", "Setor", "Gerente", "Expectativa de salário"]]
+    @staticmethod
+    def _table_rows(vacancies: List[VacancyOutput]) -> tuple[list, list]:
+        rows = []
+        total_salary = 0
 
         for vacancy in vacancies:
-            table_data.append(
+            rows.append(
                 [
                     vacancy.description,
                     vacancy.sector,
@@ -44,21 +83,117 @@ class ReportLabAdapter(IPDFGenerator):
             )
             total_salary += vacancy.salary_expectation
 
-        table_data.append(["Total", "", "", f"${total_salary:.2f}"])
-        table = Table(table_data, colWidths=[180, 80, 160, 135])
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.gray),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("ALIGN", (5, 1), (-1, -1), "RIGHT"),
-                    ("BACKGROUND", (0, -1), (-1, -1), colors.lightgrey),
-                ]
-            )
-        )
+        return rows, ["Total", "", "", f"${total_salary:.2f}"]
+
+    def generate_pdf(self, vacancies: List[VacancyOutput]) -> bytes:
+        if len(vacancies) == 0:
+            raise NotFoundPdfMediaToGenerate("No vacancies to generate report.")
+
+        rows, total_row = self._table_rows(vacancies)
+
+        if len(rows) > self.large_report_rows:
+            return self._draw_large_report(rows, total_row)
+
+        # Each call renders into its own buffer, concurrent reports never share a file.
+        buffer = BytesIO()
+        document_template = SimpleDocTemplate(buffer, pagesize=A4)
+
+        elements = [
+            Paragraph(REPORT_TITLE, self.styles["Title"]),
+            Spacer(1, 12),
+            Table(
+                [TABLE_HEADER, *rows, total_row],
+                colWidths=COLUMN_WIDTHS,
+                style=TABLE_STYLE,
+            ),
+        ]
 
-        elements.append(table)
         document_template.build(elements)
 
-        return self.output_filename
+        return buffer.getvalue()
+
+    @staticmethod
+    def _draw_large_report(rows: list, total_row: list) -> bytes:
+        """
+        Draw the report straight on the canvas, one text object and one grid
+        per page with the header repeated on every page. Nothing is laid out
+        twice, so the cost grows linearly with the amount of rows.
+        """
+
+        buffer = BytesIO()
+        pdf = Canvas(buffer, pagesize=A4)
+        pdf.setLineWidth(1)
+
+        x_positions = [(PAGE_WIDTH - sum(COLUMN_WIDTHS)) / 2]
+        for width in COLUMN_WIDTHS:
+            x_positions.append(x_positions[-1] + width)
+
+        top = PAGE_HEIGHT - PAGE_MARGIN
+        all_rows = [*rows, total_row]
+        start = 0
+
+        while start < len(all_rows):
+            table_top = top
+
+            if start == 0:
+                pdf.setFont("Helvetica-Bold", TITLE_FONT_SIZE)
+                pdf.drawCentredString(
+                    PAGE_WIDTH / 2, top - TITLE_BASELINE, REPORT_TITLE
+                )
+                table_top -= TITLE_HEIGHT
+
+            rows_per_page = int((table_top - PAGE_MARGIN) // ROW_HEIGHT) - 1
+            page_rows = all_rows[start : start + rows_per_page]
+            start += rows_per_page
+
+            ReportLabAdapter._draw_page(
+                pdf, page_rows, table_top, x_positions, start >= len(all_rows)
+            )
+
+        pdf.save()
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _draw_page(
+        pdf: Canvas,
+        rows: list,
+        table_top: float,
+        x_positions: list,
+        is_last_page: bool,
+    ):
+        """
+        Draw one page of the table below table_top: the header, the rows and,
+        on the last page, the shaded total row, then start a new page.
+        """
+
+        left = x_positions[0]
+        table_width = x_positions[-1] - left
+
+        pdf.setFillColor(colors.gray)
+        pdf.rect(left, table_top - ROW_HEIGHT, table_width, ROW_HEIGHT, 0, 1)
+
+        if is_last_page:
+            page_bottom = table_top - ROW_HEIGHT * (len(rows) + 1)
+            pdf.setFillColor(colors.lightgrey)
+            pdf.rect(left, page_bottom, table_width, ROW_HEIGHT, 0, 1)
+
+        text = pdf.beginText()
+        text.setFont("Helvetica", FONT_SIZE)
+        text.setFillColor(colors.white)
+
+        for index, row in enumerate([TABLE_HEADER, *rows]):
+            if index == 1:
+                text.setFillColor(colors.black)
+
+            baseline = table_top - ROW_HEIGHT * (index + 1) + TEXT_OFFSET
+            for x, value in zip(x_positions, row):
+                text.setTextOrigin(x + CELL_PADDING, baseline)
+                text.textOut(value)
+
+        pdf.drawText(text)
+        pdf.grid(
+            x_positions,
+            [table_top - ROW_HEIGHT * i for i in range(len(rows) + 2)],
+        )
+        pdf.showPage()
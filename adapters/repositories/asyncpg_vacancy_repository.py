@@ -0,0 +1,335 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List, Mapping
+from uuid import UUID, uuid4
+
+from tortoise import BaseDBAsyncClient
+
+from adapters.repositories.vacancy_repository import (
+    COPY_COLUMNS,
+    EDIT_VACANCY_STATUS_SQL,
+    ESTIMATE_VACANCIES_SQL,
+    SECTOR_COST_SUMMARY_SQL,
+    SECTOR_SUMMARY_FINGERPRINT_SQL,
+    SECTORS_COST_SUMMARY_SQL,
+    UPDATE_VACANCY_SQL,
+    VACANCY_COLUMNS,
+    VACANCY_GENERATION_SQL,
+    ListingStatements,
+    build_bulk_status_update,
+    build_copy_records,
+    build_cost_simulation,
+    build_listing_page,
+    build_listing_statements,
+    plan_rows,
+    pop_window_total,
+    stream_vacancy_rows,
+)
+from application.dto.pagination import Pagination, PaginationResponse, TotalMode
+from application.dto.simulation import (
+    CostSimulationInput,
+    CostSimulationOutput,
+    SectorCostBreakdown,
+)
+from application.dto.vacancy import (
+    BulkStatusUpdateInput,
+    NotesInput,
+    StatusToUpdate,
+    VacancyInput,
+    VacancyOutput,
+)
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from infra.database.pgdatabase import Status
+from infra.database.routing import connection_router
+from utils.date_utils import as_aware_datetime
+
+GET_VACANCY_SQL = f'SELECT {VACANCY_COLUMNS} FROM "vacancy" WHERE "id" = $1;'
+
+SECTOR_SUMMARY_SQL = (
+    f'SELECT {VACANCY_COLUMNS} FROM "vacancy" WHERE lower("sector") = lower($1);'
+)
+
+CREATE_VACANCY_SQL = (
+    f'INSERT INTO "vacancy" ({VACANCY_COLUMNS}) '
+    "VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $11) "
+    f"RETURNING {VACANCY_COLUMNS};"
+)
+
+DELETE_VACANCY_SQL = 'DELETE FROM "vacancy" WHERE "id" = $1;'
+
+GET_ARCHIVED_VACANCY_SQL = (
+    f'SELECT {VACANCY_COLUMNS} FROM "vacancy_archive" WHERE "id" = $1;'
+)
+
+COUNT_VACANCIES_SQL = 'SELECT COUNT(*) FROM "vacancy";'
+
+GET_VACANCY_VERSION_SQL = 'SELECT "updated_at" FROM "vacancy" WHERE "id" = $1;'
+
+GET_ARCHIVED_VACANCY_VERSION_SQL = (
+    'SELECT "updated_at" FROM "vacancy_archive" WHERE "id" = $1;'
+)
+
+
+class AsyncpgVacancyRepository(IVacancyRepository):
+    """
+    Repository for managing vacancies straight through asyncpg.
+    Statements are built from a small, fixed set of SQL texts with positional
+    parameters, so asyncpg prepares each once per connection and reuses it
+    from its statement cache.
+    Shares the connection pools and the read/write routing of Tortoise.
+    """
+
+    async def _fetch(self, conn: BaseDBAsyncClient, sql: str, *args) -> list:
+        async with conn.acquire_connection() as connection:
+            return await connection.fetch(sql, *args)
+
+    async def _fetchrow(self, conn: BaseDBAsyncClient, sql: str, *args):
+        async with conn.acquire_connection() as connection:
+            return await connection.fetchrow(sql, *args)
+
+    async def _fetchval(self, conn: BaseDBAsyncClient, sql: str, *args):
+        async with conn.acquire_connection() as connection:
+            return await connection.fetchval(sql, *args)
+
+    async def get_vacancy_by_id(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> VacancyOutput | None:
+        conn = connection_router.for_read()
+
+        row = await self._fetchrow(conn, GET_VACANCY_SQL, UUID(vacancy_id))
+
+        if row is None and include_archived:
+            row = await self._fetchrow(conn, GET_ARCHIVED_VACANCY_SQL, UUID(vacancy_id))
+
+        return VacancyOutput.model_validate(dict(row)) if row else None
+
+    async def get_vacancy_version(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> datetime | None:
+        conn = connection_router.for_read()
+
+        version = await self._fetchval(conn, GET_VACANCY_VERSION_SQL, UUID(vacancy_id))
+
+        if version is None and include_archived:
+            version = await self._fetchval(
+                conn, GET_ARCHIVED_VACANCY_VERSION_SQL, UUID(vacancy_id)
+            )
+
+        return version
+
+    async def get_collection_version(self) -> int:
+        version = await self._fetchval(
+            connection_router.for_read(), VACANCY_GENERATION_SQL
+        )
+        return version or 0
+
+    async def get_sector_summary_fingerprint(self, sector: str) -> tuple[int, int]:
+        row = await self._fetchrow(
+            connection_router.for_read(), SECTOR_SUMMARY_FINGERPRINT_SQL, sector
+        )
+        return row["vacancy_count"], row["version"] or 0
+
+    async def get_summary_of_vacancies_by_sector(
+        self, sector: str
+    ) -> List[VacancyOutput]:
+
+        if not sector:
+            return []
+
+        rows = await self._fetch(
+            connection_router.for_read(), SECTOR_SUMMARY_SQL, sector
+        )
+
+        return [VacancyOutput.model_validate(dict(row)) for row in rows]
+
+    async def create_vacancy(self, vacancy_data: VacancyInput) -> VacancyOutput:
+        now = datetime.now(timezone.utc)
+
+        row = await self._fetchrow(
+            connection_router.for_write(),
+            CREATE_VACANCY_SQL,
+            uuid4(),
+            vacancy_data.description,
+            vacancy_data.sector,
+            vacancy_data.manager,
+            vacancy_data.salary_expectation,
+            int(vacancy_data.urgency),
+            vacancy_data.status.value,
+            as_aware_datetime(vacancy_data.start_date) or now,
+            as_aware_datetime(vacancy_data.end_date) or now,
+            vacancy_data.notes,
+            now,
+        )
+
+        return VacancyOutput.model_validate(dict(row))
+
+    async def bulk_create_vacancies(
+        self, vacancies_data: List[VacancyInput]
+    ) -> List[UUID]:
+        records = build_copy_records(vacancies_data)
+
+        conn = connection_router.for_write()
+
+        async with conn.acquire_connection() as connection:
+            await connection.copy_records_to_table(
+                "vacancy", records=records, columns=COPY_COLUMNS
+            )
+
+        return [record[0] for record in records]
+
+    async def update_vacancy(
+        self, vacancy_id: str, vacancy_data: VacancyInput
+    ) -> VacancyOutput | None:
+        row = await self._fetchrow(
+            connection_router.for_write(),
+            UPDATE_VACANCY_SQL,
+            UUID(vacancy_id),
+            vacancy_data.description,
+            vacancy_data.sector,
+            vacancy_data.manager,
+            vacancy_data.salary_expectation,
+            int(vacancy_data.urgency),
+            vacancy_data.status.value,
+            as_aware_datetime(vacancy_data.start_date),
+            as_aware_datetime(vacancy_data.end_date),
+            vacancy_data.notes,
+            datetime.now(timezone.utc),
+        )
+
+        return VacancyOutput.model_validate(dict(row)) if row else None
+
+    async def delete_vacancy(self, vacancy_id: str) -> bool:
+        conn = connection_router.for_write()
+
+        async with conn.acquire_connection() as connection:
+            status = await connection.execute(DELETE_VACANCY_SQL, UUID(vacancy_id))
+
+        # asyncpg returns the command tag, e.g. "DELETE 1".
+        return status != "DELETE 0"
+
+    async def list_vacancies(self, pagination: Pagination) -> PaginationResponse:
+        statements = build_listing_statements(pagination)
+        conn = connection_router.for_read()
+
+        page = self._fetch(conn, statements.page_sql, *statements.page_values)
+        total = None
+
+        if pagination.total_mode == TotalMode.estimated:
+            # Only the plain hot listing can use the table statistics directly.
+            plain_listing = not (pagination.search or pagination.include_archived)
+            records, total = await asyncio.gather(
+                page, self._estimate_total(conn, None if plain_listing else statements)
+            )
+        elif pagination.total_mode == TotalMode.exact and not statements.window_total:
+            records, total = await asyncio.gather(
+                page,
+                self._fetchval(conn, statements.count_sql, *statements.filter_values),
+            )
+        else:
+            records = await page
+
+        rows = [dict(record) for record in records]
+
+        if statements.window_total:
+            total = pop_window_total(rows)
+            if total is None:
+                total = (
+                    0
+                    if pagination.page == 0
+                    else await self._fetchval(
+                        conn, statements.count_sql, *statements.filter_values
+                    )
+                )
+
+        return build_listing_page(pagination, statements, rows, total)
+
+    async def _estimate_total(
+        self,
+        conn: BaseDBAsyncClient,
+        statements: ListingStatements | None = None,
+    ) -> int:
+        """
+        Estimate the number of vacancies of a listing from planner statistics.
+        Falls back to an exact count when the table was never analyzed.
+        """
+
+        if statements:
+            return plan_rows(
+                await self._fetchval(
+                    conn, statements.estimate_sql, *statements.filter_values
+                )
+            )
+
+        estimate = await self._fetchval(conn, ESTIMATE_VACANCIES_SQL)
+
+        if estimate is None or estimate < 0:
+            return await self._fetchval(conn, COUNT_VACANCIES_SQL)
+
+        return estimate
+
+    def stream_vacancies(
+        self, search: str | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        return stream_vacancy_rows(connection_router.for_read(), search, chunk_size)
+
+    async def edit_vacancy_status(
+        self,
+        vacancy_id: str,
+        vacancy_status: StatusToUpdate,
+        optional_notes: NotesInput = None,
+    ) -> VacancyOutput | None:
+        row = await self._fetchrow(
+            connection_router.for_write(),
+            EDIT_VACANCY_STATUS_SQL,
+            UUID(vacancy_id),
+            vacancy_status.value,
+            datetime.now(timezone.utc),
+            optional_notes is not None,
+            optional_notes.notes if optional_notes else None,
+        )
+
+        return VacancyOutput.model_validate(dict(row)) if row else None
+
+    async def bulk_edit_vacancy_status(
+        self, bulk_status_input: BulkStatusUpdateInput
+    ) -> List[UUID]:
+        sql, values = build_bulk_status_update(bulk_status_input)
+
+        rows = await self._fetch(connection_router.for_write(), sql, *values)
+
+        return [row["id"] for row in rows]
+
+    async def simulate_vacancy_costs(
+        self, costs_simulation_input: CostSimulationInput
+    ) -> CostSimulationOutput:
+        conn = connection_router.for_read()
+        multiplier = 12 if costs_simulation_input.period == "ANNUAL" else 1
+        breakdown = None
+
+        if costs_simulation_input.sector:
+            row = await self._fetchrow(
+                conn,
+                SECTOR_COST_SUMMARY_SQL,
+                costs_simulation_input.sector,
+                Status.in_progress.value,
+            )
+            vacancy_count = row["vacancy_count"] if row else 0
+            total = (row["salary_total"] if row else 0.0) * multiplier
+        else:
+            rows = await self._fetch(
+                conn, SECTORS_COST_SUMMARY_SQL, Status.in_progress.value
+            )
+            breakdown = [
+                SectorCostBreakdown(
+                    sector=row["sector_key"],
+                    vacancy_count=row["vacancy_count"],
+                    estimated_cost=row["salary_total"] * multiplier,
+                )
+                for row in rows
+            ]
+            vacancy_count = sum(item.vacancy_count for item in breakdown)
+            total = sum(item.estimated_cost for item in breakdown)
+
+        return build_cost_simulation(
+            costs_simulation_input, vacancy_count, total, breakdown
+        )
@@ -0,0 +1,163 @@
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Mapping
+from uuid import UUID
+
+from application.dto.pagination import Pagination, PaginationResponse
+from application.dto.simulation import CostSimulationInput, CostSimulationOutput
+from application.dto.vacancy import (
+    BulkStatusUpdateInput,
+    NotesInput,
+    StatusToUpdate,
+    VacancyInput,
+    VacancyOutput,
+)
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from infra.database.routing import read_from_primary
+from utils.cache_utils import TTLCache
+
+# Cached in place of evicted vacancies until they are read again. That read goes
+# to the primary, a replica still behind it would put the old row back.
+EVICTED = object()
+
+# Key of the marker left by a flush, every miss goes to the primary while it lasts.
+FLUSHED_KEY = "*"
+
+
+def evict_vacancies(cache: TTLCache, *vacancy_ids: str | UUID) -> None:
+    """
+    Drop the given vacancies from the cache, with and without include_archived.
+    """
+
+    for vacancy_id in vacancy_ids:
+        vacancy_id = str(vacancy_id).lower()
+        keys = ((vacancy_id, False), (vacancy_id, True))
+        cache.invalidate(*keys)
+
+        for key in keys:
+            cache.set(key, EVICTED)
+
+
+def flush_vacancies(cache: TTLCache) -> None:
+    """
+    Drop every vacancy from the cache, the changed ones being unknown.
+    """
+
+    cache.clear()
+    cache.set(FLUSHED_KEY, EVICTED)
+
+
+class CachedVacancyRepository(IVacancyRepository):
+    """
+    Decorator of a vacancy repository that keeps recently read vacancies in a TTLCache.
+    Only get_vacancy_by_id is served from the cache, every other call goes to
+    the wrapped repository. Writes through this repository drop the vacancies
+    they touch, writes from other processes are only seen once the entry expires
+    or the listener evicts it. Evicted vacancies are reloaded from the primary.
+    """
+
+    def __init__(self, repository: IVacancyRepository, cache: TTLCache):
+        """
+        :param repository: The repository whose reads are cached.
+        :param cache: Cache shared by every request of the process.
+        """
+
+        self.repository = repository
+        self.cache = cache
+
+    def invalidate(self, *vacancy_ids: str | UUID) -> None:
+        evict_vacancies(self.cache, *vacancy_ids)
+
+    async def get_vacancy_by_id(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> VacancyOutput | None:
+        key = (str(vacancy_id).lower(), include_archived)
+
+        vacancy = self.cache.get(key)
+        if vacancy is not None and vacancy is not EVICTED:
+            return vacancy
+
+        generation = self.cache.generation
+        changed = vacancy is EVICTED or self.cache.get(FLUSHED_KEY) is not None
+
+        with read_from_primary() if changed else nullcontext():
+            vacancy = await self.repository.get_vacancy_by_id(
+                vacancy_id, include_archived
+            )
+
+        # Missing IDs aren't cached, a vacancy created right after must be found.
+        if vacancy is not None:
+            self.cache.set(key, vacancy, generation)
+
+        return vacancy
+
+    async def get_vacancy_version(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> datetime | None:
+        return await self.repository.get_vacancy_version(vacancy_id, include_archived)
+
+    async def get_collection_version(self) -> int:
+        return await self.repository.get_collection_version()
+
+    async def create_vacancy(self, vacancy_data: VacancyInput) -> VacancyOutput:
+        return await self.repository.create_vacancy(vacancy_data)
+
+    async def bulk_create_vacancies(
+        self, vacancies_data: List[VacancyInput]
+    ) -> List[UUID]:
+        return await self.repository.bulk_create_vacancies(vacancies_data)
+
+    async def update_vacancy(
+        self, vacancy_id: str, vacancy_data: VacancyInput
+    ) -> VacancyOutput | None:
+        try:
+            return await self.repository.update_vacancy(vacancy_id, vacancy_data)
+        finally:
+            self.invalidate(vacancy_id)
+
+    async def delete_vacancy(self, vacancy_id: str) -> bool:
+        try:
+            return await self.repository.delete_vacancy(vacancy_id)
+        finally:
+            self.invalidate(vacancy_id)
+
+    async def list_vacancies(self, pagination: Pagination) -> PaginationResponse:
+        return await self.repository.list_vacancies(pagination)
+
+    def stream_vacancies(
+        self, search: str | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        return self.repository.stream_vacancies(search, chunk_size)
+
+    async def edit_vacancy_status(
+        self,
+        vacancy_id: str,
+        vacancy_status: StatusToUpdate,
+        optional_notes: NotesInput = None,
+    ) -> VacancyOutput | None:
+        try:
+            return await self.repository.edit_vacancy_status(
+                vacancy_id, vacancy_status, optional_notes
+            )
+        finally:
+            self.invalidate(vacancy_id)
+
+    async def bulk_edit_vacancy_status(
+        self, bulk_status_input: BulkStatusUpdateInput
+    ) -> List[UUID]:
+        updated_ids = await self.repository.bulk_edit_vacancy_status(bulk_status_input)
+        self.invalidate(*updated_ids)
+        return updated_ids
+
+    async def get_sector_summary_fingerprint(self, sector: str) -> tuple[int, int]:
+        return await self.repository.get_sector_summary_fingerprint(sector)
+
+    async def get_summary_of_vacancies_by_sector(
+        self, sector: str
+    ) -> List[VacancyOutput]:
+        return await self.repository.get_summary_of_vacancies_by_sector(sector)
+
+    async def simulate_vacancy_costs(
+        self, costs_simulation_input: CostSimulationInput
+    ) -> CostSimulationOutput:
+        return await self.repository.simulate_vacancy_costs(costs_simulation_input)
@@ -1,41 +1,473 @@
+import asyncio
+import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List
-from uuid import UUID
+from typing import Any, AsyncIterator, List, Mapping
+from uuid import UUID, uuid4
 
+from tortoise import BaseDBAsyncClient
 from tortoise.contrib.pydantic import pydantic_model_creator
-from tortoise.expressions import Q
+from tortoise.expressions import Q, RawSQL
+from tortoise.functions import Lower
 from tortoise.transactions import in_transaction
 
-from application.dto.pagination import Pagination, PaginationResponse
-from application.dto.simulation import CostSimulationInput, CostSimulationOutput
+from application.dto.pagination import Pagination, PaginationResponse, TotalMode
+from application.dto.simulation import (
+    CostSimulationInput,
+    CostSimulationOutput,
+    SectorCostBreakdown,
+)
 from application.dto.vacancy import (
+    BulkStatusUpdateInput,
     NotesInput,
     StatusToUpdate,
     VacancyInput,
     VacancyOutput,
 )
+from application.errors.pagination import InvalidPaginationCursor
 from domain.interfaces.vacancy_repository import IVacancyRepository
-from infra.database.pgdatabase import Status, Vacancy
+from infra.database.pgdatabase import Status, Vacancy, VacancyArchive
+from infra.database.routing import connection_router
+from utils.database_utils import escape_like
+from utils.date_utils import as_aware_datetime
+from utils.pagination_utils import decode_cursor, encode_cursor
 
 VacancyPydantic = pydantic_model_creator(Vacancy)
 
+VACANCY_FIELDS = tuple(VacancyOutput.model_fields)
+
+COPY_COLUMNS = (
+    "id",
+    "description",
+    "sector",
+    "manager",
+    "salary_expectation",
+    "urgency",
+    "status",
+    "start_date",
+    "end_date",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+
+VACANCY_COLUMNS = (
+    '"id", "description", "sector", "manager", "salary_expectation", "urgency", '
+    '"status", "start_date", "end_date", "notes", "created_at", "updated_at"'
+)
+
+# Writes run as a single statement: an empty RETURNING means the ID doesn't exist.
+UPDATE_VACANCY_SQL = (
+    'UPDATE "vacancy" SET "description" = $2, "sector" = $3, "manager" = $4, '
+    '"salary_expectation" = $5, "urgency" = $6, "status" = $7, "start_date" = $8, '
+    '"end_date" = $9, "notes" = $10, "updated_at" = $11 '
+    f'WHERE "id" = $1 RETURNING {VACANCY_COLUMNS};'
+)
+
+EDIT_VACANCY_STATUS_SQL = (
+    'UPDATE "vacancy" SET "status" = $2, "end_date" = $3, "updated_at" = $3, '
+    '"notes" = CASE WHEN $4::BOOLEAN THEN $5 ELSE "notes" END '
+    f'WHERE "id" = $1 RETURNING {VACANCY_COLUMNS};'
+)
+
+# $1 is the raw search term and $2 the same term escaped for ILIKE.
+SEARCH_CONDITION = (
+    "(\"search_vector\" @@ websearch_to_tsquery('simple', $1) "
+    'OR "description" ILIKE $2 OR "sector" ILIKE $2 '
+    'OR "manager" ILIKE $2 OR "notes" ILIKE $2)'
+)
+
+SEARCH_RANKING = (
+    "ts_rank(\"search_vector\", websearch_to_tsquery('simple', $1)) DESC, "
+    'greatest(similarity("description", $1), similarity("sector", $1), '
+    'similarity("manager", $1), similarity("notes", $1)) DESC, '
+    '"created_at", "id"'
+)
+
+EXPORT_VACANCIES_SQL = (
+    f'SELECT {VACANCY_COLUMNS} FROM "vacancy" ORDER BY "created_at", "id";'
+)
+
+EXPORT_SEARCH_SQL = (
+    f'SELECT {VACANCY_COLUMNS} FROM "vacancy" WHERE {SEARCH_CONDITION} '
+    'ORDER BY "created_at", "id";'
+)
+
+VACANCY_SOURCE = '"vacancy"'
+
+# Union of the hot table and vacancy_archive (migration 7).
+VACANCY_WITH_ARCHIVE_SOURCE = '"vacancy_with_archive"'
+
+# Bumped by a statement trigger on every write to vacancy (migration 8).
+VACANCY_GENERATION_SQL = 'SELECT "version" FROM "vacancy_generation" WHERE "id" = 1;'
+
+# Changes whenever any vacancy is written: the version is the vacancy_generation
+# bumped by the database itself (migration 8), never a timestamp set by the app.
+SECTOR_SUMMARY_FINGERPRINT_SQL = (
+    'SELECT count(*) AS "vacancy_count", '
+    '(SELECT "version" FROM "vacancy_generation" WHERE "id" = 1) AS "version" '
+    'FROM "vacancy" WHERE lower("sector") = lower($1);'
+)
+
+ESTIMATE_VACANCIES_SQL = (
+    'SELECT reltuples::bigint AS "estimate" FROM pg_class '
+    "WHERE oid = 'vacancy'::regclass;"
+)
+
+# sector_cost_summary is kept current by a trigger on vacancy (migration 5).
+SECTOR_COST_SUMMARY_SQL = (
+    'SELECT "vacancy_count", "salary_total"::DOUBLE PRECISION AS "salary_total" '
+    'FROM "sector_cost_summary" WHERE "sector_key" = lower($1) AND "status" = $2;'
+)
+
+SECTORS_COST_SUMMARY_SQL = (
+    'SELECT "sector_key", "vacancy_count", '
+    '"salary_total"::DOUBLE PRECISION AS "salary_total" '
+    'FROM "sector_cost_summary" WHERE "status" = $1 AND "vacancy_count" > 0 '
+    'ORDER BY "sector_key";'
+)
+
+
+def build_copy_records(vacancies_data: List[VacancyInput]) -> List[tuple]:
+    """
+    Build the COPY records of new vacancies, in COPY_COLUMNS order.
+
+    :param vacancies_data: Vacancies to be created.
+    :return: One tuple per vacancy, its generated ID first.
+    """
+
+    now = datetime.now(timezone.utc)
+
+    return [
+        (
+            uuid4(),
+            vacancy.description,
+            vacancy.sector,
+            vacancy.manager,
+            vacancy.salary_expectation,
+            int(vacancy.urgency),
+            vacancy.status.value,
+            as_aware_datetime(vacancy.start_date) or now,
+            as_aware_datetime(vacancy.end_date) or now,
+            vacancy.notes,
+            now,
+            now,
+        )
+        for vacancy in vacancies_data
+    ]
+
+
+def build_bulk_status_update(
+    bulk_status_input: BulkStatusUpdateInput,
+) -> tuple[str, list]:
+    """
+    Build the single UPDATE ... RETURNING statement of a bulk status update.
+
+    :param bulk_status_input: Target status and the ids or filters selecting vacancies.
+    :return: Tuple with the SQL and its positional values.
+    """
+
+    values = [
+        bulk_status_input.status.value,
+        datetime.now(timezone.utc),
+        bulk_status_input.notes,
+    ]
+
+    if bulk_status_input.ids is not None:
+        values.append(bulk_status_input.ids)
+        conditions = ['"id" = ANY($4::UUID[])']
+    else:
+        filters = bulk_status_input.filters
+        # A literal status lets the planner use the partial in progress index.
+        conditions = [f"\"status\" = '{Status.in_progress.value}'"]
+
+        if filters.sector is not None:
+            values.append(filters.sector)
+            conditions.append(f'lower("sector") = lower(${len(values)})')
+
+        if filters.manager is not None:
+            values.append(filters.manager)
+            conditions.append(f'"manager" = ${len(values)}')
+
+        if filters.urgency is not None:
+            values.append(int(filters.urgency))
+            conditions.append(f'"urgency" = ${len(values)}')
+
+    sql = (
+        'UPDATE "vacancy" SET "status" = $1, "end_date" = $2, "updated_at" = $2, '
+        '"notes" = COALESCE($3, "notes") '
+        f"WHERE {' AND '.join(conditions)} RETURNING \"id\";"
+    )
+
+    return sql, values
+
+
+@dataclass
+class ListingStatements:
+    """
+    Raw SQL of a listing page, shared by both repository implementations.
+    """
+
+    page_sql: str
+    page_values: list
+    count_sql: str
+    estimate_sql: str
+    filter_values: list
+    # Page rows carry a COUNT(*) OVER () total_count column.
+    window_total: bool
+    # Ordered by (created_at, id) with one extra row fetched to find the next page.
+    keyset: bool
+
+
+def build_listing_statements(pagination: Pagination) -> ListingStatements:
+    """
+    Build the statements of a listing page: searches are ordered by relevance
+    and paginated by page, other listings by (created_at, id) with page or cursor.
+    Raises InvalidPaginationCursor for a malformed cursor or a cursor with a search.
+
+    :param pagination: Pagination, search and total mode requested.
+    :return: The statements and their positional values.
+    """
+
+    source = (
+        VACANCY_WITH_ARCHIVE_SOURCE if pagination.include_archived else VACANCY_SOURCE
+    )
+    filter_condition, filter_values = "", []
+
+    if pagination.search:
+        if pagination.cursor:
+            raise InvalidPaginationCursor(
+                "Search results are ordered by relevance, use page instead of cursor."
+            )
+
+        search_term = str(pagination.search)
+        filter_condition = f" WHERE {SEARCH_CONDITION}"
+        filter_values = [search_term, f"%{escape_like(search_term)}%"]
+        ordering = SEARCH_RANKING
+        limit = pagination.page_size
+    else:
+        ordering = '"created_at", "id"'
+        limit = pagination.page_size + 1
+
+    if pagination.cursor:
+        page_condition = ' WHERE ("created_at", "id") > ($1, $2)'
+        page_values = list(decode_cursor(pagination.cursor))
+        offset = 0
+    else:
+        page_condition = filter_condition
+        page_values = list(filter_values)
+        offset = pagination.page * pagination.page_size
+
+    # The keyset condition would skew a window count, cursor pages count apart.
+    window_total = pagination.total_mode == TotalMode.exact and not pagination.cursor
+    total_column = ', COUNT(*) OVER () AS "total_count"' if window_total else ""
+
+    return ListingStatements(
+        page_sql=(
+            f"SELECT {VACANCY_COLUMNS}{total_column} FROM {source}{page_condition} "
+            f"ORDER BY {ordering} "
+            f"LIMIT ${len(page_values) + 1} OFFSET ${len(page_values) + 2};"
+        ),
+        page_values=[*page_values, limit, offset],
+        count_sql=f'SELECT COUNT(*) AS "total" FROM {source}{filter_condition};',
+        estimate_sql=f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {source}{filter_condition};",
+        filter_values=filter_values,
+        window_total=window_total,
+        keyset=not pagination.search,
+    )
+
+
+def pop_window_total(rows: List[dict]) -> int | None:
+    """
+    Remove the COUNT(*) OVER () column from the rows of a page.
+
+    :param rows: Page rows, mutated in place.
+    :return: The total, or None when the page is empty and can't carry it.
+    """
+
+    if not rows:
+        return None
+
+    total = rows[0]["total_count"]
+
+    for row in rows:
+        del row["total_count"]
+
+    return total
+
+
+def plan_rows(query_plan: Any) -> int:
+    """
+    Read the estimated amount of rows from an EXPLAIN (FORMAT JSON) result.
+    """
+
+    if isinstance(query_plan, str):
+        query_plan = json.loads(query_plan)
+
+    return int(query_plan[0]["Plan"]["Plan Rows"])
+
+
+def build_listing_page(
+    pagination: Pagination,
+    statements: ListingStatements,
+    rows: List[Mapping[str, Any]],
+    total: int | None,
+) -> PaginationResponse:
+    """
+    Build the listing response from the rows fetched with build_listing_statements.
+
+    :param pagination: Pagination, search and total mode requested.
+    :param statements: The statements the rows were fetched with.
+    :param rows: Page rows, without the window total column.
+    :param total: Total computed according to the total mode.
+    :return: The listing response, with next_cursor for keyset listings.
+    """
+
+    next_cursor = None
+
+    if statements.keyset:
+        if len(rows) > pagination.page_size:
+            rows = rows[: pagination.page_size]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    return PaginationResponse(
+        data=[VacancyOutput.model_validate(row) for row in rows],
+        total=total,
+        total_mode=pagination.total_mode,
+        next_cursor=next_cursor,
+    )
+
+
+async def stream_vacancy_rows(
+    conn: BaseDBAsyncClient, search: str | None, chunk_size: int
+) -> AsyncIterator[List[Mapping[str, Any]]]:
+    """
+    Read vacancies through a server-side cursor, holding one chunk in memory at a time.
+
+    :param conn: Connection whose pool lends the asyncpg connection for the export.
+    :param search: Same search term as the listing, or None for every vacancy.
+    :param chunk_size: Amount of rows fetched per round trip.
+    :return: Async iterator over lists of at most chunk_size rows.
+    """
+
+    if search:
+        sql, values = EXPORT_SEARCH_SQL, [search, f"%{escape_like(search)}%"]
+    else:
+        sql, values = EXPORT_VACANCIES_SQL, []
+
+    async with conn.acquire_connection() as connection:
+        # Server-side cursors only live inside a transaction.
+        async with connection.transaction(readonly=True):
+            cursor = await connection.cursor(sql, *values)
+
+            while rows := await cursor.fetch(chunk_size):
+                yield rows
+
+
+def build_cost_simulation(
+    costs_simulation_input: CostSimulationInput,
+    vacancy_count: int,
+    total: float,
+    breakdown: List[SectorCostBreakdown] | None = None,
+) -> CostSimulationOutput:
+    """
+    Build the cost simulation output, with its message, from the summed totals.
+
+    :param costs_simulation_input: The simulation period and optional sector.
+    :param vacancy_count: Amount of in progress vacancies considered.
+    :param total: Estimated cost for the period.
+    :param breakdown: Per sector totals, when simulating all sectors.
+    :return: The cost simulation output.
+    """
+
+    if not vacancy_count:
+        return CostSimulationOutput(
+            period=costs_simulation_input.period,
+            sector=costs_simulation_input.sector,
+            estimated_cost=0.0,
+            message="Não existem vagas em andamento para o filtro selecionado.",
+            breakdown=breakdown,
+        )
+
+    return CostSimulationOutput(
+        period=costs_simulation_input.period,
+        sector=costs_simulation_input.sector,
+        estimated_cost=total,
+        vacancy_count=vacancy_count,
+        breakdown=breakdown,
+        message=f"Custo total estimado ({costs_simulation_input.period.title()})"
+        + (
+            f" para o setor '{costs_simulation_input.sector}'"
+            if costs_simulation_input.sector
+            else ""
+        )
+        + f": R$ {total:,.2f}".replace(",", "X").replace(".", ",").replace("X", "."),
+    )
+
 
 class VacancyRepository(IVacancyRepository):
     """
     Repository for managing vacancies in the database.
     """
 
-    async def get_vacancy_by_id(self, vacancy_id: str) -> VacancyOutput | None:
-        found_vacancy = await Vacancy.get_or_none(id=UUID(vacancy_id))
+    async def get_vacancy_by_id(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> VacancyOutput | None:
+        conn = connection_router.for_read()
 
-        if found_vacancy:
-            found_vacancy_in_database = await VacancyPydantic.from_tortoise_orm(
-                found_vacancy
+        found_vacancy = (
+            await Vacancy.filter(id=UUID(vacancy_id))
+            .using_db(conn)
+            .first()
+            .values(*VACANCY_FIELDS)
+        )
+
+        # The archive is only looked up on a miss, the hot path stays one query.
+        if not found_vacancy and include_archived:
+            found_vacancy = (
+                await VacancyArchive.filter(id=UUID(vacancy_id))
+                .using_db(conn)
+                .first()
+                .values(*VACANCY_FIELDS)
             )
-            return VacancyOutput(**found_vacancy_in_database.model_dump())
+
+        if found_vacancy:
+            return VacancyOutput.model_validate(found_vacancy)
 
         return None
 
+    async def get_vacancy_version(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> datetime | None:
+        conn = connection_router.for_read()
+
+        version = (
+            await Vacancy.filter(id=UUID(vacancy_id))
+            .using_db(conn)
+            .first()
+            .values_list("updated_at", flat=True)
+        )
+
+        if version is None and include_archived:
+            version = (
+                await VacancyArchive.filter(id=UUID(vacancy_id))
+                .using_db(conn)
+                .first()
+                .values_list("updated_at", flat=True)
+            )
+
+        return version
+
+    async def get_collection_version(self) -> int:
+        conn = connection_router.for_read()
+        rows = await conn.execute_query_dict(VACANCY_GENERATION_SQL)
+        return rows[0]["version"] if rows else 0
+
+    async def get_sector_summary_fingerprint(self, sector: str) -> tuple[int, int]:
+        conn = connection_router.for_read()
+        rows = await conn.execute_query_dict(SECTOR_SUMMARY_FINGERPRINT_SQL, [sector])
+        return rows[0]["vacancy_count"], rows[0]["version"] or 0
+
     async def get_summary_of_vacancies_by_sector(
         self, sector: str
     ) -> List[VacancyOutput]:
@@ -43,16 +475,16 @@ class VacancyRepository(IVacancyRepository):
         if not sector:
             return []
 
-        query = Vacancy.filter(sector__iexact=sector)
-
-        vacancies = await query.all()
+        # lower("sector") matches the expression index idx_vacancy_sector_lower.
+        query = (
+            Vacancy.annotate(sector_key=Lower("sector"))
+            .filter(sector_key=sector.lower())
+            .using_db(connection_router.for_read())
+        )
 
-        list_response = [
-            VacancyOutput(**(await VacancyPydantic.from_tortoise_orm(v)).model_dump())
-            for v in vacancies
-        ]
+        vacancies = await query.values(*VACANCY_FIELDS)
 
-        return list_response
+        return [VacancyOutput.model_validate(v) for v in vacancies]
 
     async def create_vacancy(self, vacancy_data: VacancyInput) -> VacancyOutput:
         vacancy_data_as_dict = vacancy_data.model_dump()
@@ -66,80 +498,191 @@ class VacancyRepository(IVacancyRepository):
         if not end_date:
             vacancy_data_as_dict["end_date"] = datetime.now(timezone.utc)
 
-        async with in_transaction():
+        async with in_transaction(connection_router.write_connection_name()):
             created_vacancy = await Vacancy.create(**vacancy_data_as_dict)
             created_vacancy = await VacancyPydantic.from_tortoise_orm(created_vacancy)
             return VacancyOutput(**created_vacancy.model_dump())
 
+    async def bulk_create_vacancies(
+        self, vacancies_data: List[VacancyInput]
+    ) -> List[UUID]:
+        records = build_copy_records(vacancies_data)
+
+        conn = connection_router.for_write()
+
+        # COPY runs as a single statement, so a batch is written all or nothing.
+        async with conn.acquire_connection() as connection:
+            await connection.copy_records_to_table(
+                "vacancy", records=records, columns=COPY_COLUMNS
+            )
+
+        return [record[0] for record in records]
+
     async def update_vacancy(
         self, vacancy_id: str, vacancy_data: VacancyInput
     ) -> VacancyOutput | None:
-        found_vacancy = await Vacancy.get_or_none(id=UUID(vacancy_id))
-
-        if found_vacancy:
-            try:
-                async with in_transaction():
-                    found_vacancy.description = vacancy_data.description
-                    found_vacancy.sector = vacancy_data.sector
-                    found_vacancy.manager = vacancy_data.manager
-                    found_vacancy.salary_expectation = vacancy_data.salary_expectation
-                    found_vacancy.urgency = vacancy_data.urgency
-                    found_vacancy.status = vacancy_data.status
-                    found_vacancy.start_date = vacancy_data.start_date
-                    found_vacancy.end_date = vacancy_data.end_date
-                    found_vacancy.notes = vacancy_data.notes
-                    found_vacancy.updated_at = datetime.now(timezone.utc)
-
-                    await found_vacancy.save()
-
-                    updated_vacancy = await VacancyPydantic.from_tortoise_orm(
-                        found_vacancy
-                    )
-                    return VacancyOutput(**updated_vacancy.model_dump())
-
-            except Exception as e:
-                print(e)
-                return None
+        conn = connection_router.for_write()
+
+        rows = await conn.execute_query_dict(
+            UPDATE_VACANCY_SQL,
+            [
+                UUID(vacancy_id),
+                vacancy_data.description,
+                vacancy_data.sector,
+                vacancy_data.manager,
+                vacancy_data.salary_expectation,
+                int(vacancy_data.urgency),
+                vacancy_data.status.value,
+                as_aware_datetime(vacancy_data.start_date),
+                as_aware_datetime(vacancy_data.end_date),
+                vacancy_data.notes,
+                datetime.now(timezone.utc),
+            ],
+        )
 
-        return None
+        return VacancyOutput.model_validate(rows[0]) if rows else None
 
     async def delete_vacancy(self, vacancy_id: str) -> bool:
-        found_vacancy = await Vacancy.get_or_none(id=UUID(vacancy_id))
+        conn = connection_router.for_write()
 
-        if not found_vacancy:
-            return False
+        deleted_rows, _ = await conn.execute_query(
+            'DELETE FROM "vacancy" WHERE "id" = $1;', [UUID(vacancy_id)]
+        )
 
-        try:
-            async with in_transaction():
-                await found_vacancy.delete()
-                return True
-        except Exception as e:
-            print(e)
-            return False
+        return deleted_rows > 0
 
     async def list_vacancies(self, pagination: Pagination) -> PaginationResponse:
-        query = Q()
+        if pagination.search or pagination.include_archived:
+            return await self._list_vacancies_sql(pagination)
 
-        if pagination.search:
-            query |= Q(description__icontains=pagination.search)
-            query |= Q(sector__icontains=pagination.search)
-            query |= Q(manager__icontains=pagination.search)
-            query |= Q(notes__icontains=pagination.search)
+        conn = connection_router.for_read()
+        page_query = Vacancy.all().using_db(conn).order_by("created_at", "id")
 
-        offset = pagination.page * pagination.page_size
+        if pagination.cursor:
+            last_created_at, last_id = decode_cursor(pagination.cursor)
+            page_query = page_query.filter(
+                Q(created_at__gt=last_created_at)
+                | Q(created_at=last_created_at, id__gt=last_id)
+            )
+        else:
+            page_query = page_query.offset(pagination.page * pagination.page_size)
+
+        # One extra row tells whether there is a next page without another query.
+        page_query = page_query.limit(pagination.page_size + 1)
+
+        total = None
+
+        if pagination.total_mode == TotalMode.estimated:
+            vacancies, total = await asyncio.gather(
+                page_query.values(*VACANCY_FIELDS), self._estimate_total(conn)
+            )
+        elif pagination.total_mode == TotalMode.exact and pagination.cursor:
+            # The keyset filter would skew a window count, so count concurrently.
+            vacancies, total = await asyncio.gather(
+                page_query.values(*VACANCY_FIELDS),
+                Vacancy.all().using_db(conn).count(),
+            )
+        elif pagination.total_mode == TotalMode.exact:
+            vacancies = await page_query.annotate(
+                total_count=RawSQL("COUNT(*) OVER ()")
+            ).values(*VACANCY_FIELDS, "total_count")
+            if vacancies:
+                total = vacancies[0]["total_count"]
+            elif pagination.page == 0:
+                total = 0
+            else:
+                total = await Vacancy.all().using_db(conn).count()
+        else:
+            vacancies = await page_query.values(*VACANCY_FIELDS)
+
+        has_next_page = len(vacancies) > pagination.page_size
+        vacancies = vacancies[: pagination.page_size]
+
+        list_response = [VacancyOutput.model_validate(v) for v in vacancies]
+
+        next_cursor = (
+            encode_cursor(vacancies[-1]["created_at"], vacancies[-1]["id"])
+            if has_next_page
+            else None
+        )
+
+        return PaginationResponse(
+            data=list_response,
+            total=total,
+            total_mode=pagination.total_mode,
+            next_cursor=next_cursor,
+        )
+
+    async def _list_vacancies_sql(self, pagination: Pagination) -> PaginationResponse:
+        """
+        List vacancies with raw SQL, for searches ordered by relevance
+        and for listings that include the archive.
+        """
+
+        statements = build_listing_statements(pagination)
+        conn = connection_router.for_read()
 
-        vacancies = (
-            await Vacancy.filter(query).offset(offset).limit(pagination.page_size)
+        page = conn.execute_query_dict(statements.page_sql, statements.page_values)
+        total = None
+
+        if pagination.total_mode == TotalMode.estimated:
+            rows, total = await asyncio.gather(
+                page, self._estimate_total(conn, statements)
+            )
+        elif pagination.total_mode == TotalMode.exact and not statements.window_total:
+            rows, total = await asyncio.gather(page, self._count(conn, statements))
+        else:
+            rows = await page
+
+        if statements.window_total:
+            total = pop_window_total(rows)
+            if total is None:
+                total = (
+                    0 if pagination.page == 0 else await self._count(conn, statements)
+                )
+
+        return build_listing_page(pagination, statements, rows, total)
+
+    async def _count(
+        self, conn: BaseDBAsyncClient, statements: ListingStatements
+    ) -> int:
+        """
+        Count every vacancy matching the filter of a listing.
+        """
+
+        rows = await conn.execute_query_dict(
+            statements.count_sql, statements.filter_values
         )
+        return rows[0]["total"]
 
-        total = await Vacancy.filter(query).count()
+    async def _estimate_total(
+        self,
+        conn: BaseDBAsyncClient,
+        statements: ListingStatements | None = None,
+    ) -> int:
+        """
+        Estimate the number of vacancies of a listing from planner statistics.
+        Falls back to an exact count when the table was never analyzed.
+        """
+
+        if statements:
+            plan = await conn.execute_query_dict(
+                statements.estimate_sql, statements.filter_values
+            )
+            return plan_rows(plan[0]["QUERY PLAN"])
+
+        result = await conn.execute_query_dict(ESTIMATE_VACANCIES_SQL)
+        estimate = result[0]["estimate"] if result else -1
 
-        list_response = [
-            VacancyOutput(**(await VacancyPydantic.from_tortoise_orm(v)).model_dump())
-            for v in vacancies
-        ]
+        if estimate < 0:
+            return await Vacancy.all().using_db(conn).count()
 
-        return PaginationResponse(data=list_response, total=total)
+        return estimate
+
+    def stream_vacancies(
+        self, search: str | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        return stream_vacancy_rows(connection_router.for_read(), search, chunk_size)
 
     async def edit_vacancy_status(
         self,
@@ -147,63 +690,60 @@ class VacancyRepository(IVacancyRepository):
         vacancy_status: StatusToUpdate,
         optional_notes: NotesInput = None,
     ) -> VacancyOutput | None:
-        found_vacancy = await Vacancy.get_or_none(id=UUID(vacancy_id))
-
-        if not found_vacancy:
-            return None
-
-        try:
-            async with in_transaction():
-                found_vacancy.status = vacancy_status.value
-                found_vacancy.end_date = datetime.now(timezone.utc)
-                found_vacancy.updated_at = datetime.now(timezone.utc)
+        conn = connection_router.for_write()
+
+        rows = await conn.execute_query_dict(
+            EDIT_VACANCY_STATUS_SQL,
+            [
+                UUID(vacancy_id),
+                vacancy_status.value,
+                datetime.now(timezone.utc),
+                optional_notes is not None,
+                optional_notes.notes if optional_notes else None,
+            ],
+        )
 
-                if optional_notes:
-                    found_vacancy.notes = optional_notes.notes
+        return VacancyOutput.model_validate(rows[0]) if rows else None
 
-                await found_vacancy.save()
+    async def bulk_edit_vacancy_status(
+        self, bulk_status_input: BulkStatusUpdateInput
+    ) -> List[UUID]:
+        sql, values = build_bulk_status_update(bulk_status_input)
 
-                updated_vacancy = await VacancyPydantic.from_tortoise_orm(found_vacancy)
-                return VacancyOutput(**updated_vacancy.model_dump())
+        conn = connection_router.for_write()
+        rows = await conn.execute_query_dict(sql, values)
 
-        except Exception as e:
-            print(e)
-            return None
+        return [row["id"] for row in rows]
 
     async def simulate_vacancy_costs(
         self, costs_simulation_input: CostSimulationInput
     ) -> CostSimulationOutput:
-        query = Vacancy.filter(status=Status.in_progress)
+        conn = connection_router.for_read()
+        multiplier = 12 if costs_simulation_input.period == "ANNUAL" else 1
+        breakdown = None
 
         if costs_simulation_input.sector:
-            query = query.filter(sector__iexact=costs_simulation_input.sector)
-
-        vacancies = await query.all()
-
-        if not vacancies:
-            return CostSimulationOutput(
-                period=costs_simulation_input.period,
-                sector=costs_simulation_input.sector,
-                estimated_cost=0.0,
-                message="Não existem vagas em andamento para o filtro selecionado.",
+            totals = await conn.execute_query_dict(
+                SECTOR_COST_SUMMARY_SQL,
+                [costs_simulation_input.sector, Status.in_progress.value],
             )
-
-        total = sum(v.salary_expectation for v in vacancies)
-
-        if costs_simulation_input.period == "ANNUAL":
-            total *= 12
-
-        return CostSimulationOutput(
-            period=costs_simulation_input.period,
-            sector=costs_simulation_input.sector,
-            estimated_cost=total,
-            message=f"Custo total estimado ({costs_simulation_input.period.title()})"
-            + (
-                f" para o setor '{costs_simulation_input.sector}'"
-                if costs_simulation_input.sector
-                else ""
+            vacancy_count = totals[0]["vacancy_count"] if totals else 0
+            total = (totals[0]["salary_total"] if totals else 0.0) * multiplier
+        else:
+            sector_totals = await conn.execute_query_dict(
+                SECTORS_COST_SUMMARY_SQL, [Status.in_progress.value]
             )
-            + f": R$ {total:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", "."),
+            breakdown = [
+                SectorCostBreakdown(
+                    sector=row["sector_key"],
+                    vacancy_count=row["vacancy_count"],
+                    estimated_cost=row["salary_total"] * multiplier,
+                )
+                for row in sector_totals
+            ]
+            vacancy_count = sum(row.vacancy_count for row in breakdown)
+            total = sum(row.estimated_cost for row in breakdown)
+
+        return build_cost_simulation(
+            costs_simulation_input, vacancy_count, total, breakdown
         )
@@ -1,3 +1,5 @@
+from typing import Dict, Optional
+
 from pydantic import BaseModel
 
 
@@ -21,6 +23,24 @@ class Dependency(BaseModel):
     database: DatabaseStatus
 
 
+class CacheStatus(BaseModel):
+    """
+    Represents the size and counters of an in-process cache.
+    """
+
+    size: int
+    max_size: int
+    ttl_seconds: float
+    bytes: int
+    max_bytes: Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+
 class HealthStatusOutput(BaseModel):
     """
     Health status of the application.
@@ -28,3 +48,4 @@ class HealthStatusOutput(BaseModel):
 
     dependencies: Dependency
     updated_at: str
+    caches: Dict[str, CacheStatus] = {}
@@ -1,11 +1,25 @@
-from pydantic import BaseModel
+from typing import AsyncIterator
+
+from pydantic import BaseModel, ConfigDict
 
 
 class MediaPdfOutput(BaseModel):
     """
-    Output schema for a PDF media file.
+    Output schema for a PDF media file rendered in memory.
     """
 
-    path: str
+    content: bytes
     media_type: str
     file_name: str
+
+
+class MediaStreamOutput(BaseModel):
+    """
+    Output schema for a media file streamed in chunks.
+    """
+
+    content: AsyncIterator[bytes]
+    media_type: str
+    file_name: str
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
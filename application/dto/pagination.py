@@ -1,10 +1,21 @@
 from datetime import datetime
-from typing import Any, List
+from enum import StrEnum
+from typing import Any, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class TotalMode(StrEnum):
+    """
+    Enumeration for how the total of a listing is computed.
+    """
+
+    exact = "exact"
+    estimated = "estimated"
+    none = "none"
+
+
 class Pagination(BaseModel):
     """
     Pagination model representing the pagination in the application.
@@ -13,6 +24,18 @@ class Pagination(BaseModel):
     page: int = Field(ge=0, default=0)
     page_size: int = Field(ge=5, le=100, default=10)
     search: Any = Field(None)
+    cursor: Optional[str] = Field(
+        None,
+        description="Keyset cursor (next_cursor of a previous page). Overrides page.",
+    )
+    total_mode: TotalMode = Field(
+        TotalMode.exact,
+        description="exact counts every match, estimated uses planner statistics, none skips the total.",
+    )
+    include_archived: bool = Field(
+        False,
+        description="Also list finished and canceled vacancies moved to the archive.",
+    )
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -26,7 +49,11 @@ class PaginationResponse(BaseModel):
     """
 
     data: List[Any]
-    total: int
+    total: Optional[int] = Field(None, description="None when total_mode is none")
+    total_mode: TotalMode = Field(TotalMode.exact)
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, None when it is the last page"
+    )
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
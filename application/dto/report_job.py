@@ -0,0 +1,33 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReportJobStatus(StrEnum):
+    """
+    Enumeration for the lifecycle of a report job.
+    """
+
+    queued = "QUEUED"
+    running = "RUNNING"
+    done = "DONE"
+    failed = "FAILED"
+
+
+class ReportJobOutput(BaseModel):
+    """
+    Output schema for a sector summary report job.
+    """
+
+    id: str
+    sector: str
+    status: ReportJobStatus
+    progress: float = Field(description="From 0 to 1")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = Field(
+        None, description="Where to download the report once the job is done"
+    )
@@ -1,5 +1,5 @@
 from enum import StrEnum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -27,10 +27,24 @@ class CostSimulationInput(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class SectorCostBreakdown(BaseModel):
+    """
+    Estimated cost of the in progress vacancies of a single sector.
+    """
+
+    sector: str = Field(..., description="Sector name, normalized to lowercase")
+    vacancy_count: int = Field(..., description="Amount of in progress vacancies")
+    estimated_cost: float = Field(..., description="Estimated cost for the sector")
+
+
 class CostSimulationOutput(CostSimulationInput):
     """
     Output model for cost simulation results.
     """
 
     estimated_cost: float = Field(..., description="Estimated cost for the simulation")
+    vacancy_count: int = Field(0, description="Amount of in progress vacancies")
     message: str = Field(..., description="Message regarding the simulation result")
+    breakdown: Optional[List[SectorCostBreakdown]] = Field(
+        None, description="Per sector costs, only when no sector is selected"
+    )
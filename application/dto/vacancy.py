@@ -1,9 +1,9 @@
 from datetime import datetime
 from enum import StrEnum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from infra.database.pgdatabase import Status, Urgency
 
@@ -27,6 +27,61 @@ class StatusToUpdate(StrEnum):
     canceled = "CANCELED"
 
 
+class BulkStatusFilter(BaseModel):
+    """
+    Criteria selecting the in progress vacancies of a bulk status update.
+    """
+
+    sector: Optional[str] = Field(None, description="Sector, case insensitive")
+    manager: Optional[str] = Field(None, description="Manager responsible")
+    urgency: Optional[Urgency] = Field(None, description="Urgency level")
+
+    @model_validator(mode="after")
+    def check_has_criteria(self) -> "BulkStatusFilter":
+        if self.sector is None and self.manager is None and self.urgency is None:
+            raise ValueError("At least one of sector, manager or urgency is required.")
+        return self
+
+
+class BulkStatusUpdateInput(BaseModel):
+    """
+    Input schema for updating the status of many vacancies at once.
+    """
+
+    status: StatusToUpdate = Field(..., description="New status of the vacancies")
+    ids: Optional[List[UUID]] = Field(
+        None, max_length=10_000, description="IDs of the vacancies to update"
+    )
+    filters: Optional[BulkStatusFilter] = Field(
+        None,
+        description="Criteria matching in progress vacancies only, instead of ids",
+    )
+    notes: Optional[str] = Field(
+        None, description="Notes replacing the current ones, kept when null or blank"
+    )
+
+    @field_validator("notes")
+    @classmethod
+    def blank_notes_keep_current(cls, notes: Optional[str]) -> Optional[str]:
+        # The update keeps the current notes only for NULL, see COALESCE($3, "notes").
+        return notes if notes and notes.strip() else None
+
+    @model_validator(mode="after")
+    def check_has_single_selector(self) -> "BulkStatusUpdateInput":
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Exactly one of ids or filters must be given.")
+        return self
+
+
+class BulkStatusUpdateOutput(BaseModel):
+    """
+    Output schema for a bulk status update.
+    """
+
+    updated: List[UUID] = Field(..., description="IDs of the updated vacancies")
+    missing: List[UUID] = Field(..., description="Requested IDs that were not found")
+
+
 class VacancyInput(BaseModel):
     """
     Input schema for creating or updating a vacancy.
@@ -65,3 +120,43 @@ class VacancyOutput(VacancyInput):
             UUID: lambda v: str(v),
         },
     )
+
+
+class ExportFormat(StrEnum):
+    """
+    Enumeration for the file formats of a vacancy export.
+    """
+
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class BulkItemStatus(StrEnum):
+    """
+    Enumeration for the outcome of an item of a bulk operation.
+    """
+
+    created = "CREATED"
+    failed = "FAILED"
+
+
+class BulkCreateItemResult(BaseModel):
+    """
+    Result of a single item of a bulk vacancy creation.
+    """
+
+    index: int = Field(..., description="Position of the item in the request")
+    status: BulkItemStatus = Field(..., description="Outcome of the item")
+    id: Optional[UUID] = Field(None, description="ID of the created vacancy")
+    error: Optional[str] = Field(None, description="Reason the item was rejected")
+
+
+class BulkCreateOutput(BaseModel):
+    """
+    Output schema for a bulk vacancy creation.
+    """
+
+    total: int
+    created: int
+    failed: int
+    results: List[BulkCreateItemResult]
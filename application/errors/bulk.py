@@ -0,0 +1,7 @@
+class InvalidBulkPayload(ValueError):
+    """
+    Custom error for bulk request bodies or items that cannot be decoded.
+    """
+
+    def __init__(self, message: str = "Invalid bulk payload."):
+        super().__init__(message)
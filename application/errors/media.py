@@ -5,3 +5,23 @@ class NotFoundPdfMediaToGenerate(ValueError):
 
     def __init__(self, message: str = "No PDF media found to generate."):
         super().__init__(message)
+
+
+class RenderQueueFull(RuntimeError):
+    """
+    Custom error for when every PDF render worker is busy and the queue is full.
+    """
+
+    def __init__(
+        self, message: str = "Too many reports being generated, try again later."
+    ):
+        super().__init__(message)
+
+
+class ReportJobNotReady(RuntimeError):
+    """
+    Custom error for downloading the report of a job that is not done.
+    """
+
+    def __init__(self, message: str = "Report job is not done yet."):
+        super().__init__(message)
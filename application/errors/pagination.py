@@ -0,0 +1,7 @@
+class InvalidPaginationCursor(ValueError):
+    """
+    Custom error for malformed or tampered pagination cursors.
+    """
+
+    def __init__(self, message: str = "Invalid pagination cursor."):
+        super().__init__(message)
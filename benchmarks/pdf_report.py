@@ -0,0 +1,65 @@
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from adapters.libs.reportlab_adapter import ReportLabAdapter
+from application.dto.vacancy import VacancyOutput
+from infra.database.pgdatabase import Status, Urgency
+
+ROW_COUNTS = [100, 10_000, 100_000]
+
+# platypus lays out the whole table at once, past this it takes minutes.
+PLATYPUS_MAX_ROWS = 10_000
+
+RENDERERS = {
+    "platypus": ReportLabAdapter(large_report_rows=10**9),
+    "canvas": ReportLabAdapter(large_report_rows=0),
+}
+
+
+def generate_vacancies(amount: int) -> list[VacancyOutput]:
+    now = datetime.now(timezone.utc)
+
+    return [
+        VacancyOutput(
+            id=uuid4(),
+            description=f"Benchmark vacancy {index}",
+            sector="IT",
+            manager=f"Manager {index % 50}",
+            salary_expectation=1_000 + index % 19_000,
+            urgency=Urgency.medium,
+            status=Status.in_progress,
+            start_date=now,
+            end_date=None,
+            notes="Benchmark row",
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(amount)
+    ]
+
+
+def main():
+    print("🟢 Sector summary PDF rendering\n")
+
+    for row_count in ROW_COUNTS:
+        vacancies = generate_vacancies(row_count)
+
+        for name, adapter in RENDERERS.items():
+            if name == "platypus" and row_count > PLATYPUS_MAX_ROWS:
+                print(f"{row_count:>9,} rows   {name:<9} skipped")
+                continue
+
+            start = time.perf_counter()
+            content = adapter.generate_pdf(vacancies)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{row_count:>9,} rows   {name:<9} {elapsed * 1000:>10.1f} ms"
+                f"   {len(content) / 1024:>9,.0f} KiB"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import random
+import time
+from datetime import datetime, timezone
+
+from pydantic import BaseModel
+
+from application.dto.vacancy import VacancyInput
+from infra.database.pgdatabase import Status, Urgency
+from utils.database_utils import is_sql_statement, validate_no_sql_commands
+
+VACANCY_COUNT = 10_000
+
+SECTORS = ["IT", "Finance", "Marketing", "Operations", "Legal", "HR"]
+WORDS = [
+    "backend",
+    "frontend",
+    "developer",
+    "analyst",
+    "senior",
+    "junior",
+    "python",
+    "postgresql",
+    "alternative",
+    "selection",
+    "updated",
+    "remote",
+    "hybrid",
+    "team",
+]
+
+
+def parse_every_field(input_data: BaseModel):
+    """
+    The screening before the keyword prescreen: a full parse of every string field.
+    """
+
+    for value in input_data.model_dump().values():
+        if isinstance(value, str) and is_sql_statement(value):
+            raise ValueError("Forbidden SQL pattern.")
+
+
+def generate_inputs(amount: int) -> list[VacancyInput]:
+    generator = random.Random(2026)
+    now = datetime.now(timezone.utc)
+
+    return [
+        VacancyInput(
+            description=" ".join(generator.choices(WORDS, k=8)).capitalize(),
+            sector=generator.choice(SECTORS),
+            manager=f"Manager {index % 50}",
+            salary_expectation=1_000 + index % 19_000,
+            urgency=Urgency.medium,
+            status=Status.in_progress,
+            start_date=now,
+            notes=" ".join(generator.choices(WORDS, k=4)),
+        )
+        for index in range(amount)
+    ]
+
+
+def measure(name: str, validate, inputs: list[VacancyInput]) -> float:
+    start = time.perf_counter()
+    for vacancy_input in inputs:
+        validate(vacancy_input)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{name:<22} {elapsed * 1000:>9.1f} ms"
+        f"   {elapsed / len(inputs) * 1_000_000:>7.1f} µs/vacancy"
+    )
+    return elapsed
+
+
+def main():
+    print(f"🟢 SQL injection screening of {VACANCY_COUNT:,} vacancy inputs\n")
+
+    inputs = generate_inputs(VACANCY_COUNT)
+
+    baseline = measure("full parse", parse_every_field, inputs)
+    cold = measure("prescreen (cold)", validate_no_sql_commands, inputs)
+    warm = measure("prescreen (warm)", validate_no_sql_commands, inputs)
+
+    print(f"\nSpeedup: {baseline / cold:.1f}x cold, {baseline / warm:.1f}x warm")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+from tortoise import Tortoise
+
+from adapters.repositories.asyncpg_vacancy_repository import AsyncpgVacancyRepository
+from adapters.repositories.vacancy_repository import VacancyRepository
+from application.dto.pagination import Pagination, TotalMode
+from application.dto.vacancy import VacancyInput
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from infra.database.pgdatabase import TORTOISE_ORM, Status, Urgency, Vacancy
+
+SEED_ROWS = 5_000
+REQUESTS = 2_000
+CONCURRENCY = 8
+
+REPOSITORIES = {
+    "tortoise": VacancyRepository,
+    "asyncpg": AsyncpgVacancyRepository,
+}
+
+
+def generate_inputs(amount: int) -> list[VacancyInput]:
+    now = datetime.now(timezone.utc)
+
+    return [
+        VacancyInput(
+            description=f"Benchmark vacancy {index}",
+            sector=random.choice(["IT", "RH", "Finance", "Legal"]),
+            manager=f"Manager {index % 50}",
+            salary_expectation=random.uniform(1_000, 20_000),
+            urgency=random.choice(list(Urgency)),
+            status=Status.in_progress,
+            start_date=now,
+            notes="Benchmark row",
+        )
+        for index in range(amount)
+    ]
+
+
+def operations(repository: IVacancyRepository, vacancy_ids: list[str]) -> dict:
+    """The repository calls behind the hottest endpoints."""
+
+    return {
+        "get by id": lambda: repository.get_vacancy_by_id(random.choice(vacancy_ids)),
+        "list page": lambda: repository.list_vacancies(
+            Pagination(page=random.randint(0, 20), page_size=20)
+        ),
+        "list page no total": lambda: repository.list_vacancies(
+            Pagination(page=random.randint(0, 20), total_mode=TotalMode.none)
+        ),
+    }
+
+
+async def measure(name: str, operation) -> None:
+    latencies = []
+    pending = iter(range(REQUESTS))
+
+    async def worker():
+        for _ in pending:
+            start = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100)
+
+    print(
+        f"{name:<32} p50 {percentiles[49] * 1000:>7.2f} ms"
+        f"   p99 {percentiles[98] * 1000:>7.2f} ms"
+        f"   {REQUESTS / elapsed:>9,.0f} req/sec"
+    )
+
+
+async def main():
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    vacancy_ids = [
+        str(vacancy_id)
+        for vacancy_id in await VacancyRepository().bulk_create_vacancies(
+            generate_inputs(SEED_ROWS)
+        )
+    ]
+
+    print(
+        f"🟢 {REQUESTS:,} calls per operation, {CONCURRENCY} concurrent, "
+        f"over {SEED_ROWS:,} vacancies\n"
+    )
+
+    try:
+        for backend, repository_class in REPOSITORIES.items():
+            for name, operation in operations(repository_class(), vacancy_ids).items():
+                # Warm up the pool and the prepared statement caches.
+                for _ in range(50):
+                    await operation()
+
+                await measure(f"{backend:<9} {name}", operation)
+            print()
+    finally:
+        await Vacancy.filter(id__in=vacancy_ids).delete()
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
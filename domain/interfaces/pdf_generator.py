@@ -7,6 +7,6 @@ class IPDFGenerator(ABC):
     """
 
     @abstractmethod
-    def generate_pdf(self, *args, **kwargs) -> None:
-        """Generate a PDF from a content."""
+    def generate_pdf(self, *args, **kwargs) -> bytes:
+        """Generate a PDF from a content, returning the document bytes."""
         raise NotImplementedError()
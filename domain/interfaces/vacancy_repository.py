@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Mapping
+from uuid import UUID
 
 from application.dto.pagination import Pagination, PaginationResponse
 from application.dto.simulation import CostSimulationInput, CostSimulationOutput
 from application.dto.vacancy import (
+    BulkStatusUpdateInput,
     NotesInput,
     StatusToUpdate,
     VacancyInput,
@@ -17,8 +20,22 @@ class IVacancyRepository(ABC):
     """
 
     @abstractmethod
-    async def get_vacancy_by_id(self, vacancy_id: str) -> VacancyOutput | None:
-        """Get a vacancy by its ID."""
+    async def get_vacancy_by_id(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> VacancyOutput | None:
+        """Get a vacancy by its ID, also looking in the archive when include_archived."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_vacancy_version(
+        self, vacancy_id: str, include_archived: bool = False
+    ) -> datetime | None:
+        """Get the updated_at of a vacancy without loading it, None when the ID doesn't exist."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_collection_version(self) -> int:
+        """Get a counter that changes on every write to the vacancies."""
         raise NotImplementedError()
 
     @abstractmethod
@@ -26,16 +43,23 @@ class IVacancyRepository(ABC):
         """Create a new vacancy."""
         raise NotImplementedError()
 
+    @abstractmethod
+    async def bulk_create_vacancies(
+        self, vacancies_data: List[VacancyInput]
+    ) -> List[UUID]:
+        """Create many vacancies at once, returning their IDs in input order."""
+        raise NotImplementedError()
+
     @abstractmethod
     async def update_vacancy(
         self, vacancy_id: str, vacancy_data: VacancyInput
     ) -> VacancyOutput | None:
-        """Update an existing vacancy."""
+        """Update an existing vacancy, returning None when the ID doesn't exist."""
         raise NotImplementedError()
 
     @abstractmethod
     async def delete_vacancy(self, vacancy_id: str) -> bool:
-        """Delete a vacancy by its ID."""
+        """Delete a vacancy by its ID, returning False when the ID doesn't exist."""
         raise NotImplementedError()
 
     @abstractmethod
@@ -43,6 +67,13 @@ class IVacancyRepository(ABC):
         """List all vacancies with optional filters."""
         raise NotImplementedError()
 
+    @abstractmethod
+    def stream_vacancies(
+        self, search: str | None = None, chunk_size: int = 1000
+    ) -> AsyncIterator[List[Mapping[str, Any]]]:
+        """Return an async iterator over the matching vacancies, in chunks of rows."""
+        raise NotImplementedError()
+
     @abstractmethod
     async def edit_vacancy_status(
         self,
@@ -50,7 +81,19 @@ class IVacancyRepository(ABC):
         vacancy_status: StatusToUpdate,
         optional_notes: NotesInput = None,
     ) -> VacancyOutput | None:
-        """Edit an existing vacancy status."""
+        """Edit an existing vacancy status, returning None when the ID doesn't exist."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def bulk_edit_vacancy_status(
+        self, bulk_status_input: BulkStatusUpdateInput
+    ) -> List[UUID]:
+        """Edit the status of many vacancies in one statement, returning the updated IDs."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def get_sector_summary_fingerprint(self, sector: str) -> tuple[int, int]:
+        """Get the amount of vacancies of a sector and the vacancy collection version."""
         raise NotImplementedError()
 
     @abstractmethod
@@ -0,0 +1,156 @@
+import json
+import os
+import traceback
+from typing import Any, AsyncIterator, List
+
+from pydantic import ValidationError
+
+from application.dto.vacancy import (
+    BulkCreateItemResult,
+    BulkCreateOutput,
+    BulkItemStatus,
+    VacancyInput,
+)
+from application.errors.bulk import InvalidBulkPayload
+from application.errors.database import SQLInjectionDetected
+from application.errors.date import DateTimeWrongFormat, DateTimeWrongType
+from application.interfaces.usecase import UseCase
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from utils.database_utils import validate_no_sql_commands
+from utils.date_utils import validate_dates
+from web.http_response_schema import HttpResponse, HttpResponseSchema
+
+BULK_CHUNK_SIZE = int(os.getenv("VACANCY_BULK_CHUNK_SIZE", "1000"))
+
+
+class BulkCreateVacancyUseCase(UseCase):
+    """
+    Use case for creating many vacancies in a single request (Implementing the UseCase interface).
+    """
+
+    def __init__(self, repository: IVacancyRepository):
+        """
+        Initialize the BulkCreateVacancyUseCase with a repository.
+
+        :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        """
+
+        self.repository = repository
+
+    @staticmethod
+    def _validate_item(item: Any) -> VacancyInput:
+        """
+        Apply to a single bulk item the same validations as the single creation.
+        """
+
+        if isinstance(item, InvalidBulkPayload):
+            raise item
+
+        vacancy_input = VacancyInput.model_validate(item)
+
+        validate_dates(vacancy_input.start_date, vacancy_input.end_date)
+        validate_no_sql_commands(vacancy_input)
+
+        return vacancy_input
+
+    async def _write_chunk(
+        self, chunk: List[tuple[int, VacancyInput]], results: List[BulkCreateItemResult]
+    ) -> None:
+        """
+        Persist a chunk of valid vacancies, recording the outcome of each of them.
+        """
+
+        try:
+            created_ids = await self.repository.bulk_create_vacancies(
+                [vacancy_input for _, vacancy_input in chunk]
+            )
+        except Exception as e:
+            traceback.print_exc()
+            results.extend(
+                BulkCreateItemResult(
+                    index=index, status=BulkItemStatus.failed, error=str(e)
+                )
+                for index, _ in chunk
+            )
+            return
+
+        results.extend(
+            BulkCreateItemResult(
+                index=index, status=BulkItemStatus.created, id=created_id
+            )
+            for (index, _), created_id in zip(chunk, created_ids)
+        )
+
+    async def execute(self, items: AsyncIterator[Any]) -> HttpResponse:
+
+        try:
+            results: List[BulkCreateItemResult] = []
+            chunk: List[tuple[int, VacancyInput]] = []
+            index = -1
+
+            async for index, item in _enumerate(items):
+                try:
+                    chunk.append((index, self._validate_item(item)))
+                except ValidationError as e:
+                    results.append(
+                        BulkCreateItemResult(
+                            index=index,
+                            status=BulkItemStatus.failed,
+                            error=_format_validation_error(e),
+                        )
+                    )
+                except (
+                    InvalidBulkPayload,
+                    DateTimeWrongFormat,
+                    DateTimeWrongType,
+                    SQLInjectionDetected,
+                ) as e:
+                    results.append(
+                        BulkCreateItemResult(
+                            index=index, status=BulkItemStatus.failed, error=str(e)
+                        )
+                    )
+
+                if len(chunk) >= BULK_CHUNK_SIZE:
+                    await self._write_chunk(chunk, results)
+                    chunk = []
+
+            if chunk:
+                await self._write_chunk(chunk, results)
+
+            results.sort(key=lambda result: result.index)
+            created = sum(r.status == BulkItemStatus.created for r in results)
+
+            bulk_output = BulkCreateOutput(
+                total=index + 1,
+                created=created,
+                failed=len(results) - created,
+                results=results,
+            )
+            bulk_output_dict = json.loads(bulk_output.model_dump_json())
+
+            if bulk_output.failed:
+                return HttpResponseSchema.multi_status(bulk_output_dict)
+
+            return HttpResponseSchema.created(bulk_output_dict)
+
+        except InvalidBulkPayload as e:
+            return HttpResponseSchema.bad_request(e)
+
+        except Exception as e:
+            traceback.print_exc()
+            return HttpResponseSchema.internal_server_error(Exception(e))
+
+
+async def _enumerate(items: AsyncIterator[Any]) -> AsyncIterator[tuple[int, Any]]:
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
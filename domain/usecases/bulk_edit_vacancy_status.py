@@ -0,0 +1,46 @@
+import json
+import traceback
+
+from application.dto.vacancy import BulkStatusUpdateInput, BulkStatusUpdateOutput
+from application.interfaces.usecase import UseCase
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from web.http_response_schema import HttpResponse, HttpResponseSchema
+
+
+class BulkEditVacancyStatusUseCase(UseCase):
+    """
+    Use case for editing the status of many vacancies at once (Implementing the UseCase interface).
+    """
+
+    def __init__(self, repository: IVacancyRepository):
+        """
+        Initialize the BulkEditVacancyStatusUseCase with a repository.
+
+        :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        """
+
+        self.repository = repository
+
+    async def execute(self, bulk_status_input: BulkStatusUpdateInput) -> HttpResponse:
+
+        try:
+            updated_ids = await self.repository.bulk_edit_vacancy_status(
+                bulk_status_input
+            )
+
+            updated_set = set(updated_ids)
+            missing_ids = [
+                vacancy_id
+                for vacancy_id in dict.fromkeys(bulk_status_input.ids or [])
+                if vacancy_id not in updated_set
+            ]
+
+            bulk_status_output = BulkStatusUpdateOutput(
+                updated=updated_ids, missing=missing_ids
+            )
+            bulk_status_output_dict = json.loads(bulk_status_output.model_dump_json())
+            return HttpResponseSchema.ok(bulk_status_output_dict)
+
+        except Exception as e:
+            traceback.print_exc()
+            return HttpResponseSchema.internal_server_error(Exception(e))
@@ -0,0 +1,90 @@
+import json
+import traceback
+
+from application.dto.report_job import ReportJobOutput
+from application.errors.media import NotFoundPdfMediaToGenerate, RenderQueueFull
+from application.interfaces.usecase import UseCase
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from domain.usecases.download_vacancy_summary import DownloadVacancySummaryUseCase
+from utils.job_utils import Job, JobManager
+from web.http_response_schema import HttpResponse, HttpResponseSchema
+
+
+def report_job_output(job: Job, downloadable: bool = False) -> ReportJobOutput:
+    """
+    Public representation of a sector summary report job.
+
+    :param downloadable: Whether the report of the job can still be downloaded.
+    """
+
+    return ReportJobOutput(
+        id=job.id,
+        sector=job.key,
+        status=job.status,
+        progress=job.progress,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        download_url=(
+            f"/api/v1/vacancy/summary/jobs/{job.id}/download/" if downloadable else None
+        ),
+    )
+
+
+class CreateSummaryReportJobUseCase(UseCase):
+    """
+    Use case to render a sector summary in the background (Implementing the UseCase interface).
+    """
+
+    def __init__(
+        self,
+        repository: IVacancyRepository,
+        download_use_case: DownloadVacancySummaryUseCase,
+        jobs: JobManager,
+    ):
+        """
+        Initialize the CreateSummaryReportJobUseCase.
+
+        :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        :param download_use_case: Use case rendering the summary PDF of a sector.
+        :param jobs: Background job manager running the renders.
+        """
+
+        self.repository = repository
+        self.download_use_case = download_use_case
+        self.jobs = jobs
+
+    async def execute(self, sector: str) -> HttpResponse:
+
+        try:
+            sector_key = sector.strip().lower()
+
+            vacancy_count, _ = await self.repository.get_sector_summary_fingerprint(
+                sector_key
+            )
+
+            if not vacancy_count:
+                raise NotFoundPdfMediaToGenerate("No vacancies to generate report.")
+
+            # The same sector requested while its report is queued or running
+            # joins that job instead of rendering it twice.
+            job = self.jobs.submit(
+                sector_key,
+                lambda job: self.download_use_case.render_summary(
+                    job.key, on_progress=job.set_progress
+                ),
+            )
+
+            return HttpResponseSchema.accepted(
+                json.loads(report_job_output(job).model_dump_json())
+            )
+
+        except NotFoundPdfMediaToGenerate as e:
+            return HttpResponseSchema.not_found(e)
+
+        except RenderQueueFull as e:
+            return HttpResponseSchema.service_unavailable(e)
+
+        except Exception as e:
+            traceback.print_exc()
+            return HttpResponseSchema.internal_server_error(Exception(e))
@@ -30,20 +30,11 @@ class DeleteVacancyUseCase(UseCase):
                     Exception(f"Invalid UUID structure for id: {vacancy_id}.")
                 )
 
-            vacancy_in_system = await self.repository.get_vacancy_by_id(vacancy_id)
-
-            if not vacancy_in_system:
-                return HttpResponseSchema.not_found(
-                    Exception(f"Vacancy not found for id: {vacancy_id}.")
-                )
-
             deleted_vacancy: bool = await self.repository.delete_vacancy(vacancy_id)
 
             if not deleted_vacancy:
-                return HttpResponseSchema.bad_request(
-                    Exception(
-                        f"It wasn`t possible to delete the vacancy for id {vacancy_id}."
-                    )
+                return HttpResponseSchema.not_found(
+                    Exception(f"Vacancy not found for id: {vacancy_id}.")
                 )
 
             response_for_vacancy_deletion = {"message": "Vacancy deleted successfully."}
@@ -0,0 +1,68 @@
+import traceback
+
+from application.dto.media import MediaPdfOutput
+from application.dto.report_job import ReportJobStatus
+from application.errors.media import ReportJobNotReady
+from application.interfaces.usecase import UseCase
+from utils.job_utils import JobManager
+from web.http_response_schema import (
+    DefaultFileResponse,
+    HttpResponse,
+    HttpResponseSchema,
+)
+
+
+class DownloadSummaryReportJobUseCase(UseCase):
+    """
+    Use case to download the report of a finished job (Implementing the UseCase interface).
+    """
+
+    def __init__(self, jobs: JobManager):
+        """
+        Initialize the DownloadSummaryReportJobUseCase.
+
+        :param jobs: Background job manager running the renders.
+        """
+
+        self.jobs = jobs
+
+    async def execute(self, job_id: str) -> DefaultFileResponse | HttpResponse:
+
+        try:
+            job = self.jobs.get(job_id)
+
+            if job is None:
+                return HttpResponseSchema.not_found(
+                    Exception(f"Report job not found for id: {job_id}.")
+                )
+
+            if job.status != ReportJobStatus.done:
+                raise ReportJobNotReady(
+                    f"Report job {job_id} is {job.status.value}"
+                    + (f": {job.error}" if job.error else ".")
+                )
+
+            report = self.jobs.result(job_id)
+
+            # Done jobs outlive their reports once the results cache evicts them.
+            if report is None:
+                return HttpResponseSchema.not_found(
+                    Exception(
+                        f"Report of job {job_id} is no longer kept, create a new job."
+                    )
+                )
+
+            return HttpResponseSchema.ok_file_response(
+                MediaPdfOutput(
+                    content=report,
+                    media_type="application/pdf",
+                    file_name=f"vacancy_summary_{job.key}.pdf",
+                )
+            )
+
+        except ReportJobNotReady as e:
+            return HttpResponseSchema.conflict(e)
+
+        except Exception as e:
+            traceback.print_exc()
+            return HttpResponseSchema.internal_server_error(Exception(e))
@@ -1,10 +1,14 @@
 import traceback
+from typing import Callable, Optional
 
 from application.dto.media import MediaPdfOutput
-from application.errors.media import NotFoundPdfMediaToGenerate
+from application.errors.media import NotFoundPdfMediaToGenerate, RenderQueueFull
 from application.interfaces.usecase import UseCase
 from domain.interfaces.pdf_generator import IPDFGenerator
 from domain.interfaces.vacancy_repository import IVacancyRepository
+from utils.cache_utils import TTLCache
+from utils.etag_utils import make_etag
+from utils.executor_utils import BoundedExecutor
 from web.http_response_schema import (
     DefaultFileResponse,
     HttpResponse,
@@ -17,25 +21,75 @@ class DownloadVacancySummaryUseCase(UseCase):
     Use case to download summary from the system (Implementing the UseCase interface).
     """
 
-    def __init__(self, repository: IVacancyRepository, pdf_adapter: IPDFGenerator):
+    def __init__(
+        self,
+        repository: IVacancyRepository,
+        pdf_adapter: IPDFGenerator,
+        executor: BoundedExecutor,
+        cache: TTLCache | None = None,
+    ):
         """
         Initialize the DownloadVacancySummaryUseCase with a repository.
 
         :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        :param pdf_adapter: An instance of IPDFGenerator rendering the summary.
+        :param executor: Worker pool running the rendering off the event loop.
+        :param cache: Optional cache of rendered PDFs, keyed by sector and data fingerprint.
         """
 
         self.repository = repository
         self.pdf_adapter = pdf_adapter
+        self.executor = executor
+        self.cache = cache
+
+    async def render_summary(
+        self, sector: str, on_progress: Optional[Callable[[float], None]] = None
+    ) -> bytes:
+        """
+        Render the summary PDF of a sector, reusing a cached copy while none
+        of its vacancies changed.
+
+        :param sector: Sector of the summarized vacancies, case insensitive.
+        :param on_progress: Optional callback receiving the progress, from 0 to 1.
+        :raises NotFoundPdfMediaToGenerate: When the sector has no vacancies.
+        :raises RenderQueueFull: When every render worker is busy.
+        """
+
+        pdf_key = None
+
+        if self.cache is not None:
+            vacancy_count, version = (
+                await self.repository.get_sector_summary_fingerprint(sector)
+            )
+
+            if not vacancy_count:
+                raise NotFoundPdfMediaToGenerate("No vacancies to generate report.")
+
+            pdf_key = make_etag("summary", sector.lower(), vacancy_count, version)
+
+            cached_pdf = self.cache.get(pdf_key)
+            if cached_pdf is not None:
+                return cached_pdf
+
+        summary = await self.repository.get_summary_of_vacancies_by_sector(sector)
+
+        if on_progress:
+            on_progress(0.2)
+
+        generated_pdf = await self.executor.run(self.pdf_adapter.generate_pdf, summary)
+
+        if pdf_key is not None:
+            self.cache.set(pdf_key, generated_pdf)
+
+        return generated_pdf
 
     async def execute(self, sector: str) -> DefaultFileResponse | HttpResponse:
 
         try:
-            summary = await self.repository.get_summary_of_vacancies_by_sector(sector)
-
-            generated_pdf = self.pdf_adapter.generate_pdf(summary)
+            generated_pdf = await self.render_summary(sector)
 
             media_pdf_output = MediaPdfOutput(
-                path=generated_pdf,
+                content=generated_pdf,
                 media_type="application/pdf",
                 file_name=f"vacancy_summary_{sector}.pdf",
             )
@@ -45,6 +99,9 @@ class DownloadVacancySummaryUseCase(UseCase):
         except NotFoundPdfMediaToGenerate as e:
             return HttpResponseSchema.not_found(e)
 
+        except RenderQueueFull as e:
+            return HttpResponseSchema.service_unavailable(e)
+
         except Exception as e:
             traceback.print_exc()
             return HttpResponseSchema.internal_server_error(Exception(e))
@@ -37,15 +37,6 @@ class EditVacancyStatusUseCase(UseCase):
                     Exception(f"Invalid UUID structure for id: {vacancy_id}.")
                 )
 
-            found_vacancy: VacancyOutput | None = (
-                await self.repository.get_vacancy_by_id(vacancy_id)
-            )
-
-            if not found_vacancy:
-                return HttpResponseSchema.not_found(
-                    Exception(f"Vacancy not found for id: {vacancy_id}.")
-                )
-
             updated_vacancy: VacancyOutput | None = (
                 await self.repository.edit_vacancy_status(
                     vacancy_id, vacancy_status, optional_notes
@@ -53,10 +44,8 @@ class EditVacancyStatusUseCase(UseCase):
             )
 
             if not updated_vacancy:
-                return HttpResponseSchema.bad_request(
-                    Exception(
-                        f"Error while trying to update a vacancy for id: {vacancy_id}."
-                    )
+                return HttpResponseSchema.not_found(
+                    Exception(f"Vacancy not found for id: {vacancy_id}.")
                 )
 
             update_vacancy_dict = json.loads(updated_vacancy.model_dump_json())
@@ -0,0 +1,80 @@
+import os
+import traceback
+from typing import Any, AsyncIterator, List, Mapping, Optional
+
+from application.dto.media import MediaStreamOutput
+from application.dto.vacancy import ExportFormat
+from application.interfaces.usecase import UseCase
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from utils.export_utils import encode_csv_rows, encode_ndjson_rows
+from web.http_response_schema import (
+    DefaultStreamResponse,
+    HttpResponse,
+    HttpResponseSchema,
+)
+
+EXPORT_CHUNK_SIZE = int(os.getenv("VACANCY_EXPORT_CHUNK_SIZE", "1000"))
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+class ExportVacanciesUseCase(UseCase):
+    """
+    Use case to stream every vacancy as a CSV or NDJSON file (Implementing the UseCase interface).
+    """
+
+    def __init__(self, repository: IVacancyRepository):
+        """
+        Initialize the ExportVacanciesUseCase with a repository.
+
+        :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        """
+
+        self.repository = repository
+
+    @staticmethod
+    async def _encode(
+        first_chunk: List[Mapping[str, Any]],
+        chunks: AsyncIterator[List[Mapping[str, Any]]],
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Encode the chunks of rows one at a time, so memory stays bounded by the chunk size.
+        """
+
+        if export_format == ExportFormat.csv:
+            yield encode_csv_rows(first_chunk, include_header=True)
+            async for rows in chunks:
+                yield encode_csv_rows(rows, include_header=False)
+        else:
+            yield encode_ndjson_rows(first_chunk)
+            async for rows in chunks:
+                yield encode_ndjson_rows(rows)
+
+    async def execute(
+        self, export_format: ExportFormat, search: Optional[str] = None
+    ) -> DefaultStreamResponse | HttpResponse:
+
+        try:
+            chunks = self.repository.stream_vacancies(
+                search=search, chunk_size=EXPORT_CHUNK_SIZE
+            )
+
+            # Fetch the first chunk before answering, so database errors still
+            # become an error response instead of a truncated 200 stream.
+            first_chunk = await anext(chunks, [])
+
+            media_stream_output = MediaStreamOutput(
+                content=self._encode(first_chunk, chunks, export_format),
+                media_type=EXPORT_MEDIA_TYPES[export_format],
+                file_name=f"vacancies.{export_format.value}",
+            )
+
+            return HttpResponseSchema.ok_stream_response(media_stream_output)
+
+        except Exception as e:
+            traceback.print_exc()
+            return HttpResponseSchema.internal_server_error(Exception(e))
@@ -1,8 +1,10 @@
 import traceback
+from typing import Mapping
 
-from application.dto.health import HealthStatusOutput
+from application.dto.health import CacheStatus, HealthStatusOutput
 from application.interfaces.usecase import UseCase
 from domain.interfaces.health_repository import IHealthRepository
+from utils.cache_utils import TTLCache
 from web.http_response_schema import HttpResponse, HttpResponseSchema
 
 
@@ -11,18 +13,28 @@ class GetHealthStatusUseCase(UseCase):
     Use case for getting health status from system (Implementing the UseCase interface).
     """
 
-    def __init__(self, repository: IHealthRepository):
+    def __init__(
+        self,
+        repository: IHealthRepository,
+        caches: Mapping[str, TTLCache] | None = None,
+    ):
         """
         Initialize the GetHealthStatusUseCase with a repository.
 
         :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        :param caches: The enabled in-process caches by name, reported with their counters.
         """
 
         self.repository = repository
+        self.caches = caches or {}
 
     async def execute(self) -> HttpResponse:
         try:
             result: HealthStatusOutput = await self.repository.check_database_health()
+            result.caches = {
+                name: CacheStatus(**cache.snapshot())
+                for name, cache in self.caches.items()
+            }
             result_as_dict = result.model_dump()
             return HttpResponseSchema.ok(result_as_dict)
         except Exception as e:
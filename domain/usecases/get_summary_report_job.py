@@ -0,0 +1,44 @@
+import json
+import traceback
+
+from application.interfaces.usecase import UseCase
+from domain.usecases.create_summary_report_job import report_job_output
+from utils.job_utils import JobManager
+from web.http_response_schema import HttpResponse, HttpResponseSchema
+
+
+class GetSummaryReportJobUseCase(UseCase):
+    """
+    Use case to poll a sector summary report job (Implementing the UseCase interface).
+    """
+
+    def __init__(self, jobs: JobManager):
+        """
+        Initialize the GetSummaryReportJobUseCase.
+
+        :param jobs: Background job manager running the renders.
+        """
+
+        self.jobs = jobs
+
+    async def execute(self, job_id: str) -> HttpResponse:
+
+        try:
+            job = self.jobs.get(job_id)
+
+            if job is None:
+                return HttpResponseSchema.not_found(
+                    Exception(f"Report job not found for id: {job_id}.")
+                )
+
+            return HttpResponseSchema.ok(
+                json.loads(
+                    report_job_output(
+                        job, downloadable=self.jobs.result(job_id) is not None
+                    ).model_dump_json()
+                )
+            )
+
+        except Exception as e:
+            traceback.print_exc()
+            return HttpResponseSchema.internal_server_error(Exception(e))
@@ -1,10 +1,13 @@
 import json
 import traceback
+from datetime import datetime
+from typing import Optional
 
 from application.dto.vacancy import VacancyOutput
 from application.interfaces.usecase import UseCase
 from domain.interfaces.vacancy_repository import IVacancyRepository
 from utils.database_utils import is_valid_uuid
+from utils.etag_utils import etag_matches, make_etag
 from web.http_response_schema import HttpResponse, HttpResponseSchema
 
 
@@ -22,7 +25,20 @@ class GetVacancyUseCase(UseCase):
 
         self.repository = repository
 
-    async def execute(self, vacancy_id: str) -> HttpResponse:
+    @staticmethod
+    def vacancy_etag(vacancy_id: str, updated_at: datetime) -> str:
+        """
+        ETag of a single vacancy: its representation only changes with updated_at.
+        """
+
+        return make_etag("vacancy", str(vacancy_id), updated_at.isoformat())
+
+    async def execute(
+        self,
+        vacancy_id: str,
+        include_archived: bool = False,
+        if_none_match: Optional[str] = None,
+    ) -> HttpResponse:
 
         try:
             is_valid_uuid_structure: bool = is_valid_uuid(vacancy_id)
@@ -32,8 +48,19 @@ class GetVacancyUseCase(UseCase):
                     Exception(f"Invalid UUID structure for id: {vacancy_id}.")
                 )
 
+            # A conditional request first checks only updated_at, the row is
+            # loaded and serialized only when the client's copy is stale.
+            if if_none_match:
+                version = await self.repository.get_vacancy_version(
+                    vacancy_id, include_archived
+                )
+                if version:
+                    etag = self.vacancy_etag(vacancy_id, version)
+                    if etag_matches(if_none_match, etag):
+                        return HttpResponseSchema.not_modified(etag)
+
             found_vacancy: VacancyOutput | None = (
-                await self.repository.get_vacancy_by_id(vacancy_id)
+                await self.repository.get_vacancy_by_id(vacancy_id, include_archived)
             )
 
             if not found_vacancy:
@@ -42,7 +69,10 @@ class GetVacancyUseCase(UseCase):
                 )
 
             found_vacancy_dict = json.loads(found_vacancy.model_dump_json())
-            return HttpResponseSchema.ok(found_vacancy_dict)
+            return HttpResponseSchema.ok(
+                found_vacancy_dict,
+                etag=self.vacancy_etag(vacancy_id, found_vacancy.updated_at),
+            )
         except Exception as e:
             traceback.print_exc()
             return HttpResponseSchema.internal_server_error(Exception(e))
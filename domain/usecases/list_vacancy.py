@@ -1,10 +1,13 @@
 import json
 import traceback
-from typing import Any
+from typing import Optional
 
 from application.dto.pagination import Pagination, PaginationResponse
+from application.errors.pagination import InvalidPaginationCursor
 from application.interfaces.usecase import UseCase
 from domain.interfaces.vacancy_repository import IVacancyRepository
+from utils.cache_utils import TTLCache
+from utils.etag_utils import etag_matches, make_etag
 from web.http_response_schema import HttpResponse, HttpResponseSchema
 
 
@@ -13,26 +16,58 @@ class ListVacancyUseCase(UseCase):
     Use case to list all vacancies in the system (Implementing the UseCase interface).
     """
 
-    def __init__(self, repository: IVacancyRepository):
+    def __init__(self, repository: IVacancyRepository, cache: TTLCache | None = None):
         """
         Initialize the ListVacancyUseCase with a repository.
 
         :param repository: An instance of IVacancyRepository to interact with vacancy data.
+        :param cache: Optional cache of listing pages, keyed by the collection version
+            and the query, so a write never needs to invalidate it.
         """
 
         self.repository = repository
+        self.cache = cache
 
-    async def execute(self, page: int, page_size: int, search: Any) -> HttpResponse:
+    async def execute(
+        self, pagination: Pagination, if_none_match: Optional[str] = None
+    ) -> HttpResponse:
 
         try:
-            pagination: Pagination = Pagination(
-                page=page, page_size=page_size, search=search
+            # Read before the page, so a concurrent write can only make the
+            # ETag older than the page, never newer.
+            version = await self.repository.get_collection_version()
+            page_key = (
+                "vacancies",
+                version,
+                pagination.page,
+                pagination.page_size,
+                pagination.search or None,
+                pagination.cursor or None,
+                pagination.total_mode.value,
+                pagination.include_archived,
             )
+            etag = make_etag(*page_key)
+
+            if etag_matches(if_none_match, etag):
+                return HttpResponseSchema.not_modified(etag)
+
+            if self.cache is not None:
+                cached_page = self.cache.get(page_key)
+                if cached_page is not None:
+                    return HttpResponseSchema.ok(cached_page, etag=etag)
+
             list_of_vacancies: PaginationResponse = (
                 await self.repository.list_vacancies(pagination)
             )
             list_of_vacancies_as_dict = json.loads(list_of_vacancies.model_dump_json())
-            return HttpResponseSchema.ok(list_of_vacancies_as_dict)
+
+            if self.cache is not None:
+                self.cache.set(page_key, list_of_vacancies_as_dict)
+
+            return HttpResponseSchema.ok(list_of_vacancies_as_dict, etag=etag)
+
+        except InvalidPaginationCursor as e:
+            return HttpResponseSchema.bad_request(e)
 
         except Exception as e:
             traceback.print_exc()
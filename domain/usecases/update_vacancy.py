@@ -40,21 +40,12 @@ class UpdateVacancyUseCase(UseCase):
                     Exception(f"Invalid UUID structure for id: {vacancy_id}.")
                 )
 
-            found_vacancy: VacancyOutput | None = (
-                await self.repository.get_vacancy_by_id(vacancy_id)
-            )
-
-            if not found_vacancy:
-                return HttpResponseSchema.not_found(
-                    Exception(f"Vacancy not found for id: {vacancy_id}.")
-                )
-
             updated_vacancy: VacancyOutput | None = (
                 await self.repository.update_vacancy(vacancy_id, vacancy_data_input)
             )
 
             if not updated_vacancy:
-                return HttpResponseSchema.bad_request(
+                return HttpResponseSchema.not_found(
                     Exception(f"Vacancy not found for id: {vacancy_id}.")
                 )
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -8,17 +9,59 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
 from starlette.responses import JSONResponse
 
-from infra.database.pgdatabase import close_db, init_db
+from adapters.repositories.cached_vacancy_repository import (
+    evict_vacancies,
+    flush_vacancies,
+)
+from infra.database.archive import run_archive_schedule
+from infra.database.notifications import VacancyChangesListener
+from infra.database.pgdatabase import close_db, init_db, warm_up_db
+from infra.database.routing import connection_router, start_session
 from web.app.health import health_router
 from web.app.vacancies import vacancy_router
+from web.dependencies import pdf_render_executor, report_job_manager, vacancy_cache
 
 api_version = "/api/v1"
+last_write_cookie = "last_write_at"
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    await warm_up_db()
+
+    # Optional in-process archival job, the CLI is infra/scripts/archive_vacancies.py.
+    archive_interval = float(os.getenv("VACANCY_ARCHIVE_INTERVAL_SECONDS", "0"))
+    archive_task = (
+        asyncio.create_task(run_archive_schedule(archive_interval))
+        if archive_interval > 0
+        else None
+    )
+
+    # Evicts vacancies changed by other workers from the local cache.
+    listen_for_changes = os.getenv("VACANCY_CACHE_LISTEN", "true").lower() == "true"
+    listener_task = (
+        asyncio.create_task(
+            VacancyChangesListener(
+                on_change=lambda vacancy_ids: evict_vacancies(
+                    vacancy_cache, *vacancy_ids
+                ),
+                on_flush=lambda: flush_vacancies(vacancy_cache),
+            ).run()
+        )
+        if vacancy_cache is not None and listen_for_changes
+        else None
+    )
+
     yield
+
+    for task in (archive_task, listener_task):
+        if task:
+            task.cancel()
+
+    report_job_manager.shutdown()
+    pdf_render_executor.shutdown()
+
     await close_db()
 
 
@@ -36,6 +79,32 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def database_session_middleware(request: Request, call_next):
+    """
+    Keep reads of a client on the primary database for a short window after
+    it writes, carrying the time of its last write in a cookie.
+    """
+
+    try:
+        last_write_at = float(request.cookies.get(last_write_cookie, 0))
+    except ValueError:
+        last_write_at = 0.0
+
+    session = start_session(last_write_at)
+    response = await call_next(request)
+
+    if session.last_write_at > last_write_at:
+        response.set_cookie(
+            last_write_cookie,
+            str(session.last_write_at),
+            max_age=max(int(connection_router.read_your_writes_seconds), 1),
+            httponly=True,
+        )
+
+    return response
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
 
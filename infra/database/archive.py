@@ -0,0 +1,76 @@
+import asyncio
+import os
+import traceback
+from datetime import datetime, timedelta, timezone
+
+from tortoise import Tortoise
+
+ARCHIVE_AFTER_DAYS = int(os.getenv("VACANCY_ARCHIVE_AFTER_DAYS", "90"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("VACANCY_ARCHIVE_BATCH_SIZE", "1000"))
+
+ARCHIVE_COLUMNS = (
+    '"id", "description", "sector", "manager", "salary_expectation", "urgency", '
+    '"status", "start_date", "end_date", "notes", "created_at", "updated_at"'
+)
+
+# Moves one batch in a single statement, so a row is never lost or duplicated.
+# SKIP LOCKED lets several API workers run the job at the same time.
+ARCHIVE_BATCH_SQL = f"""
+    WITH "moved" AS (
+        DELETE FROM "vacancy"
+        WHERE "id" IN (
+            SELECT "id" FROM "vacancy"
+            WHERE "status" IN ('FINISHED', 'CANCELED') AND "updated_at" < $1
+            ORDER BY "updated_at"
+            LIMIT $2
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING {ARCHIVE_COLUMNS}
+    )
+    INSERT INTO "vacancy_archive" ({ARCHIVE_COLUMNS})
+    SELECT {ARCHIVE_COLUMNS} FROM "moved"
+    RETURNING "id";
+"""
+
+
+async def archive_closed_vacancies(
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+) -> int:
+    """
+    Move FINISHED and CANCELED vacancies not updated for older_than_days
+    from vacancy to vacancy_archive, one committed batch at a time.
+
+    :param older_than_days: Minimum age, in days since the last update, of an archived vacancy.
+    :param batch_size: Maximum amount of vacancies moved per statement.
+    :return: Amount of archived vacancies.
+    """
+
+    conn = Tortoise.get_connection("default")
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    archived = 0
+
+    while True:
+        moved, _ = await conn.execute_query(ARCHIVE_BATCH_SQL, [cutoff, batch_size])
+        archived += moved
+
+        if moved < batch_size:
+            return archived
+
+
+async def run_archive_schedule(interval_seconds: float) -> None:
+    """
+    Archive closed vacancies every interval_seconds until cancelled.
+
+    :param interval_seconds: Pause between two runs of the archival job.
+    """
+
+    while True:
+        try:
+            archived = await archive_closed_vacancies()
+            if archived:
+                print(f"🟢 Archived {archived} closed vacancies.\n")
+        except Exception:
+            traceback.print_exc()
+
+        await asyncio.sleep(interval_seconds)
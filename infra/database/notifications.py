@@ -0,0 +1,119 @@
+import asyncio
+import os
+import traceback
+from typing import Awaitable, Callable, List
+
+import asyncpg
+
+from infra.database.pgdatabase import database_credentials
+
+VACANCY_CHANGES_CHANNEL = "vacancy_changes"
+
+# Payload sent by the triggers when every cached vacancy must be dropped.
+FLUSH_PAYLOAD = "*"
+
+
+def listen_credentials() -> dict:
+    """
+    Connection settings of the listening connection. LISTEN needs a session of
+    its own, so behind pgbouncer transaction pooling POSTGRES_LISTEN_HOST and
+    POSTGRES_LISTEN_PORT should point straight to PostgreSQL.
+    """
+
+    credentials = database_credentials(
+        host=os.getenv("POSTGRES_LISTEN_HOST"), port=os.getenv("POSTGRES_LISTEN_PORT")
+    )
+
+    return {
+        key: credentials[key]
+        for key in ("host", "port", "user", "password", "database")
+    }
+
+
+async def connect_listener() -> asyncpg.Connection:
+    return await asyncpg.connect(**listen_credentials())
+
+
+class VacancyChangesListener:
+    """
+    Listens to the vacancy_changes channel, filled by the triggers on vacancy
+    and vacancy_archive, and evicts the changed vacancies from the local caches.
+    Notifications sent while the listener is not connected are lost, so the
+    caches are flushed whenever the connection drops and once it is back.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[List[str]], None],
+        on_flush: Callable[[], None],
+        connect: Callable[[], Awaitable[asyncpg.Connection]] = connect_listener,
+        keepalive_seconds: float = 10.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """
+        :param on_change: Called with the IDs of the changed vacancies.
+        :param on_flush: Called when every cached vacancy must be dropped.
+        :param connect: Opens the listening connection.
+        :param keepalive_seconds: Pause between two checks that the connection is alive.
+        :param max_reconnect_delay: Maximum pause between two connection attempts.
+        """
+
+        self.on_change = on_change
+        self.on_flush = on_flush
+        self.connect = connect
+        self.keepalive_seconds = keepalive_seconds
+        self.max_reconnect_delay = max_reconnect_delay
+        self.listening = False
+
+    def handle_notification(self, _connection, _pid, _channel, payload: str) -> None:
+        if payload == FLUSH_PAYLOAD:
+            self.on_flush()
+        else:
+            self.on_change(payload.split(","))
+
+    async def listen_once(self) -> None:
+        """
+        Listen on one connection until it fails.
+        """
+
+        connection = await self.connect()
+
+        try:
+            await connection.add_listener(
+                VACANCY_CHANGES_CHANNEL, self.handle_notification
+            )
+            # Anything changed before LISTEN took effect was missed.
+            self.on_flush()
+            self.listening = True
+
+            while True:
+                await asyncio.sleep(self.keepalive_seconds)
+                await asyncio.wait_for(
+                    connection.execute("SELECT 1;"), self.keepalive_seconds
+                )
+        finally:
+            if not connection.is_closed():
+                connection.terminate()
+
+    async def run(self) -> None:
+        """
+        Keep listening until cancelled, reconnecting with an exponential backoff.
+        """
+
+        initial_delay = min(1.0, self.max_reconnect_delay)
+        delay = initial_delay
+
+        while True:
+            try:
+                await self.listen_once()
+            except Exception:
+                traceback.print_exc()
+                self.on_flush()
+
+            # Back off only while connecting fails, not after a dropped connection.
+            if self.listening:
+                delay = initial_delay
+                self.listening = False
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
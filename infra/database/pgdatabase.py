@@ -43,21 +43,86 @@ class Vacancy(Model):
     start_date: datetime = fields.DatetimeField()
     end_date: Optional[datetime] = fields.DatetimeField(null=True)
     notes: Optional[str] = fields.CharField(max_length=255, null=True)
-    created_at: datetime = fields.DatetimeField(auto_now=True)
+    created_at: datetime = fields.DatetimeField(auto_now_add=True)
     updated_at: datetime = fields.DatetimeField(auto_now=True)
 
 
+class VacancyArchive(Model):
+    """
+    Model representing a closed vacancy moved out of the vacancy table by the archival job.
+    """
+
+    id: UUID = fields.UUIDField(primary_key=True)
+    description: str = fields.CharField(max_length=255)
+    sector: str = fields.CharField(max_length=255)
+    manager: str = fields.CharField(max_length=255)
+    salary_expectation: float = fields.FloatField()
+    urgency: Urgency = fields.IntEnumField(Urgency, "Urgency options")
+    status: Status = fields.CharEnumField(Status, "Status options")
+    start_date: datetime = fields.DatetimeField()
+    end_date: Optional[datetime] = fields.DatetimeField(null=True)
+    notes: Optional[str] = fields.CharField(max_length=255, null=True)
+    created_at: datetime = fields.DatetimeField()
+    updated_at: datetime = fields.DatetimeField()
+    archived_at: datetime = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Table of the archived vacancies.
+        """
+
+        table = "vacancy_archive"
+
+
+def database_credentials(
+    host: str | None = None, port: str | int | None = None
+) -> dict:
+    """
+    Build the asyncpg credentials and pool settings of the database from the environment.
+    host and port override POSTGRES_HOST/POSTGRES_PORT, e.g. for a read replica.
+    With POSTGRES_PGBOUNCER enabled, prepared statement caching and startup
+    server settings are turned off so the pool works behind pgbouncer transaction pooling.
+    """
+
+    pgbouncer_mode = os.getenv("POSTGRES_PGBOUNCER", "false").lower() == "true"
+
+    credentials = {
+        "host": host or os.getenv("POSTGRES_HOST", "0.0.0.0"),
+        "port": port or os.getenv("POSTGRES_PORT", 5432),
+        "user": os.getenv("POSTGRES_USER", "localuser"),
+        "password": os.getenv("POSTGRES_PASSWORD", "localpassword"),
+        "database": os.getenv("POSTGRES_DB", "recruitment-database"),
+        "minsize": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")),
+        "maxsize": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+        "max_inactive_connection_lifetime": float(
+            os.getenv("POSTGRES_POOL_MAX_INACTIVE_LIFETIME", "300")
+        ),
+        "statement_cache_size": int(os.getenv("POSTGRES_STATEMENT_CACHE_SIZE", "100")),
+        "application_name": os.getenv(
+            "POSTGRES_APPLICATION_NAME", "recruitment-management-api"
+        ),
+    }
+
+    # Timeouts are opt-in, migrations and maintenance scripts share this config.
+    if os.getenv("POSTGRES_COMMAND_TIMEOUT"):
+        credentials["command_timeout"] = float(os.getenv("POSTGRES_COMMAND_TIMEOUT"))
+
+    if pgbouncer_mode:
+        credentials["statement_cache_size"] = 0
+        credentials["max_cached_statement_lifetime"] = 0
+    elif os.getenv("POSTGRES_STATEMENT_TIMEOUT_MS"):
+        credentials["server_settings"] = {
+            "statement_timeout": os.getenv("POSTGRES_STATEMENT_TIMEOUT_MS"),
+        }
+
+    return credentials
+
+
 TORTOISE_ORM = {
     "connections": {
         "default": {
             "engine": "tortoise.backends.asyncpg",
-            "credentials": {
-                "host": os.getenv("POSTGRES_HOST", "0.0.0.0"),
-                "port": os.getenv("POSTGRES_PORT", 5432),
-                "user": os.getenv("POSTGRES_USER", "localuser"),
-                "password": os.getenv("POSTGRES_PASSWORD", "localpassword"),
-                "database": os.getenv("POSTGRES_DB", "recruitment-database"),
-            },
+            "credentials": database_credentials(),
         }
     },
     "apps": {
@@ -69,9 +134,31 @@ TORTOISE_ORM = {
 }
 
 
+if os.getenv("POSTGRES_REPLICA_HOST"):
+    TORTOISE_ORM["connections"]["replica"] = {
+        "engine": "tortoise.backends.asyncpg",
+        "credentials": database_credentials(
+            host=os.getenv("POSTGRES_REPLICA_HOST"),
+            port=os.getenv("POSTGRES_REPLICA_PORT"),
+        ),
+    }
+
+
 async def init_db() -> None:
     await Tortoise.init(config=TORTOISE_ORM)
 
 
+async def warm_up_db() -> None:
+    """
+    Create the connection pool at startup, which opens its minimum amount of
+    connections, so the first requests after a deploy don't pay connection setup.
+    """
+
+    for connection_name in TORTOISE_ORM["connections"]:
+        conn = Tortoise.get_connection(connection_name)
+        async with conn.acquire_connection() as connection:
+            await connection.execute("SELECT 1;")
+
+
 async def close_db() -> None:
     await Tortoise.close_connections()
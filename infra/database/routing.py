@@ -0,0 +1,112 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from tortoise import BaseDBAsyncClient, Tortoise
+
+from infra.database.pgdatabase import TORTOISE_ORM
+
+PRIMARY_CONNECTION = "default"
+REPLICA_CONNECTION = "replica"
+
+
+@dataclass
+class DatabaseSession:
+    """
+    Per request state used to let a client read its own writes.
+    """
+
+    last_write_at: float = 0.0
+
+
+_current_session: ContextVar[Optional[DatabaseSession]] = ContextVar(
+    "database_session", default=None
+)
+
+_read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+def start_session(last_write_at: float = 0.0) -> DatabaseSession:
+    """
+    Bind a new DatabaseSession to the current context (usually a request).
+
+    :param last_write_at: Epoch of the last write of the client, e.g. from a cookie.
+    :return: The session, mutated in place by the router on every write.
+    """
+
+    session = DatabaseSession(last_write_at=last_write_at)
+    _current_session.set(session)
+    return session
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """
+    Send the reads made inside the block to the primary, e.g. to reload a row
+    the replica may not have caught up with yet.
+    """
+
+    token = _read_from_primary.set(True)
+    try:
+        yield
+    finally:
+        _read_from_primary.reset(token)
+
+
+class ConnectionRouter:
+    """
+    Routes reads to the replica and writes to the primary connection.
+    Reads of a session that wrote less than read_your_writes_seconds ago stay
+    on the primary, so the client never misses its own writes due to replica lag.
+    """
+
+    def __init__(
+        self,
+        replica: Optional[str] = None,
+        read_your_writes_seconds: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.replica = replica
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.clock = clock
+
+    def read_connection_name(self) -> str:
+        if not self.replica or _read_from_primary.get():
+            return PRIMARY_CONNECTION
+
+        session = _current_session.get()
+
+        if (
+            session
+            and self.clock() - session.last_write_at < self.read_your_writes_seconds
+        ):
+            return PRIMARY_CONNECTION
+
+        return self.replica
+
+    def write_connection_name(self) -> str:
+        session = _current_session.get()
+
+        if session:
+            session.last_write_at = self.clock()
+
+        return PRIMARY_CONNECTION
+
+    def for_read(self) -> BaseDBAsyncClient:
+        return Tortoise.get_connection(self.read_connection_name())
+
+    def for_write(self) -> BaseDBAsyncClient:
+        return Tortoise.get_connection(self.write_connection_name())
+
+
+connection_router = ConnectionRouter(
+    replica=(
+        REPLICA_CONNECTION
+        if REPLICA_CONNECTION in TORTOISE_ORM["connections"]
+        else None
+    ),
+    read_your_writes_seconds=float(os.getenv("POSTGRES_READ_YOUR_WRITES_SECONDS", "5")),
+)
@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+
+from tortoise import Tortoise
+
+from infra.database.archive import (
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    archive_closed_vacancies,
+)
+from infra.database.pgdatabase import TORTOISE_ORM
+
+
+async def main(older_than_days: int, batch_size: int) -> int:
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    try:
+        print(
+            f"🟢 Archiving vacancies closed more than {older_than_days} days ago ... \n"
+        )
+        archived = await archive_closed_vacancies(older_than_days, batch_size)
+        print(f"🟢 {archived} vacancies moved to vacancy_archive.\n")
+        return 0
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Move old FINISHED and CANCELED vacancies to vacancy_archive."
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=ARCHIVE_AFTER_DAYS,
+        help="Archive closed vacancies not updated for this many days.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=ARCHIVE_BATCH_SIZE,
+        help="Maximum amount of vacancies moved per statement.",
+    )
+    arguments = parser.parse_args()
+
+    raise SystemExit(asyncio.run(main(arguments.older_than_days, arguments.batch_size)))
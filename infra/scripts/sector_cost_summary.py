@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from infra.database.pgdatabase import TORTOISE_ORM
+
+EXPECTED_SUMMARY_SQL = """
+    SELECT lower("sector") AS "sector_key", "status",
+           COUNT(*) AS "vacancy_count",
+           SUM("salary_expectation"::NUMERIC) AS "salary_total"
+    FROM "vacancy"
+    GROUP BY lower("sector"), "status"
+"""
+
+DIVERGENCES_SQL = f"""
+    SELECT COALESCE(expected."sector_key", summary."sector_key") AS "sector_key",
+           COALESCE(expected."status", summary."status") AS "status",
+           COALESCE(expected."vacancy_count", 0) AS "expected_count",
+           COALESCE(summary."vacancy_count", 0) AS "actual_count",
+           COALESCE(expected."salary_total", 0) AS "expected_total",
+           COALESCE(summary."salary_total", 0) AS "actual_total"
+    FROM ({EXPECTED_SUMMARY_SQL}) AS expected
+    FULL OUTER JOIN "sector_cost_summary" AS summary
+        ON summary."sector_key" = expected."sector_key"
+        AND summary."status" = expected."status"
+    WHERE COALESCE(expected."vacancy_count", 0) <> COALESCE(summary."vacancy_count", 0)
+       OR COALESCE(expected."salary_total", 0) <> COALESCE(summary."salary_total", 0);
+"""
+
+REBUILD_SQL = f"""
+    INSERT INTO "sector_cost_summary" ("sector_key", "status", "vacancy_count", "salary_total")
+    {EXPECTED_SUMMARY_SQL};
+"""
+
+
+async def find_divergences() -> list[dict]:
+    """
+    Compare sector_cost_summary with an aggregate computed from the vacancy table.
+    Both sides are read in the same statement, so they share one snapshot.
+    """
+
+    conn = Tortoise.get_connection("default")
+    return await conn.execute_query_dict(DIVERGENCES_SQL)
+
+
+async def rebuild_summary() -> None:
+    """
+    Recompute sector_cost_summary from scratch.
+    Writes on vacancy are blocked while it runs so no trigger update is lost.
+    """
+
+    async with in_transaction() as conn:
+        await conn.execute_script('LOCK TABLE "vacancy" IN SHARE MODE;')
+        await conn.execute_script('DELETE FROM "sector_cost_summary";')
+        await conn.execute_script(REBUILD_SQL)
+
+
+async def main(rebuild: bool) -> int:
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    try:
+        if rebuild:
+            print("🟢 Rebuilding sector_cost_summary ... \n")
+            await rebuild_summary()
+
+        divergences = await find_divergences()
+
+        if not divergences:
+            print("🟢 sector_cost_summary is consistent with vacancy.\n")
+            return 0
+
+        print(f"🔴 {len(divergences)} divergent sector_cost_summary rows:\n")
+        for row in divergences:
+            print(
+                f"  {row['sector_key']}/{row['status']}: "
+                f"count {row['actual_count']} (expected {row['expected_count']}), "
+                f"total {row['actual_total']} (expected {row['expected_total']})"
+            )
+
+        return 1
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Verify (and optionally rebuild) the sector_cost_summary aggregate."
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute the aggregate from the vacancy table before verifying it.",
+    )
+    arguments = parser.parse_args()
+
+    raise SystemExit(asyncio.run(main(arguments.rebuild)))
@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        ALTER TABLE "vacancy" ADD "search_vector" TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce("description", '')), 'A')
+            || setweight(to_tsvector('simple', coalesce("sector", '')), 'B')
+            || setweight(to_tsvector('simple', coalesce("manager", '')), 'B')
+            || setweight(to_tsvector('simple', coalesce("notes", '')), 'C')
+        ) STORED;
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_search_vector" ON "vacancy" USING GIN ("search_vector");
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_description_trgm" ON "vacancy" USING GIN ("description" gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_sector_trgm" ON "vacancy" USING GIN ("sector" gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_manager_trgm" ON "vacancy" USING GIN ("manager" gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_notes_trgm" ON "vacancy" USING GIN ("notes" gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_vacancy_notes_trgm";
+        DROP INDEX IF EXISTS "idx_vacancy_manager_trgm";
+        DROP INDEX IF EXISTS "idx_vacancy_sector_trgm";
+        DROP INDEX IF EXISTS "idx_vacancy_description_trgm";
+        DROP INDEX IF EXISTS "idx_vacancy_search_vector";
+        ALTER TABLE "vacancy" DROP COLUMN "search_vector";"""
@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "sector_cost_summary" (
+    "sector_key" VARCHAR(255) NOT NULL,
+    "status" VARCHAR(11) NOT NULL,
+    "vacancy_count" BIGINT NOT NULL DEFAULT 0,
+    "salary_total" NUMERIC NOT NULL DEFAULT 0,
+    PRIMARY KEY ("sector_key", "status")
+);
+COMMENT ON TABLE "sector_cost_summary" IS 'Vacancy count and salary sum per lower(sector) and status, maintained by trigger';
+CREATE OR REPLACE FUNCTION "sector_cost_summary_apply"(
+    p_sector_key VARCHAR, p_status VARCHAR, p_count BIGINT, p_salary NUMERIC
+) RETURNS VOID AS $$
+BEGIN
+    INSERT INTO "sector_cost_summary" AS summary ("sector_key", "status", "vacancy_count", "salary_total")
+    VALUES (p_sector_key, p_status, p_count, p_salary)
+    ON CONFLICT ("sector_key", "status") DO UPDATE
+    SET "vacancy_count" = summary."vacancy_count" + EXCLUDED."vacancy_count",
+        "salary_total" = summary."salary_total" + EXCLUDED."salary_total";
+END;
+$$ LANGUAGE plpgsql;
+CREATE OR REPLACE FUNCTION "vacancy_sector_cost_summary_trigger"() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND lower(OLD."sector") = lower(NEW."sector")
+        AND OLD."status" = NEW."status"
+        AND OLD."salary_expectation" = NEW."salary_expectation" THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM "sector_cost_summary_apply"(
+            lower(OLD."sector"), OLD."status", -1, -OLD."salary_expectation"::NUMERIC
+        );
+    END IF;
+    IF TG_OP IN ('UPDATE', 'INSERT') THEN
+        PERFORM "sector_cost_summary_apply"(
+            lower(NEW."sector"), NEW."status", 1, NEW."salary_expectation"::NUMERIC
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER "vacancy_sector_cost_summary"
+    AFTER INSERT OR DELETE OR UPDATE OF "sector", "status", "salary_expectation" ON "vacancy"
+    FOR EACH ROW EXECUTE FUNCTION "vacancy_sector_cost_summary_trigger"();
+INSERT INTO "sector_cost_summary" ("sector_key", "status", "vacancy_count", "salary_total")
+SELECT lower("sector"), "status", COUNT(*), SUM("salary_expectation"::NUMERIC)
+FROM "vacancy" GROUP BY lower("sector"), "status"
+ON CONFLICT ("sector_key", "status") DO NOTHING;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "vacancy_sector_cost_summary" ON "vacancy";
+        DROP FUNCTION IF EXISTS "vacancy_sector_cost_summary_trigger"();
+        DROP FUNCTION IF EXISTS "sector_cost_summary_apply"(VARCHAR, VARCHAR, BIGINT, NUMERIC);
+        DROP TABLE IF EXISTS "sector_cost_summary";"""
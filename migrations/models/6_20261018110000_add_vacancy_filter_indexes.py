@@ -0,0 +1,16 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_sector_lower" ON "vacancy" (lower("sector"));
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_in_progress_sector" ON "vacancy" (lower("sector")) INCLUDE ("salary_expectation") WHERE "status" = 'IN_PROGRESS';
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_created_at_id" ON "vacancy" ("created_at", "id");
+        ANALYZE "vacancy";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_vacancy_created_at_id";
+        DROP INDEX IF EXISTS "idx_vacancy_in_progress_sector";
+        DROP INDEX IF EXISTS "idx_vacancy_sector_lower";"""
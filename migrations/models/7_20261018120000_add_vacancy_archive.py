@@ -0,0 +1,46 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "vacancy_archive" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "description" VARCHAR(255) NOT NULL,
+    "sector" VARCHAR(255) NOT NULL,
+    "manager" VARCHAR(255) NOT NULL,
+    "salary_expectation" DOUBLE PRECISION NOT NULL,
+    "urgency" SMALLINT NOT NULL,
+    "status" VARCHAR(11) NOT NULL,
+    "start_date" TIMESTAMPTZ NOT NULL,
+    "end_date" TIMESTAMPTZ,
+    "notes" VARCHAR(255),
+    "created_at" TIMESTAMPTZ NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL,
+    "archived_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "search_vector" TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce("description", '')), 'A')
+        || setweight(to_tsvector('simple', coalesce("sector", '')), 'B')
+        || setweight(to_tsvector('simple', coalesce("manager", '')), 'B')
+        || setweight(to_tsvector('simple', coalesce("notes", '')), 'C')
+    ) STORED
+);
+COMMENT ON COLUMN "vacancy_archive"."urgency" IS 'Urgency options';
+COMMENT ON COLUMN "vacancy_archive"."status" IS 'Status options';
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_archive_created_at_id" ON "vacancy_archive" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_archive_search_vector" ON "vacancy_archive" USING GIN ("search_vector");
+        CREATE INDEX IF NOT EXISTS "idx_vacancy_closed_updated_at" ON "vacancy" ("updated_at") WHERE "status" IN ('FINISHED', 'CANCELED');
+        CREATE OR REPLACE VIEW "vacancy_with_archive" AS
+            SELECT "id", "description", "sector", "manager", "salary_expectation", "urgency",
+                   "status", "start_date", "end_date", "notes", "created_at", "updated_at", "search_vector"
+            FROM "vacancy"
+            UNION ALL
+            SELECT "id", "description", "sector", "manager", "salary_expectation", "urgency",
+                   "status", "start_date", "end_date", "notes", "created_at", "updated_at", "search_vector"
+            FROM "vacancy_archive";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP VIEW IF EXISTS "vacancy_with_archive";
+        DROP INDEX IF EXISTS "idx_vacancy_closed_updated_at";
+        DROP TABLE IF EXISTS "vacancy_archive";"""
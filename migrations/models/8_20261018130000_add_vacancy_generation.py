@@ -0,0 +1,31 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "vacancy_generation" (
+    "id" SMALLINT NOT NULL PRIMARY KEY DEFAULT 1 CHECK ("id" = 1),
+    "version" BIGINT NOT NULL DEFAULT 0
+);
+COMMENT ON TABLE "vacancy_generation" IS 'Single row bumped by every statement writing vacancy, used as collection version';
+INSERT INTO "vacancy_generation" ("id", "version") VALUES (1, 0) ON CONFLICT ("id") DO NOTHING;
+CREATE OR REPLACE FUNCTION "vacancy_generation_bump"() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE "vacancy_generation" SET "version" = "version" + 1 WHERE "id" = 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER "vacancy_generation"
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON "vacancy"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_generation_bump"();
+CREATE TRIGGER "vacancy_archive_generation"
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON "vacancy_archive"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_generation_bump"();"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "vacancy_archive_generation" ON "vacancy_archive";
+        DROP TRIGGER IF EXISTS "vacancy_generation" ON "vacancy";
+        DROP FUNCTION IF EXISTS "vacancy_generation_bump"();
+        DROP TABLE IF EXISTS "vacancy_generation";"""
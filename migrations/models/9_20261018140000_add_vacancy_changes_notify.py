@@ -0,0 +1,62 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE OR REPLACE FUNCTION "vacancy_changes_notify"() RETURNS TRIGGER AS $$
+DECLARE
+    changed_ids TEXT;
+BEGIN
+    -- '*' asks the listeners to drop every cached vacancy, TRUNCATE sends it
+    -- from "vacancy_truncate_notify".
+    IF (SELECT count(*) FROM "changed_rows") > 5000 THEN
+        PERFORM pg_notify('vacancy_changes', '*');
+        RETURN NULL;
+    END IF;
+    -- Payloads are limited to 8000 bytes, ids are sent 200 at a time.
+    FOR changed_ids IN
+        SELECT string_agg("id"::TEXT, ',')
+        FROM (SELECT "id", (row_number() OVER () - 1) / 200 AS "chunk" FROM "changed_rows") AS "numbered"
+        GROUP BY "chunk"
+    LOOP
+        PERFORM pg_notify('vacancy_changes', changed_ids);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+CREATE OR REPLACE FUNCTION "vacancy_truncate_notify"() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('vacancy_changes', '*');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+CREATE TRIGGER "vacancy_update_notify"
+    AFTER UPDATE ON "vacancy" REFERENCING OLD TABLE AS "changed_rows"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_changes_notify"();
+CREATE TRIGGER "vacancy_delete_notify"
+    AFTER DELETE ON "vacancy" REFERENCING OLD TABLE AS "changed_rows"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_changes_notify"();
+CREATE TRIGGER "vacancy_truncate_notify"
+    AFTER TRUNCATE ON "vacancy"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_truncate_notify"();
+CREATE TRIGGER "vacancy_archive_update_notify"
+    AFTER UPDATE ON "vacancy_archive" REFERENCING OLD TABLE AS "changed_rows"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_changes_notify"();
+CREATE TRIGGER "vacancy_archive_delete_notify"
+    AFTER DELETE ON "vacancy_archive" REFERENCING OLD TABLE AS "changed_rows"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_changes_notify"();
+CREATE TRIGGER "vacancy_archive_truncate_notify"
+    AFTER TRUNCATE ON "vacancy_archive"
+    FOR EACH STATEMENT EXECUTE FUNCTION "vacancy_truncate_notify"();"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "vacancy_archive_truncate_notify" ON "vacancy_archive";
+        DROP TRIGGER IF EXISTS "vacancy_archive_delete_notify" ON "vacancy_archive";
+        DROP TRIGGER IF EXISTS "vacancy_archive_update_notify" ON "vacancy_archive";
+        DROP TRIGGER IF EXISTS "vacancy_truncate_notify" ON "vacancy";
+        DROP TRIGGER IF EXISTS "vacancy_delete_notify" ON "vacancy";
+        DROP TRIGGER IF EXISTS "vacancy_update_notify" ON "vacancy";
+        DROP FUNCTION IF EXISTS "vacancy_truncate_notify"();
+        DROP FUNCTION IF EXISTS "vacancy_changes_notify"();"""
@@ -1,9 +1,14 @@
-from uuid import uuid4
+import asyncio
+import json
+import sys
+from uuid import UUID, uuid4
 
+import asyncpg
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
+from infra.database.pgdatabase import database_credentials
 from infra.scripts.wait_for_services import clear_database
 from tests.integration.api.v1.vacancy.fake_data import generate_fake_vacancy_data
 
@@ -35,6 +40,45 @@ async def setup_vacancy(request):
     await clear_database()
 
 
+async def backdate_vacancy(vacancy_id: str, days: int) -> None:
+    """
+    Move the last update of a vacancy days into the past, straight in the database.
+    """
+
+    credentials = database_credentials()
+    connection = await asyncpg.connect(
+        **{
+            key: credentials[key]
+            for key in ("host", "port", "user", "password", "database")
+        }
+    )
+
+    try:
+        await connection.execute(
+            'UPDATE "vacancy" SET "updated_at" = now() - make_interval(days => $2) '
+            'WHERE "id" = $1;',
+            UUID(vacancy_id),
+            days,
+        )
+    finally:
+        await connection.close()
+
+
+async def run_archive_job(older_than_days: int) -> None:
+    """
+    Run the archival job the way make archive does, in its own process.
+    """
+
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "infra.scripts.archive_vacancies",
+        "--older-than-days",
+        str(older_than_days),
+    )
+    assert await process.wait() == 0
+
+
 @pytest.mark.asyncio(loop_scope="class")
 class TestGetVacancy:
     """
@@ -82,6 +126,198 @@ class TestGetVacancy:
         assert "status_code" in json_response
         assert "payload" in json_response
 
+    async def test_list_vacancies_with_cursor(self):
+        created_ids = set()
+        for _ in range(6):
+            response = await self.http_client.post(
+                "/vacancy/", json=generate_fake_vacancy_data()
+            )
+            assert response.status_code == 201
+            created_ids.add(response.json()["payload"]["id"])
+
+        first_page = await self.http_client.get("/vacancy/", params={"page_size": 5})
+        assert first_page.status_code == 200
+
+        first_payload = first_page.json()["payload"]
+        assert len(first_payload["data"]) == 5
+        assert first_payload["next_cursor"] is not None
+
+        seen_ids = [v["id"] for v in first_payload["data"]]
+        next_cursor = first_payload["next_cursor"]
+
+        while next_cursor:
+            page = await self.http_client.get(
+                "/vacancy/", params={"page_size": 100, "cursor": next_cursor}
+            )
+            assert page.status_code == 200
+
+            payload = page.json()["payload"]
+            assert payload["total"] == first_payload["total"]
+
+            seen_ids += [v["id"] for v in payload["data"]]
+            next_cursor = payload["next_cursor"]
+
+        assert len(seen_ids) == len(set(seen_ids)) == first_payload["total"]
+        assert created_ids <= set(seen_ids)
+
+    async def test_list_vacancies_total_modes(self):
+        exact = await self.http_client.get("/vacancy/", params={"total_mode": "exact"})
+        assert exact.status_code == 200
+
+        total = exact.json()["payload"]["total"]
+        assert total >= 1
+
+        estimated = await self.http_client.get(
+            "/vacancy/", params={"total_mode": "estimated"}
+        )
+        assert estimated.status_code == 200
+        assert estimated.json()["payload"]["total"] >= 0
+
+        without_total = await self.http_client.get(
+            "/vacancy/", params={"total_mode": "none"}
+        )
+        assert without_total.status_code == 200
+        assert without_total.json()["payload"]["total"] is None
+        assert len(without_total.json()["payload"]["data"]) == min(total, 10)
+
+    async def test_search_vacancies_ranked_by_relevance(self):
+        term = f"kotlin{uuid4().hex[:8]}"
+
+        best_match = generate_fake_vacancy_data()
+        best_match["description"] = f"Backend {term} developer"
+        best_match["notes"] = term
+
+        partial_match = generate_fake_vacancy_data()
+        partial_match["description"] = "Mobile developer"
+        partial_match["notes"] = f"Some {term} knowledge"
+
+        for payload in (partial_match, best_match):
+            response = await self.http_client.post("/vacancy/", json=payload)
+            assert response.status_code == 201
+
+        response = await self.http_client.get("/vacancy/", params={"search": term})
+        assert response.status_code == 200
+
+        payload = response.json()["payload"]
+        assert payload["total"] == 2
+        assert payload["data"][0]["description"] == best_match["description"]
+
+    async def test_search_vacancies_rejects_cursor(self):
+        first_page = await self.http_client.get("/vacancy/", params={"page_size": 5})
+        vacancy = first_page.json()["payload"]["data"][0]
+
+        response = await self.http_client.get(
+            "/vacancy/", params={"search": vacancy["sector"], "cursor": "abc"}
+        )
+        assert response.status_code == 400
+
+    async def test_list_vacancies_invalid_cursor(self):
+        response = await self.http_client.get(
+            "/vacancy/", params={"cursor": "not-a-valid-cursor"}
+        )
+        assert response.status_code == 400
+
+    async def test_export_vacancies_as_csv(self):
+        listing = await self.http_client.get("/vacancy/", params={"page_size": 5})
+        total = listing.json()["payload"]["total"]
+
+        response = await self.http_client.get(
+            "/vacancy/export/", params={"format": "csv"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        lines = response.text.splitlines()
+        assert lines[0].startswith("id,description,sector")
+        assert len(lines) == total + 1
+
+    async def test_export_vacancies_as_csv_without_matches(self):
+        response = await self.http_client.get(
+            "/vacancy/export/",
+            params={"format": "csv", "search": f"nomatch{uuid4().hex}"},
+        )
+        assert response.status_code == 200
+        assert response.text.splitlines() == [
+            "id,description,sector,manager,salary_expectation,urgency,status,"
+            "start_date,end_date,notes,created_at,updated_at"
+        ]
+
+    async def test_export_vacancies_as_ndjson_with_search(self):
+        term = f"kotlin{uuid4().hex[:8]}"
+
+        payload_input = generate_fake_vacancy_data()
+        payload_input["description"] = f"Backend {term} developer"
+
+        response = await self.http_client.post("/vacancy/", json=payload_input)
+        assert response.status_code == 201
+        vacancy_id = response.json()["payload"]["id"]
+
+        response = await self.http_client.get(
+            "/vacancy/export/", params={"format": "ndjson", "search": term}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == [vacancy_id]
+
+    async def test_export_vacancies_invalid_format(self):
+        response = await self.http_client.get(
+            "/vacancy/export/", params={"format": "xlsx"}
+        )
+        assert response.status_code == 422
+
+    async def test_get_vacancy_not_modified(self):
+        response = await self.http_client.get(f"/vacancy/{self.vacancy_id}/")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await self.http_client.get(
+            f"/vacancy/{self.vacancy_id}/", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = await self.http_client.patch(
+            f"/vacancy/{self.vacancy_id}/status/", params={"vacancy_status": "FINISHED"}
+        )
+        assert response.status_code == 200
+
+        response = await self.http_client.get(
+            f"/vacancy/{self.vacancy_id}/", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_list_vacancies_not_modified(self):
+        params = {"page_size": 5}
+
+        response = await self.http_client.get("/vacancy/", params=params)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await self.http_client.get(
+            "/vacancy/", params=params, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        response = await self.http_client.get(
+            "/vacancy/", params={"page_size": 10}, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        response = await self.http_client.post(
+            "/vacancy/", json=generate_fake_vacancy_data()
+        )
+        assert response.status_code == 201
+
+        response = await self.http_client.get(
+            "/vacancy/", params=params, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
     async def test_get_vacancy_wrong_id(self):
 
         response = await self.http_client.get("/vacancy/serigubsodfgiubs/")
@@ -94,6 +330,83 @@ class TestGetVacancy:
         response = await self.http_client.get(f"/vacancy/{random_id}/")
         assert response.status_code == 404
 
+        response = await self.http_client.get(
+            f"/vacancy/{random_id}/", params={"include_archived": True}
+        )
+        assert response.status_code == 404
+
+    async def test_get_vacancy_including_archived(self):
+        response = await self.http_client.get(
+            f"/vacancy/{self.vacancy_id}/", params={"include_archived": True}
+        )
+        assert response.status_code == 200
+        assert response.json()["payload"]["id"] == self.vacancy_id
+
+    async def test_list_vacancies_including_archived(self):
+        hot = await self.http_client.get("/vacancy/", params={"page_size": 5})
+        assert hot.status_code == 200
+
+        with_archive = await self.http_client.get(
+            "/vacancy/", params={"page_size": 5, "include_archived": True}
+        )
+        assert with_archive.status_code == 200
+
+        with_archive_payload = with_archive.json()["payload"]
+        assert with_archive_payload["total"] >= hot.json()["payload"]["total"]
+
+        seen_ids = [v["id"] for v in with_archive_payload["data"]]
+
+        if with_archive_payload["next_cursor"]:
+            next_page = await self.http_client.get(
+                "/vacancy/",
+                params={
+                    "page_size": 5,
+                    "include_archived": True,
+                    "cursor": with_archive_payload["next_cursor"],
+                },
+            )
+            assert next_page.status_code == 200
+            seen_ids += [v["id"] for v in next_page.json()["payload"]["data"]]
+
+        assert len(seen_ids) == len(set(seen_ids))
+
+    async def test_archived_vacancy_is_only_read_with_include_archived(self):
+        term = f"archived{uuid4().hex[:8]}"
+
+        payload_input = generate_fake_vacancy_data()
+        payload_input["description"] = f"Closed {term} vacancy"
+
+        response = await self.http_client.post("/vacancy/", json=payload_input)
+        assert response.status_code == 201
+        vacancy_id = response.json()["payload"]["id"]
+
+        response = await self.http_client.patch(
+            f"/vacancy/{vacancy_id}/status/", params={"vacancy_status": "FINISHED"}
+        )
+        assert response.status_code == 200
+
+        await backdate_vacancy(vacancy_id, days=400)
+        await run_archive_job(older_than_days=365)
+
+        response = await self.http_client.get(f"/vacancy/{vacancy_id}/")
+        assert response.status_code == 404
+
+        response = await self.http_client.get(
+            f"/vacancy/{vacancy_id}/", params={"include_archived": True}
+        )
+        assert response.status_code == 200
+        assert response.json()["payload"]["status"] == "FINISHED"
+
+        hot = await self.http_client.get("/vacancy/", params={"search": term})
+        assert hot.status_code == 200
+        assert hot.json()["payload"]["data"] == []
+
+        with_archive = await self.http_client.get(
+            "/vacancy/", params={"search": term, "include_archived": True}
+        )
+        assert with_archive.status_code == 200
+        assert [v["id"] for v in with_archive.json()["payload"]["data"]] == [vacancy_id]
+
 
 @pytest.mark.asyncio(loop_scope="class")
 class TestSystemStatusEndpoint:
@@ -138,6 +451,8 @@ class TestDownloadSummaryEndpoint:
         )
 
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
 
     async def test_not_found_download_summary(self):
         response = await self.http_client.get(
@@ -145,3 +460,39 @@ class TestDownloadSummaryEndpoint:
         )
 
         assert response.status_code == 404
+
+    async def test_summary_report_job(self):
+        response = await self.http_client.post(
+            "/vacancy/summary/jobs/", params={"sector": "IT"}
+        )
+        assert response.status_code == 202
+
+        job = response.json()["payload"]
+        assert response.headers["location"].endswith(f"/summary/jobs/{job['id']}/")
+
+        for _ in range(100):
+            response = await self.http_client.get(f"/vacancy/summary/jobs/{job['id']}/")
+            assert response.status_code == 200
+
+            job = response.json()["payload"]
+            if job["status"] in ("DONE", "FAILED"):
+                break
+            await asyncio.sleep(0.1)
+
+        assert job["status"] == "DONE"
+        assert job["progress"] == 1.0
+
+        response = await self.http_client.get(
+            f"/vacancy/summary/jobs/{job['id']}/download/"
+        )
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+
+    async def test_summary_report_job_not_found(self):
+        response = await self.http_client.post(
+            "/vacancy/summary/jobs/", params={"sector": "asrgrçksudbfgd"}
+        )
+        assert response.status_code == 404
+
+        response = await self.http_client.get(f"/vacancy/summary/jobs/{uuid4()}/")
+        assert response.status_code == 404
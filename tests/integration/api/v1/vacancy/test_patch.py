@@ -62,6 +62,74 @@ class TestPatchVacancy:
 
         assert payload["status"] == status_to_insert
 
+    async def test_bulk_change_vacancy_status_by_ids(self):
+        non_existent_id = str(uuid4())
+
+        response = await self.http_client.patch(
+            "/vacancy/bulk/status/",
+            json={
+                "status": "CANCELED",
+                "ids": [self.vacancy_id, non_existent_id],
+                "notes": "Hiring freeze",
+            },
+        )
+        assert response.status_code == 200
+
+        payload = response.json()["payload"]
+        assert payload["updated"] == [self.vacancy_id]
+        assert payload["missing"] == [non_existent_id]
+
+        response = await self.http_client.get(f"/vacancy/{self.vacancy_id}/")
+        vacancy = response.json()["payload"]
+        assert vacancy["status"] == "CANCELED"
+        assert vacancy["notes"] == "Hiring freeze"
+
+    async def test_bulk_change_vacancy_status_by_filters(self):
+        payload_input = generate_fake_vacancy_data()
+        payload_input["sector"] = f"Sector {uuid4()}"
+        payload_input["status"] = "IN_PROGRESS"
+
+        response = await self.http_client.post("/vacancy/", json=payload_input)
+        assert response.status_code == 201
+        vacancy_id = response.json()["payload"]["id"]
+
+        response = await self.http_client.patch(
+            "/vacancy/bulk/status/",
+            json={
+                "status": "FINISHED",
+                "filters": {"sector": payload_input["sector"].lower()},
+            },
+        )
+        assert response.status_code == 200
+
+        payload = response.json()["payload"]
+        assert payload["updated"] == [vacancy_id]
+        assert payload["missing"] == []
+
+    async def test_bulk_change_vacancy_status_keeps_notes_when_blank(self):
+        response = await self.http_client.patch(
+            "/vacancy/bulk/status/",
+            json={"status": "CANCELED", "ids": [self.vacancy_id], "notes": "Kept"},
+        )
+        assert response.status_code == 200
+
+        response = await self.http_client.patch(
+            "/vacancy/bulk/status/",
+            json={"status": "FINISHED", "ids": [self.vacancy_id], "notes": ""},
+        )
+        assert response.status_code == 200
+
+        response = await self.http_client.get(f"/vacancy/{self.vacancy_id}/")
+        vacancy = response.json()["payload"]
+        assert vacancy["status"] == "FINISHED"
+        assert vacancy["notes"] == "Kept"
+
+    async def test_bulk_change_vacancy_status_without_selector(self):
+        response = await self.http_client.patch(
+            "/vacancy/bulk/status/", json={"status": "FINISHED"}
+        )
+        assert response.status_code == 422
+
     async def test_patch_status_invalid_id_format(self):
         response = await self.http_client.patch(
             "/vacancy/invalid_id/status/", params={"vacancy_status": "CANCELED"}
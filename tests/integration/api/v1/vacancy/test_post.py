@@ -1,3 +1,6 @@
+import json
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
 
@@ -56,6 +59,103 @@ class TestPostVacancy:
         assert "status_code" in json_response
         assert "payload" in json_response
 
+    async def test_simulate_costs_breakdown_by_sector(self):
+        payload_input = generate_fake_vacancy_data()
+        payload_input["status"] = "IN_PROGRESS"
+
+        response = await self.http_client.post("/vacancy/", json=payload_input)
+        assert response.status_code == 201
+
+        response = await self.http_client.post(
+            "/vacancy/simulate-costs/", json={"period": "MONTHLY"}
+        )
+        assert response.status_code == 200
+
+        payload = response.json()["payload"]
+        breakdown = payload["breakdown"]
+
+        assert payload["vacancy_count"] == sum(s["vacancy_count"] for s in breakdown)
+        assert payload["estimated_cost"] == pytest.approx(
+            sum(s["estimated_cost"] for s in breakdown)
+        )
+        assert payload_input["sector"].lower() in [s["sector"] for s in breakdown]
+
+    async def test_simulate_costs_follows_vacancy_writes(self):
+        payload_input = generate_fake_vacancy_data()
+        payload_input["sector"] = f"Sector {uuid4()}"
+        payload_input["status"] = "IN_PROGRESS"
+
+        response = await self.http_client.post("/vacancy/", json=payload_input)
+        assert response.status_code == 201
+        vacancy_id = response.json()["payload"]["id"]
+
+        simulation_input = {
+            "sector": payload_input["sector"].upper(),
+            "period": "ANNUAL",
+        }
+
+        response = await self.http_client.post(
+            "/vacancy/simulate-costs/", json=simulation_input
+        )
+        payload = response.json()["payload"]
+        assert payload["vacancy_count"] == 1
+        assert payload["estimated_cost"] == pytest.approx(
+            payload_input["salary_expectation"] * 12
+        )
+
+        response = await self.http_client.patch(
+            f"/vacancy/{vacancy_id}/status/", params={"vacancy_status": "CANCELED"}
+        )
+        assert response.status_code == 200
+
+        response = await self.http_client.post(
+            "/vacancy/simulate-costs/", json=simulation_input
+        )
+        payload = response.json()["payload"]
+        assert payload["vacancy_count"] == 0
+        assert payload["estimated_cost"] == 0.0
+
+    async def test_bulk_create_vacancies_json_array(self):
+        payload = [generate_fake_vacancy_data() for _ in range(3)]
+        payload[1]["description"] = "dRoP TABLE employees"
+
+        response = await self.http_client.post("/vacancy/bulk/", json=payload)
+        assert response.status_code == 207
+
+        bulk_result = response.json()["payload"]
+        assert bulk_result["total"] == 3
+        assert bulk_result["created"] == 2
+        assert bulk_result["failed"] == 1
+        assert [r["status"] for r in bulk_result["results"]] == [
+            "CREATED",
+            "FAILED",
+            "CREATED",
+        ]
+
+        created_id = bulk_result["results"][0]["id"]
+        response = await self.http_client.get(f"/vacancy/{created_id}/")
+        assert response.status_code == 200
+
+    async def test_bulk_create_vacancies_ndjson(self):
+        lines = [json.dumps(generate_fake_vacancy_data()) for _ in range(5)]
+
+        response = await self.http_client.post(
+            "/vacancy/bulk/",
+            content="\n".join(lines),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert response.status_code == 201
+
+        bulk_result = response.json()["payload"]
+        assert bulk_result["created"] == 5
+        assert all(r["id"] for r in bulk_result["results"])
+
+    async def test_bulk_create_vacancies_invalid_body(self):
+        response = await self.http_client.post(
+            "/vacancy/bulk/", json=generate_fake_vacancy_data()
+        )
+        assert response.status_code == 400
+
     async def test_create_vacancy_missing_field(self):
         payload = generate_fake_vacancy_data()
 
@@ -82,6 +82,14 @@ class TestUpdateVacancy:
         response = await self.http_client.get(f"/vacancy/{random_id}/")
         assert response.status_code == 404
 
+    async def test_update_vacancy_put_not_found(self):
+        random_id = str(uuid4())
+
+        response = await self.http_client.put(
+            f"/vacancy/{random_id}/", json=generate_fake_vacancy_data()
+        )
+        assert response.status_code == 404
+
     async def test_update_vacancy_missing_field(self):
         payload = generate_fake_vacancy_data()
         del payload["manager"]
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from application.dto.pagination import PaginationResponse
+from application.dto.vacancy import VacancyOutput
+
+SECTORS = ["IT", "RH", "Finance", "Legal", "Sales", "Support"]
+
+
+class FakeClock:
+    """
+    Stand-in for time.monotonic or time.time that only moves when told to.
+    """
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class FakeVacancyRepository:
+    """
+    In-memory stand-in for the vacancy repository, counting its reads and listings.
+    Every write bumps version, which is returned with each vacancy and page.
+    Each known sector has a summary of one vacancy.
+    """
+
+    def __init__(self):
+        self.reads = 0
+        self.listings = 0
+        self.version = 1
+        self.sectors = SECTORS
+
+    async def get_collection_version(self):
+        return self.version
+
+    async def get_vacancy_by_id(self, vacancy_id, include_archived=False):
+        self.reads += 1
+        return {
+            "id": vacancy_id,
+            "version": self.version,
+            "include_archived": include_archived,
+        }
+
+    async def edit_vacancy_status(
+        self, vacancy_id, vacancy_status, optional_notes=None
+    ):
+        self.version += 1
+        return {
+            "id": vacancy_id,
+            "version": self.version,
+            "status": vacancy_status,
+            "notes": optional_notes,
+        }
+
+    async def list_vacancies(self, pagination):
+        self.listings += 1
+        return PaginationResponse(
+            data=[{"version": self.version, "page": pagination.page}], total=1
+        )
+
+    async def get_sector_summary_fingerprint(self, sector):
+        known = sector.lower() in {name.lower() for name in self.sectors}
+        return (1, self.version) if known else (0, self.version)
+
+    async def get_summary_of_vacancies_by_sector(self, sector):
+        now = datetime.now(timezone.utc)
+        await asyncio.sleep(0)
+
+        return [
+            VacancyOutput(
+                id=uuid4(),
+                description=f"Vacancy of {sector}",
+                sector=sector,
+                manager=f"Manager of {sector}",
+                salary_expectation=1000.0,
+                urgency=1,
+                status="IN_PROGRESS",
+                start_date=now,
+                end_date=now,
+                notes=None,
+                created_at=now,
+                updated_at=now,
+            )
+        ]
+
+
+@pytest.fixture
+def vacancy_repository() -> FakeVacancyRepository:
+    return FakeVacancyRepository()
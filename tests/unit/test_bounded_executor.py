@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+import pytest
+
+from application.errors.media import RenderQueueFull
+from utils.executor_utils import BoundedExecutor
+
+
+@pytest.mark.asyncio
+class TestBoundedExecutor:
+    """
+    Test class for running blocking work off the event loop with a bounded queue.
+    """
+
+    async def test_runs_work_off_the_event_loop(self):
+        executor = BoundedExecutor(kind="thread", max_workers=1, max_queue=0)
+
+        try:
+            assert await executor.run(threading.get_ident) != threading.get_ident()
+            assert executor.pending == 0
+        finally:
+            executor.shutdown()
+
+    async def test_refuses_work_over_the_queue_limit(self):
+        executor = BoundedExecutor(kind="thread", max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        try:
+            running = [
+                asyncio.create_task(executor.run(release.wait)) for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(RenderQueueFull):
+                await executor.run(release.wait)
+
+            release.set()
+            assert await asyncio.gather(*running) == [True, True]
+            assert executor.pending == 0
+        finally:
+            release.set()
+            executor.shutdown()
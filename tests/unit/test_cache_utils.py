@@ -0,0 +1,80 @@
+from utils.cache_utils import TTLCache
+
+
+class TestTTLCache:
+    """
+    Test class for the bounded LRU + TTL cache.
+    """
+
+    def test_counts_hits_and_misses(self, clock):
+        cache = TTLCache(max_size=2, ttl=10, clock=clock)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_entries_expire_after_ttl(self, clock):
+        cache = TTLCache(max_size=2, ttl=10, clock=clock)
+
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(max_size=2, ttl=10, clock=clock)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_invalidate_drops_keys(self, clock):
+        cache = TTLCache(max_size=2, ttl=10, clock=clock)
+
+        cache.set("a", 1)
+        cache.invalidate("a", "missing")
+
+        assert cache.get("a") is None
+        assert cache.stats.invalidations == 1
+
+    def test_set_skips_values_loaded_before_an_invalidation(self, clock):
+        cache = TTLCache(max_size=2, ttl=10, clock=clock)
+
+        generation = cache.generation
+        cache.invalidate("a")
+        cache.set("a", "stale", generation)
+
+        assert cache.get("a") is None
+
+        cache.set("a", "fresh", cache.generation)
+        assert cache.get("a") == "fresh"
+
+    def test_evicts_until_under_the_byte_budget(self, clock):
+        cache = TTLCache(max_size=10, ttl=10, max_bytes=10, clock=clock)
+
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.set("a", b"123")
+        cache.set("c", b"12345")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"123"
+        assert cache.bytes == 8
+        assert cache.stats.evictions == 1
+
+        cache.set("huge", b"x" * 11)
+        assert cache.get("huge") is None
+        assert cache.bytes == 8
@@ -0,0 +1,114 @@
+from uuid import uuid4
+
+import pytest
+
+from adapters.repositories.cached_vacancy_repository import (
+    CachedVacancyRepository,
+    evict_vacancies,
+    flush_vacancies,
+)
+from application.dto.vacancy import StatusToUpdate
+from infra.database.routing import (
+    PRIMARY_CONNECTION,
+    REPLICA_CONNECTION,
+    ConnectionRouter,
+)
+from utils.cache_utils import TTLCache
+
+
+def route_reads(vacancy_repository, clock) -> list[str]:
+    """
+    Record the connection each read of the fake repository would be routed to.
+    """
+
+    router = ConnectionRouter(replica=REPLICA_CONNECTION, clock=clock)
+    connections = []
+    get_vacancy_by_id = vacancy_repository.get_vacancy_by_id
+
+    async def routed_get_vacancy_by_id(vacancy_id, include_archived=False):
+        connections.append(router.read_connection_name())
+        return await get_vacancy_by_id(vacancy_id, include_archived)
+
+    vacancy_repository.get_vacancy_by_id = routed_get_vacancy_by_id
+    return connections
+
+
+@pytest.mark.asyncio
+class TestCachedVacancyRepository:
+    """
+    Test class for the caching decorator of the vacancy repository.
+    """
+
+    async def test_repeated_reads_are_served_from_cache(self, vacancy_repository):
+        repository = CachedVacancyRepository(
+            vacancy_repository, TTLCache(max_size=8, ttl=60)
+        )
+        vacancy_id = str(uuid4())
+
+        for _ in range(3):
+            await repository.get_vacancy_by_id(vacancy_id)
+
+        assert vacancy_repository.reads == 1
+        assert repository.cache.stats.hits == 2
+
+    async def test_archived_reads_are_cached_apart(self, vacancy_repository):
+        repository = CachedVacancyRepository(
+            vacancy_repository, TTLCache(max_size=8, ttl=60)
+        )
+        vacancy_id = str(uuid4())
+
+        hot = await repository.get_vacancy_by_id(vacancy_id)
+        with_archive = await repository.get_vacancy_by_id(vacancy_id, True)
+
+        assert not hot["include_archived"]
+        assert with_archive["include_archived"]
+        assert vacancy_repository.reads == 2
+
+    async def test_writes_invalidate_the_vacancy(self, vacancy_repository):
+        repository = CachedVacancyRepository(
+            vacancy_repository, TTLCache(max_size=8, ttl=60)
+        )
+        vacancy_id = str(uuid4())
+
+        await repository.get_vacancy_by_id(vacancy_id)
+        await repository.edit_vacancy_status(vacancy_id, StatusToUpdate.finished)
+        vacancy = await repository.get_vacancy_by_id(vacancy_id.upper())
+
+        assert vacancy["version"] == 2
+        assert vacancy_repository.reads == 2
+
+    async def test_evicted_vacancies_are_reloaded_from_primary(
+        self, vacancy_repository, clock
+    ):
+        connections = route_reads(vacancy_repository, clock)
+        repository = CachedVacancyRepository(
+            vacancy_repository, TTLCache(max_size=8, ttl=60)
+        )
+        vacancy_id = str(uuid4())
+
+        await repository.get_vacancy_by_id(vacancy_id)
+        evict_vacancies(repository.cache, vacancy_id)
+        await repository.get_vacancy_by_id(vacancy_id)
+        await repository.get_vacancy_by_id(vacancy_id)
+        await repository.get_vacancy_by_id(str(uuid4()))
+
+        assert connections == [
+            REPLICA_CONNECTION,
+            PRIMARY_CONNECTION,
+            REPLICA_CONNECTION,
+        ]
+
+    async def test_misses_after_a_flush_are_read_from_primary(
+        self, vacancy_repository, clock
+    ):
+        connections = route_reads(vacancy_repository, clock)
+        cache = TTLCache(max_size=8, ttl=60, clock=clock)
+        repository = CachedVacancyRepository(vacancy_repository, cache)
+
+        flush_vacancies(cache)
+        await repository.get_vacancy_by_id(str(uuid4()))
+
+        clock.now = 60
+        await repository.get_vacancy_by_id(str(uuid4()))
+
+        assert connections == [PRIMARY_CONNECTION, REPLICA_CONNECTION]
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from infra.database.routing import (
+    PRIMARY_CONNECTION,
+    REPLICA_CONNECTION,
+    ConnectionRouter,
+    read_from_primary,
+    start_session,
+)
+
+# A wall clock reading, a session that never wrote is far older than the window.
+NOW = 1_000.0
+
+
+async def run_in_new_context(function):
+    """
+    Run the function in its own task, so it gets a fresh copy of the context
+    just like every request does.
+    """
+
+    async def wrapper():
+        return function()
+
+    return await asyncio.create_task(wrapper())
+
+
+@pytest.mark.asyncio
+class TestConnectionRouter:
+    """
+    Test class for routing vacancy reads and writes between primary and replica.
+    """
+
+    async def test_reads_use_primary_without_replica(self):
+        router = ConnectionRouter(replica=None)
+
+        def scenario():
+            start_session()
+            return router.read_connection_name()
+
+        assert await run_in_new_context(scenario) == PRIMARY_CONNECTION
+
+    async def test_reads_use_replica_and_writes_use_primary(self):
+        router = ConnectionRouter(replica=REPLICA_CONNECTION)
+
+        def scenario():
+            start_session()
+            return router.read_connection_name(), router.write_connection_name()
+
+        assert await run_in_new_context(scenario) == (
+            REPLICA_CONNECTION,
+            PRIMARY_CONNECTION,
+        )
+
+    async def test_session_reads_its_own_writes_for_a_window(self, clock):
+        clock.now = NOW
+        router = ConnectionRouter(
+            replica=REPLICA_CONNECTION, read_your_writes_seconds=5, clock=clock
+        )
+
+        def scenario():
+            session = start_session()
+            router.write_connection_name()
+            right_after_write = router.read_connection_name()
+
+            clock.now += 6
+            after_window = router.read_connection_name()
+
+            return session.last_write_at, right_after_write, after_window
+
+        last_write_at, right_after_write, after_window = await run_in_new_context(
+            scenario
+        )
+
+        assert last_write_at == NOW
+        assert right_after_write == PRIMARY_CONNECTION
+        assert after_window == REPLICA_CONNECTION
+
+    async def test_session_restored_from_previous_write(self, clock):
+        clock.now = NOW
+        router = ConnectionRouter(
+            replica=REPLICA_CONNECTION, read_your_writes_seconds=5, clock=clock
+        )
+
+        def scenario():
+            start_session(last_write_at=clock.now - 1)
+            return router.read_connection_name()
+
+        assert await run_in_new_context(scenario) == PRIMARY_CONNECTION
+
+    async def test_other_sessions_are_not_pinned(self, clock):
+        clock.now = NOW
+        router = ConnectionRouter(
+            replica=REPLICA_CONNECTION, read_your_writes_seconds=5, clock=clock
+        )
+
+        def writer():
+            start_session()
+            router.write_connection_name()
+
+        def reader():
+            start_session()
+            return router.read_connection_name()
+
+        await run_in_new_context(writer)
+
+        assert await run_in_new_context(reader) == REPLICA_CONNECTION
+
+    async def test_reads_inside_read_from_primary_use_primary(self, clock):
+        clock.now = NOW
+        router = ConnectionRouter(replica=REPLICA_CONNECTION, clock=clock)
+
+        def scenario():
+            start_session()
+            with read_from_primary():
+                inside = router.read_connection_name()
+
+            return inside, router.read_connection_name()
+
+        assert await run_in_new_context(scenario) == (
+            PRIMARY_CONNECTION,
+            REPLICA_CONNECTION,
+        )
@@ -0,0 +1,168 @@
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from application.dto.vacancy import VacancyInput
+from application.errors.database import SQLInjectionDetected
+from infra.database.pgdatabase import Status, Urgency
+from utils.database_utils import (
+    MEMOIZED_INPUT_MAX_LENGTH,
+    SQL_STATEMENT_KEYWORDS,
+    is_sql_statement,
+    is_suspicious_input,
+    validate_no_sql_commands,
+)
+
+HANDWRITTEN_CORPUS = [
+    "",
+    "   ",
+    "IT",
+    "Finance",
+    "Walter White",
+    "Alternative investments",
+    "Recreate the selection process",
+    "Updated onboarding; dropdown menus",
+    "Start date to be confirmed",
+    "Backend developer, Python and PostgreSQL",
+    "Vaga para desenvolvedor; alterar escopo depois",
+    "'; DROP TABLE vacancy; --",
+    "1; DELETE FROM vacancy",
+    "SELECT * FROM vacancy",
+    "select id from vacancy where 1=1",
+    "  -- comment\n  UPDATE vacancy SET sector = 'x'",
+    "/* comment */ insert into vacancy values (1)",
+    "WITH a AS (SELECT 1) SELECT * FROM a",
+    "with a as (select 1) delete from vacancy",
+    "CREATE OR REPLACE FUNCTION f() RETURNS int",
+    "truncate vacancy",
+    "commit",
+    "ROLLBACK",
+    "start transaction",
+    "merge into vacancy using x on true",
+    "0xFFselect 1",
+    "ſelect 1",
+    "ınsert into vacancy values (1)",
+    "ﬆart transaction",
+    "selectͅ 1",
+    "selectß",
+    "select$ 1",
+    "x.select",
+    "drop",
+    "Manager; drop",
+    "$$select 1$$",
+    "'select 1'",
+    '"select" 1',
+    "Selection process",
+    "Update the roadmap",
+    "x GO select 1",
+    "x go select 1",
+    "Google; update later",
+    "note # hint\nselect 1",
+    "note -- hint\nselect 1",
+    "# hint\nselect 1",
+    "\u2003\tselect 1",
+]
+
+FRAGMENTS = [
+    *SQL_STATEMENT_KEYWORDS,
+    *(keyword.lower() for keyword in SQL_STATEMENT_KEYWORDS),
+    *(keyword.title() for keyword in SQL_STATEMENT_KEYWORDS),
+    "WITH",
+    "GO",
+    "go",
+    "# ",
+    "OR REPLACE",
+    "a AS (SELECT 1)",
+    "vacancy",
+    "Walter",
+    "IT",
+    "0x1F",
+    "1",
+    "x",
+    "$",
+    "#",
+    "_",
+    ".",
+    "(",
+    ")",
+    "'",
+    '"',
+    ";",
+    " ",
+    "\n",
+    "--",
+    "/*",
+    "*/",
+    "ß",
+    "ſ",
+    "ı",
+    "ͅ",
+]
+
+
+def generated_corpus(amount: int, seed: int = 2026) -> list[str]:
+    """
+    Random texts glued from keywords, their variants and separators.
+    """
+
+    generator = random.Random(seed)
+
+    return [
+        "".join(generator.choices(FRAGMENTS, k=generator.randint(1, 8)))
+        for _ in range(amount)
+    ]
+
+
+def build_vacancy_input(**overrides) -> VacancyInput:
+    return VacancyInput(
+        **{
+            "description": "Backend developer",
+            "sector": "IT",
+            "manager": "Walter White",
+            "salary_expectation": 5000,
+            "urgency": Urgency.medium,
+            "status": Status.in_progress,
+            "start_date": datetime.now(timezone.utc),
+            "notes": None,
+            **overrides,
+        }
+    )
+
+
+class TestSQLScreening:
+    """
+    Test class for the SQL injection screening of input fields.
+    """
+
+    @pytest.mark.parametrize("text", HANDWRITTEN_CORPUS)
+    def test_flags_same_handwritten_inputs_as_full_parse(self, text):
+        assert is_suspicious_input(text) == is_sql_statement(text)
+
+    def test_flags_same_generated_inputs_as_full_parse(self):
+        corpus = generated_corpus(5000)
+        mismatches = [
+            text
+            for text in corpus
+            if is_suspicious_input(text) != is_sql_statement(text)
+        ]
+
+        assert mismatches == []
+        # The corpus must exercise both outcomes to prove anything.
+        assert any(is_sql_statement(text) for text in corpus)
+        assert not all(is_sql_statement(text) for text in corpus)
+
+    def test_long_texts_are_screened_without_memoizing(self):
+        padding = "x" * MEMOIZED_INPUT_MAX_LENGTH
+
+        assert is_suspicious_input(f"select 1 -- {padding}") is True
+        assert is_suspicious_input(f"Alternative {padding}") is False
+
+    def test_validate_reports_the_offending_field(self):
+        vacancy_input = build_vacancy_input(manager="'; DROP TABLE vacancy; --")
+
+        with pytest.raises(SQLInjectionDetected, match="Field 'manager'"):
+            validate_no_sql_commands(vacancy_input)
+
+    def test_validate_accepts_clean_input(self):
+        validate_no_sql_commands(build_vacancy_input(notes="Alternative schedule"))
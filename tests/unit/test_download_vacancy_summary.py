@@ -0,0 +1,114 @@
+import asyncio
+import base64
+import re
+import zlib
+
+import pytest
+
+from adapters.libs.reportlab_adapter import ReportLabAdapter
+from domain.usecases.download_vacancy_summary import DownloadVacancySummaryUseCase
+from utils.cache_utils import TTLCache
+from utils.executor_utils import BoundedExecutor
+
+
+def pdf_text(content: bytes) -> bytes:
+    """
+    Decode the ASCII85 + Flate content streams written by ReportLab,
+    so the drawn text can be searched.
+    """
+
+    streams = re.findall(rb"stream\r?\n(.*?)~>\s*endstream", content, re.DOTALL)
+
+    return b"".join(
+        zlib.decompress(base64.a85decode(stream.replace(b"\n", b"")))
+        for stream in streams
+    )
+
+
+class CountingAdapter(ReportLabAdapter):
+    """
+    ReportLabAdapter counting how many PDFs it rendered.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.renders = 0
+
+    def generate_pdf(self, vacancies):
+        self.renders += 1
+        return super().generate_pdf(vacancies)
+
+
+@pytest.mark.asyncio
+class TestDownloadVacancySummary:
+    """
+    Test class for rendering sector summaries concurrently.
+    """
+
+    async def test_parallel_downloads_return_their_own_sector(self, vacancy_repository):
+        sectors = vacancy_repository.sectors
+        executor = BoundedExecutor(kind="thread", max_workers=len(sectors), max_queue=0)
+        use_case = DownloadVacancySummaryUseCase(
+            vacancy_repository, ReportLabAdapter(), executor
+        )
+
+        try:
+            responses = await asyncio.gather(
+                *(use_case.execute(sector=sector) for sector in sectors)
+            )
+        finally:
+            executor.shutdown()
+
+        for sector, response in zip(sectors, responses):
+            assert response.status_code == 200
+            assert response.media.file_name == f"vacancy_summary_{sector}.pdf"
+
+            content = response.media.content
+            assert content.startswith(b"%PDF")
+
+            text = pdf_text(content)
+            assert f"Manager of {sector}".encode() in text
+            for other_sector in set(sectors) - {sector}:
+                assert f"Manager of {other_sector}".encode() not in text
+
+    async def test_unchanged_sectors_are_served_from_cache(self, vacancy_repository):
+        adapter = CountingAdapter()
+        executor = BoundedExecutor(kind="thread", max_workers=1, max_queue=0)
+        use_case = DownloadVacancySummaryUseCase(
+            vacancy_repository,
+            adapter,
+            executor,
+            TTLCache(max_size=8, ttl=60, max_bytes=10**6),
+        )
+
+        try:
+            first = await use_case.execute(sector="IT")
+            again = await use_case.execute(sector="it")
+            assert again.media.content == first.media.content
+            assert adapter.renders == 1
+
+            vacancy_repository.version += 1
+            await use_case.execute(sector="IT")
+            assert adapter.renders == 2
+
+            missing = await use_case.execute(sector="Unknown")
+            assert missing.status_code == 404
+            assert adapter.renders == 2
+        finally:
+            executor.shutdown()
+
+    async def test_large_reports_are_drawn_on_the_canvas(self, vacancy_repository):
+        vacancies = await vacancy_repository.get_summary_of_vacancies_by_sector("IT")
+        vacancies = [
+            vacancy.model_copy(update={"manager": f"Manager {index}"})
+            for index, vacancy in enumerate(vacancies * 120)
+        ]
+
+        small = ReportLabAdapter(large_report_rows=1000).generate_pdf(vacancies)
+        large = ReportLabAdapter(large_report_rows=100).generate_pdf(vacancies)
+
+        for content in (small, large):
+            text = pdf_text(content)
+            assert content.count(b"/Type /Page\n") == 4
+            assert b"(Manager 0)" in text and b"(Manager 119)" in text
+            assert b"($120000.00)" in text
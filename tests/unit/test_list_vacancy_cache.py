@@ -0,0 +1,33 @@
+import pytest
+
+from application.dto.pagination import Pagination
+from domain.usecases.list_vacancy import ListVacancyUseCase
+from utils.cache_utils import TTLCache
+
+
+@pytest.mark.asyncio
+class TestListVacancyCache:
+    """
+    Test class for caching listing pages by collection version.
+    """
+
+    async def test_pages_are_cached_until_the_version_changes(self, vacancy_repository):
+        cache = TTLCache(max_size=8, ttl=60)
+        use_case = ListVacancyUseCase(vacancy_repository, cache)
+
+        first = await use_case.execute(Pagination())
+        assert (await use_case.execute(Pagination())).payload == first.payload
+        assert (await use_case.execute(Pagination(search=""))).etag == first.etag
+        assert vacancy_repository.listings == 1
+
+        await use_case.execute(Pagination(page_size=20))
+        assert vacancy_repository.listings == 2
+
+        vacancy_repository.version = 2
+        fresh = await use_case.execute(Pagination())
+        assert fresh.payload["data"][0]["version"] == 2
+        assert fresh.etag != first.etag
+        assert vacancy_repository.listings == 3
+
+        assert cache.stats.hits == 2
+        assert cache.stats.hit_ratio == 0.4
@@ -0,0 +1,158 @@
+import asyncio
+from contextvars import ContextVar
+
+import pytest
+
+from adapters.libs.reportlab_adapter import ReportLabAdapter
+from application.dto.report_job import ReportJobStatus
+from application.errors.media import RenderQueueFull
+from domain.usecases.create_summary_report_job import CreateSummaryReportJobUseCase
+from domain.usecases.download_summary_report_job import (
+    DownloadSummaryReportJobUseCase,
+)
+from domain.usecases.download_vacancy_summary import DownloadVacancySummaryUseCase
+from domain.usecases.get_summary_report_job import GetSummaryReportJobUseCase
+from utils.cache_utils import TTLCache
+from utils.executor_utils import BoundedExecutor
+from utils.job_utils import JobManager
+
+# Stands in for the per request state, like the database session.
+request_state: ContextVar[str | None] = ContextVar("request_state", default=None)
+
+
+async def wait_until_finished(poll: GetSummaryReportJobUseCase, job_id: str):
+    while (await poll.execute(job_id=job_id)).payload["status"] in (
+        ReportJobStatus.queued,
+        ReportJobStatus.running,
+    ):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+class TestReportJobs:
+    """
+    Test class for generating sector summaries in background jobs.
+    """
+
+    async def test_job_lifecycle_with_deduplication(self, vacancy_repository, clock):
+        executor = BoundedExecutor(kind="thread", max_workers=1, max_queue=4)
+        jobs = JobManager(
+            workers=1,
+            max_queue=4,
+            results=TTLCache(max_size=4, ttl=60, clock=clock),
+            clock=clock,
+        )
+
+        create = CreateSummaryReportJobUseCase(
+            vacancy_repository,
+            DownloadVacancySummaryUseCase(
+                vacancy_repository, ReportLabAdapter(), executor
+            ),
+            jobs,
+        )
+        poll = GetSummaryReportJobUseCase(jobs)
+        download = DownloadSummaryReportJobUseCase(jobs)
+
+        try:
+            first = await create.execute(sector="IT")
+            duplicate = await create.execute(sector=" it ")
+            other = await create.execute(sector="RH")
+
+            assert first.status_code == 202
+            assert duplicate.payload["id"] == first.payload["id"]
+            assert other.payload["id"] != first.payload["id"]
+            assert (await create.execute(sector="Unknown")).status_code == 404
+
+            job_id = first.payload["id"]
+            assert (await download.execute(job_id=job_id)).status_code == 409
+
+            await wait_until_finished(poll, job_id)
+
+            status = (await poll.execute(job_id=job_id)).payload
+            assert status["status"] == ReportJobStatus.done
+            assert status["progress"] == 1.0
+            assert status["download_url"].endswith(f"/summary/jobs/{job_id}/download/")
+
+            report = await download.execute(job_id=job_id)
+            assert report.media.content.startswith(b"%PDF")
+            assert report.media.file_name == "vacancy_summary_it.pdf"
+
+            # Once finished, the same sector starts a new job.
+            again = await create.execute(sector="IT")
+            assert again.payload["id"] != job_id
+
+            clock.now = 61
+            assert (await poll.execute(job_id=job_id)).status_code == 404
+        finally:
+            jobs.shutdown()
+            executor.shutdown()
+
+    async def test_evicted_reports_are_no_longer_downloadable(self, clock):
+        jobs = JobManager(
+            workers=1,
+            max_queue=4,
+            results=TTLCache(max_size=4, ttl=60, max_bytes=10, clock=clock),
+            clock=clock,
+        )
+        poll = GetSummaryReportJobUseCase(jobs)
+        download = DownloadSummaryReportJobUseCase(jobs)
+
+        async def render(_job):
+            return b"%PDF-1234"
+
+        try:
+            first = jobs.submit("it", render)
+            await wait_until_finished(poll, first.id)
+            second = jobs.submit("rh", render)
+            await wait_until_finished(poll, second.id)
+
+            status = (await poll.execute(job_id=first.id)).payload
+            assert status["status"] == ReportJobStatus.done
+            assert status["download_url"] is None
+            assert (await download.execute(job_id=first.id)).status_code == 404
+
+            report = await download.execute(job_id=second.id)
+            assert report.media.content == b"%PDF-1234"
+        finally:
+            jobs.shutdown()
+
+    async def test_full_queue_is_refused(self):
+        jobs = JobManager(workers=1, max_queue=1)
+        gate = asyncio.Event()
+
+        async def wait_for_gate(_job):
+            await gate.wait()
+            return b""
+
+        try:
+            running = jobs.submit("a", wait_for_gate)
+            await asyncio.sleep(0)
+            queued = jobs.submit("b", wait_for_gate)
+
+            with pytest.raises(RenderQueueFull):
+                jobs.submit("c", wait_for_gate)
+
+            gate.set()
+            await asyncio.sleep(0.01)
+
+            assert running.status == ReportJobStatus.done
+            assert queued.status == ReportJobStatus.done
+        finally:
+            jobs.shutdown()
+
+    async def test_jobs_do_not_inherit_the_submitting_context(self, clock):
+        jobs = JobManager(workers=1, max_queue=4, clock=clock)
+
+        async def read_request_state(_job):
+            return (request_state.get() or "").encode()
+
+        try:
+            request_state.set("first request")
+            job = jobs.submit("a", read_request_state)
+
+            while job.status in (ReportJobStatus.queued, ReportJobStatus.running):
+                await asyncio.sleep(0.01)
+
+            assert jobs.result(job.id) == b""
+        finally:
+            jobs.shutdown()
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from infra.database.notifications import VACANCY_CHANGES_CHANNEL, VacancyChangesListener
+
+
+class FakeConnection:
+    """
+    Stand-in for an asyncpg connection that fails its keepalive when told to.
+    """
+
+    def __init__(self):
+        self.listeners = {}
+        self.queries = []
+        self.alive = True
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def execute(self, query):
+        self.queries.append(query)
+        if not self.alive:
+            raise ConnectionError("connection lost")
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        self.closed = True
+
+    def notify(self, payload):
+        self.listeners[VACANCY_CHANGES_CHANNEL](
+            self, 1, VACANCY_CHANGES_CHANNEL, payload
+        )
+
+
+@pytest.mark.asyncio
+class TestVacancyChangesListener:
+    """
+    Test class for evicting cached vacancies on notifications from other workers.
+    """
+
+    async def test_notifications_evict_ids_or_flush(self):
+        changes, flushes = [], []
+        connection = FakeConnection()
+
+        async def connect():
+            return connection
+
+        listener = VacancyChangesListener(
+            on_change=changes.append,
+            on_flush=lambda: flushes.append(True),
+            connect=connect,
+            keepalive_seconds=0.01,
+        )
+
+        task = asyncio.create_task(listener.listen_once())
+        await asyncio.sleep(0.02)
+
+        connection.notify("a,b")
+        connection.notify("*")
+
+        connection.alive = False
+        with pytest.raises(ConnectionError):
+            await task
+
+        assert changes == [["a", "b"]]
+        assert connection.queries[0] == "SELECT 1;"
+        # Once when listening starts, once for the "*" notification.
+        assert len(flushes) == 2
+        assert connection.closed
+
+    async def test_reconnects_and_flushes_after_a_gap(self):
+        flushes = []
+        connections = []
+
+        async def connect():
+            if len(connections) == 1:
+                connections.append(None)
+                raise ConnectionError("database unavailable")
+
+            connection = FakeConnection()
+            connection.alive = bool(connections)
+            connections.append(connection)
+            return connection
+
+        listener = VacancyChangesListener(
+            on_change=lambda ids: None,
+            on_flush=lambda: flushes.append(len(connections)),
+            connect=connect,
+            keepalive_seconds=0.01,
+            max_reconnect_delay=0.01,
+        )
+
+        task = asyncio.create_task(listener.run())
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert len(connections) >= 3
+        assert listener.listening
+        # Flushed on connect, on the lost connection, on the failed attempt and on reconnect.
+        assert flushes[:4] == [1, 1, 2, 3]
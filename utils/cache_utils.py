@@ -0,0 +1,165 @@
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a TTLCache since it was created, and the total length of
+    the bytes values it currently holds.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hit_ratio": round(self.hit_ratio, 4)}
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache, least recently used entries are evicted first
+    and every entry expires ttl seconds after it was stored. With max_bytes,
+    values must be bytes and their total length is bounded too.
+    Meant for a single event loop, so it needs no locking.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_size: Maximum number of entries kept.
+        :param ttl: Seconds an entry stays valid after being stored.
+        :param max_bytes: Optional maximum total length of the cached bytes values.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+
+        if max_size <= 0 or ttl <= 0:
+            raise ValueError("max_size and ttl must be positive.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        # Bumped on every invalidation, see set().
+        self.generation = 0
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self.stats.bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value stored for key, or default when it is missing or expired.
+        """
+
+        entry = self._entries.get(key, _MISSING)
+
+        if entry is _MISSING:
+            self.stats.misses += 1
+            return default
+
+        expires_at, value, _ = entry
+
+        if expires_at <= self._clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """
+        Store value for key, evicting the least recently used entry when full.
+
+        :param generation: The cache generation read before loading value. When an
+            invalidation happened since, value may predate the write behind it and
+            is not stored.
+        """
+
+        if generation is not None and generation != self.generation:
+            return
+
+        size = len(value) if self.max_bytes is not None else 0
+
+        # A value bigger than the whole budget would only evict everything else.
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._remove(key)
+        self._entries[key] = (self._clock() + self.ttl, value, size)
+        self.stats.bytes += size
+
+        while len(self._entries) > self.max_size or (
+            self.max_bytes is not None and self.stats.bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def _remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, _MISSING)
+
+        if entry is _MISSING:
+            return False
+
+        self.stats.bytes -= entry[2]
+        return True
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Drop the given keys, ignoring the ones not cached.
+        """
+
+        self.generation += 1
+
+        for key in keys:
+            if self._remove(key):
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+
+        self.generation += 1
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self.stats.bytes = 0
+
+    def snapshot(self) -> dict:
+        """
+        Size, limits and counters of the cache, e.g. for the health check.
+        """
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "max_bytes": self.max_bytes,
+            **self.stats.as_dict(),
+        }
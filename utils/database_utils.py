@@ -1,27 +1,100 @@
+import re
 import uuid
+from functools import lru_cache
 
 import sqlparse
 from pydantic import BaseModel
+from sqlparse import keywords
+from sqlparse import tokens as T
 
 from application.errors.database import SQLInjectionDetected
 
+# Words sqlparse reports as the type of a statement, from every keyword table it ships.
+SQL_STATEMENT_KEYWORDS = frozenset(
+    word
+    for table in vars(keywords).values()
+    if isinstance(table, dict)
+    for word, ttype in table.items()
+    if ttype in (T.Keyword.DML, T.Keyword.DDL)
+)
+SQL_KEYWORD_PATTERN = re.compile("|".join(sorted(SQL_STATEMENT_KEYWORDS)))
 
-def is_suspicious_input(text: str) -> bool:
+# First words of a statement with a type, including the WITH of a CTE.
+SQL_STATEMENT_PREFIXES = tuple(
+    sorted(
+        SQL_STATEMENT_KEYWORDS
+        | {
+            word
+            for table in vars(keywords).values()
+            if isinstance(table, dict)
+            for word, ttype in table.items()
+            if ttype is T.Keyword.CTE
+        }
+    )
+)
+
+# sqlparse only splits statements on ";" and an upper case GO, and only skips
+# comments before the first word. A text without them is a single statement.
+SQL_SPLIT_OR_COMMENT_PATTERN = re.compile(r";|GO|--|#|/\*")
+
+# Texts up to this length have their result memoized, longer ones are rarely repeated.
+MEMOIZED_INPUT_MAX_LENGTH = 256
+MEMOIZED_INPUTS = 4096
+
+
+def is_sql_statement(text: str) -> bool:
     """
-    Check if the input text contains SQL commands or suspicious patterns.
+    Check with a full sqlparse parse if any statement of the text is a SQL command.
     """
 
     parsed = sqlparse.parse(text)
     return any(stmt.get_type() != "UNKNOWN" for stmt in parsed)
 
 
+def _is_suspicious(text: str) -> bool:
+    # sqlparse upper-cases words before looking them up, so a statement keyword
+    # is always a substring of text.upper(). No word boundaries: sqlparse also
+    # splits words e.g. after hex literals or before combining marks.
+    if SQL_KEYWORD_PATTERN.search(text.upper()) is None:
+        return False
+
+    if SQL_SPLIT_OR_COMMENT_PATTERN.search(text) is None and not (
+        text.lstrip().upper().startswith(SQL_STATEMENT_PREFIXES)
+    ):
+        return False
+
+    return is_sql_statement(text)
+
+
+_is_suspicious_memoized = lru_cache(maxsize=MEMOIZED_INPUTS)(_is_suspicious)
+
+
+def is_suspicious_input(text: str) -> bool:
+    """
+    Check if the input text contains SQL commands or suspicious patterns.
+    Only texts that may start a statement with a keyword are parsed, and results for short
+    texts, repeated across requests like sectors and manager names, are memoized.
+    """
+
+    if len(text) <= MEMOIZED_INPUT_MAX_LENGTH:
+        return _is_suspicious_memoized(text)
+
+    return _is_suspicious(text)
+
+
 def validate_no_sql_commands(input_data: BaseModel):
     """
     Check if any string field in the input contains SQL command patterns.
-    Raises ValueError if suspicious SQL is detected.
+    Raises SQLInjectionDetected if suspicious SQL is detected.
     """
 
-    for field_name, value in input_data.model_dump().items():
+    fields = {
+        field_name: getattr(input_data, field_name)
+        for field_name in type(input_data).model_fields
+    }
+    fields.update(input_data.model_extra or {})
+
+    for field_name, value in fields.items():
         if isinstance(value, str) and is_suspicious_input(value):
             raise SQLInjectionDetected(
                 f"Field '{field_name}' contains a forbidden SQL pattern."
@@ -40,3 +113,14 @@ def is_valid_uuid(id_str: str) -> bool:
         return True
     except ValueError:
         return False
+
+
+def escape_like(value: str) -> str:
+    """
+    Escape the LIKE/ILIKE wildcards of a value so it is matched literally.
+
+    :param value: The raw text to search for.
+    :return: The escaped text, to be wrapped with % by the caller.
+    """
+
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 from application.errors.date import DateTimeWrongFormat
 
@@ -33,3 +33,15 @@ def validate_dates(start_date: datetime, end_date: datetime | None):
             raise DateTimeWrongFormat(
                 f"{field_name} must be a datetime or ISO 8601 string, not {type(date_value).__name__}"
             )
+
+
+def as_aware_datetime(date_value: datetime | None) -> datetime | None:
+    """
+    Return the datetime with a timezone, assuming UTC for naive values.
+    Raw database writes bypass the ORM, which would otherwise apply this default.
+    """
+
+    if date_value is None or date_value.tzinfo is not None:
+        return date_value
+
+    return date_value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that determine a representation.
+
+    :param parts: Values whose change must change the ETag, e.g. a version and the query.
+    :return: Quoted ETag header value.
+    """
+
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag (weak comparison, RFC 9110).
+
+    :param if_none_match: The header value, a list of ETags or "*".
+    :param etag: The current ETag of the resource.
+    :return: True when the client's copy is still current.
+    """
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
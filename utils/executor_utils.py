@@ -0,0 +1,89 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from application.errors.media import RenderQueueFull
+
+
+class BoundedExecutor:
+    """
+    Runs blocking functions off the event loop on a pool of workers.
+    At most max_workers calls run at once and max_queue more wait for a worker,
+    further calls are refused with RenderQueueFull instead of piling up.
+    """
+
+    def __init__(self, kind: str = "process", max_workers: int = 2, max_queue: int = 8):
+        """
+        :param kind: "process" for a process pool, "thread" for a thread pool.
+        :param max_workers: Amount of calls running at the same time.
+        :param max_queue: Amount of calls allowed to wait for a free worker.
+        """
+
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown executor kind: {kind}.")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """
+        Calls running or waiting for a worker.
+        """
+
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        # Created on first use, so importing the app doesn't start any worker.
+        if self._executor is None:
+            if self.kind == "process":
+                # spawn, forking a process running an event loop is not safe.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="render"
+                )
+
+        return self._executor
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, function: Callable[..., Any], *args) -> Any:
+        """
+        Run function(*args) on a worker and wait for its result.
+        With a process pool, function and args must be picklable.
+
+        :raises RenderQueueFull: When every worker is busy and the queue is full.
+        """
+
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                raise RenderQueueFull()
+            self._pending += 1
+
+        try:
+            future = self._get_executor().submit(function, *args)
+        except BaseException:
+            self._release(None)
+            raise
+
+        # Released when the work is done, even if the request awaiting it is gone.
+        future.add_done_callback(self._release)
+
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
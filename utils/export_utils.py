@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, List, Mapping
+from urllib.parse import quote
+from uuid import UUID
+
+# Columns of an exported vacancy, in the order of the CSV header.
+EXPORT_COLUMNS = (
+    "id",
+    "description",
+    "sector",
+    "manager",
+    "salary_expectation",
+    "urgency",
+    "status",
+    "start_date",
+    "end_date",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+
+
+def attachment_header(file_name: str) -> dict:
+    """
+    Content-Disposition header of a downloaded file, RFC 5987 encoded when
+    the name isn't plain ASCII (e.g. a sector with accents).
+    """
+
+    quoted_name = quote(file_name)
+
+    if quoted_name != file_name:
+        return {"Content-Disposition": f"attachment; filename*=utf-8''{quoted_name}"}
+
+    return {"Content-Disposition": f'attachment; filename="{file_name}"'}
+
+
+def _export_value(value: Any) -> Any:
+    """
+    Convert a database value to the representation used by the API.
+    """
+
+    if isinstance(value, datetime):
+        return value.isoformat().replace("+00:00", "Z")
+
+    if isinstance(value, UUID):
+        return str(value)
+
+    return value
+
+
+def encode_csv_rows(rows: List[Mapping[str, Any]], include_header: bool) -> bytes:
+    """
+    Encode a chunk of rows as CSV lines.
+
+    :param rows: Rows of a single chunk, with at least the EXPORT_COLUMNS.
+    :param include_header: Whether to write the column names first (first chunk only),
+        also written when there are no rows.
+    :return: The encoded CSV lines.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if include_header:
+        writer.writerow(EXPORT_COLUMNS)
+
+    writer.writerows(
+        [_export_value(row[column]) for column in EXPORT_COLUMNS] for row in rows
+    )
+
+    return buffer.getvalue().encode()
+
+
+def encode_ndjson_rows(rows: List[Mapping[str, Any]]) -> bytes:
+    """
+    Encode a chunk of rows as newline delimited JSON.
+
+    :param rows: Rows of a single chunk.
+    :return: One JSON object per line.
+    """
+
+    return "".join(
+        json.dumps({key: _export_value(value) for key, value in row.items()}) + "\n"
+        for row in rows
+    ).encode()
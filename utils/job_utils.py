@@ -0,0 +1,159 @@
+import asyncio
+import contextvars
+import time
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict
+from uuid import uuid4
+
+from application.dto.report_job import ReportJobStatus
+from application.errors.media import RenderQueueFull
+from utils.cache_utils import TTLCache
+
+
+@dataclass
+class Job:
+    """
+    State of a background job, mutated by the worker running it. Its result is
+    kept apart, by the JobManager.
+    """
+
+    key: str
+    id: str = field(default_factory=lambda: str(uuid4()))
+    status: ReportJobStatus = ReportJobStatus.queued
+    progress: float = 0.0
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    error: str | None = None
+    expires_at: float | None = None
+
+    def set_progress(self, progress: float) -> None:
+        self.progress = round(min(max(progress, 0.0), 1.0), 4)
+
+
+class JobManager:
+    """
+    Runs jobs in the background on a fixed amount of worker tasks.
+    Submitting the key of a queued or running job returns that job instead of
+    starting another one. Finished jobs are kept for the TTL of the results
+    cache, whose size bounds the results held, so a result may be evicted
+    before its job expires.
+    Jobs live in the memory of the process that accepted them.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 16,
+        results: TTLCache | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param workers: Amount of jobs running at the same time.
+        :param max_queue: Amount of jobs allowed to wait for a worker.
+        :param results: Cache of the job results, by job id. Defaults to 32 results
+            of at most 64 MiB in total, kept for 15 minutes.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+
+        self.workers = workers
+        self.max_queue = max_queue
+        self.results = (
+            results
+            if results is not None
+            else TTLCache(
+                max_size=32, ttl=900.0, max_bytes=64 * 1024 * 1024, clock=clock
+            )
+        )
+        self._clock = clock
+        self._jobs: Dict[str, Job] = {}
+        self._active: Dict[str, Job] = {}
+        self._queue: asyncio.Queue | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+
+    def _purge(self) -> None:
+        now = self._clock()
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.expires_at is not None and job.expires_at <= now
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _start_workers(self) -> None:
+        # Started on first use, from inside the running event loop. Each worker
+        # gets an empty context: a copy of the first request's would leak its
+        # database session and routing into every later job.
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._worker_tasks = [
+                asyncio.create_task(self._work(), context=contextvars.Context())
+                for _ in range(self.workers)
+            ]
+
+    def submit(self, key: str, run: Callable[[Job], Awaitable[Any]]) -> Job:
+        """
+        Queue run(job), or return the queued or running job with the same key.
+
+        :param key: Identity of the work, equal keys are deduplicated.
+        :param run: Coroutine function producing the result, may call job.set_progress.
+        :raises RenderQueueFull: When the queue is full.
+        """
+
+        self._purge()
+
+        if key in self._active:
+            return self._active[key]
+
+        self._start_workers()
+
+        job = Job(key=key)
+
+        try:
+            self._queue.put_nowait((job, run))
+        except asyncio.QueueFull:
+            raise RenderQueueFull() from None
+
+        self._jobs[job.id] = job
+        self._active[key] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        self._purge()
+        return self._jobs.get(job_id)
+
+    def result(self, job_id: str) -> Any:
+        """
+        Return the result of a done job, or None when it was evicted or expired.
+        """
+
+        return self.results.get(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job, run = await self._queue.get()
+            job.status = ReportJobStatus.running
+
+            try:
+                self.results.set(job.id, await run(job))
+                job.status = ReportJobStatus.done
+                job.set_progress(1.0)
+            except Exception as e:
+                traceback.print_exc()
+                job.status = ReportJobStatus.failed
+                job.error = str(e)
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+                job.expires_at = self._clock() + self.results.ttl
+                self._active.pop(job.key, None)
+                self._queue.task_done()
+
+    def shutdown(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+
+        self._worker_tasks = []
+        self._queue = None
+        self._active.clear()
@@ -0,0 +1,38 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+from application.errors.pagination import InvalidPaginationCursor
+
+
+def encode_cursor(created_at: datetime, vacancy_id: UUID) -> str:
+    """
+    Encode the keyset position (created_at, id) of a vacancy as an opaque cursor.
+
+    :param created_at: Creation date of the last vacancy of a page.
+    :param vacancy_id: ID of the last vacancy of a page.
+    :return: URL-safe base64 string to be sent back by the client.
+    """
+
+    raw_cursor = json.dumps([created_at.isoformat(), str(vacancy_id)])
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode an opaque cursor generated by encode_cursor.
+    Raises InvalidPaginationCursor if the cursor is malformed.
+
+    :param cursor: The cursor received from the client.
+    :return: Tuple with the created_at and id of the last vacancy seen.
+    """
+
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        raw_cursor = base64.urlsafe_b64decode(cursor + padding).decode()
+        created_at, vacancy_id = json.loads(raw_cursor)
+        return datetime.fromisoformat(created_at), UUID(vacancy_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise InvalidPaginationCursor(f"Invalid pagination cursor: {cursor}.") from exc
@@ -0,0 +1,60 @@
+import json
+from typing import Any, AsyncIterator
+
+from application.errors.bulk import InvalidBulkPayload
+
+
+def _decode_json_line(line: bytes) -> Any:
+    """
+    Decode a single NDJSON line, returning the error instead of raising it
+    so one malformed line doesn't abort the whole stream.
+    """
+
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return InvalidBulkPayload(f"Invalid JSON line: {exc}.")
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Incrementally decode a newline delimited JSON stream.
+    Blank lines are skipped, malformed lines are yielded as InvalidBulkPayload.
+
+    :param chunks: Raw byte chunks, e.g. starlette's request.stream().
+    :return: Async iterator over the decoded items.
+    """
+
+    buffer = b""
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            if line.strip():
+                yield _decode_json_line(line)
+
+    if buffer.strip():
+        yield _decode_json_line(buffer)
+
+
+async def iter_json_array(body: bytes) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of a JSON array body.
+    Raises InvalidBulkPayload if the body is not a JSON array.
+
+    :param body: The raw request body.
+    :return: Async iterator over the array items.
+    """
+
+    try:
+        items = json.loads(body)
+    except ValueError as exc:
+        raise InvalidBulkPayload(f"Invalid JSON body: {exc}.") from exc
+
+    if not isinstance(items, list):
+        raise InvalidBulkPayload("Expected a JSON array of vacancies.")
+
+    for item in items:
+        yield item
@@ -1,23 +1,46 @@
-from typing import Annotated, Any
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Body, Depends, Path, Query
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, Body, Depends, Header, Path, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from application.dto.pagination import Pagination
 from application.dto.simulation import CostSimulationInput
-from application.dto.vacancy import NotesInput, StatusToUpdate, VacancyInput
+from application.dto.vacancy import (
+    BulkStatusUpdateInput,
+    ExportFormat,
+    NotesInput,
+    StatusToUpdate,
+    VacancyInput,
+)
+from domain.usecases.bulk_create_vacancies import BulkCreateVacancyUseCase
+from domain.usecases.bulk_edit_vacancy_status import BulkEditVacancyStatusUseCase
+from domain.usecases.create_summary_report_job import CreateSummaryReportJobUseCase
 from domain.usecases.create_vacancy import CreateVacancyUseCase
 from domain.usecases.delete_vacancy import DeleteVacancyUseCase
+from domain.usecases.download_summary_report_job import (
+    DownloadSummaryReportJobUseCase,
+)
 from domain.usecases.download_vacancy_summary import DownloadVacancySummaryUseCase
 from domain.usecases.edit_vacancy_status import EditVacancyStatusUseCase
+from domain.usecases.export_vacancies import ExportVacanciesUseCase
+from domain.usecases.get_summary_report_job import GetSummaryReportJobUseCase
 from domain.usecases.get_vacancy import GetVacancyUseCase
 from domain.usecases.list_vacancy import ListVacancyUseCase
 from domain.usecases.simulate_vacancy_costs import SimulateVacancyCostsUseCase
 from domain.usecases.update_vacancy import UpdateVacancyUseCase
+from utils.export_utils import attachment_header
+from utils.stream_utils import iter_json_array, iter_ndjson
 from web.dependencies import (
+    bulk_create_vacancy_use_case,
+    bulk_edit_vacancy_status_use_case,
+    create_summary_report_job_use_case,
     create_vacancy_use_case,
     delete_vacancy_use_case,
+    download_summary_report_job_use_case,
     download_vacancy_summary_costs_use_case,
     edit_vacancy_status_use_case,
+    export_vacancies_use_case,
+    get_summary_report_job_use_case,
     get_vacancy_use_case,
     list_vacancy_use_case,
     simulate_vacancy_costs_use_case,
@@ -37,13 +60,87 @@ async def create_vacancy(
     return JSONResponse(content=response.model_dump(), status_code=response.status_code)
 
 
+@vacancy_router.post(
+    "/bulk/",
+    summary="Route for bulk creation of vacancies from a JSON array or NDJSON stream.",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/VacancyInput"},
+                    }
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def bulk_create_vacancies(
+    request: Request,
+    use_case: Annotated[
+        BulkCreateVacancyUseCase, Depends(bulk_create_vacancy_use_case)
+    ],
+):
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = iter_ndjson(request.stream())
+    else:
+        items = iter_json_array(await request.body())
+
+    response = await use_case.execute(items=items)
+    return JSONResponse(content=response.model_dump(), status_code=response.status_code)
+
+
+@vacancy_router.get(
+    "/export/", summary="Route for streaming every vacancy as a CSV or NDJSON file."
+)
+async def export_vacancies(
+    use_case: Annotated[ExportVacanciesUseCase, Depends(export_vacancies_use_case)],
+    export_format: ExportFormat = Query(default=ExportFormat.csv, alias="format"),
+    search: Optional[str] = Query(None),
+):
+    response = await use_case.execute(export_format=export_format, search=search)
+
+    if isinstance(response, HttpResponse):
+        return JSONResponse(
+            content=response.model_dump(), status_code=response.status_code
+        )
+
+    return StreamingResponse(
+        content=response.media.content,
+        media_type=response.media.media_type,
+        headers=attachment_header(response.media.file_name),
+    )
+
+
 @vacancy_router.get("/{vacancy_id}/", summary="Route for getting a vacancy by ID.")
 async def get_vacancy(
     vacancy_id: Annotated[str, Path(...)],
     use_case: Annotated[GetVacancyUseCase, Depends(get_vacancy_use_case)],
+    include_archived: bool = Query(
+        default=False, description="Also look for the vacancy in the archive."
+    ),
+    if_none_match: Optional[str] = Header(None),
 ):
-    response = await use_case.execute(vacancy_id=vacancy_id)
-    return JSONResponse(content=response.model_dump(), status_code=response.status_code)
+    response = await use_case.execute(
+        vacancy_id=vacancy_id,
+        include_archived=include_archived,
+        if_none_match=if_none_match,
+    )
+    headers = (
+        {"ETag": response.etag, "Cache-Control": "no-cache"} if response.etag else None
+    )
+
+    if response.status_code == 304:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(
+        content=response.model_dump(),
+        status_code=response.status_code,
+        headers=headers,
+    )
 
 
 @vacancy_router.delete("/{vacancy_id}/", summary="Route for deleting a vacancy by ID.")
@@ -70,12 +167,24 @@ async def update_vacancy(
 @vacancy_router.get("/", summary="Route for getting all vacancies.")
 async def list_vacancies(
     use_case: Annotated[ListVacancyUseCase, Depends(list_vacancy_use_case)],
-    search: Any = Query(None),
-    page: int = Query(default=0, gte=0),
-    page_size: int = Query(default=10, le=100, gt=0),
+    pagination: Annotated[Pagination, Query()],
+    if_none_match: Optional[str] = Header(None),
 ):
-    response = await use_case.execute(page=page, page_size=page_size, search=search)
-    return JSONResponse(content=response.model_dump(), status_code=response.status_code)
+    response = await use_case.execute(
+        pagination=pagination, if_none_match=if_none_match
+    )
+    headers = (
+        {"ETag": response.etag, "Cache-Control": "no-cache"} if response.etag else None
+    )
+
+    if response.status_code == 304:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(
+        content=response.model_dump(),
+        status_code=response.status_code,
+        headers=headers,
+    )
 
 
 @vacancy_router.get(
@@ -94,13 +203,92 @@ async def download_vacancy_summary(
             content=response.model_dump(), status_code=response.status_code
         )
 
-    return FileResponse(
-        path=response.media.path,
+    return Response(
+        content=response.media.content,
         media_type=response.media.media_type,
-        filename=response.media.file_name,
+        headers=attachment_header(response.media.file_name),
     )
 
 
+@vacancy_router.post(
+    "/summary/jobs/", summary="Route for generating a vacancy summary in background."
+)
+async def create_summary_report_job(
+    sector: Annotated[str, Query(...)],
+    use_case: Annotated[
+        CreateSummaryReportJobUseCase, Depends(create_summary_report_job_use_case)
+    ],
+):
+    response = await use_case.execute(sector=sector)
+
+    headers = (
+        {"Location": f"/api/v1/vacancy/summary/jobs/{response.payload['id']}/"}
+        if response.status_code == 202
+        else None
+    )
+
+    return JSONResponse(
+        content=response.model_dump(),
+        status_code=response.status_code,
+        headers=headers,
+    )
+
+
+@vacancy_router.get(
+    "/summary/jobs/{job_id}/", summary="Route for polling a vacancy summary job."
+)
+async def get_summary_report_job(
+    job_id: Annotated[str, Path(...)],
+    use_case: Annotated[
+        GetSummaryReportJobUseCase, Depends(get_summary_report_job_use_case)
+    ],
+):
+    response = await use_case.execute(job_id=job_id)
+    return JSONResponse(content=response.model_dump(), status_code=response.status_code)
+
+
+@vacancy_router.get(
+    "/summary/jobs/{job_id}/download/",
+    summary="Route for downloading the vacancy summary of a finished job.",
+)
+async def download_summary_report_job(
+    job_id: Annotated[str, Path(...)],
+    use_case: Annotated[
+        DownloadSummaryReportJobUseCase, Depends(download_summary_report_job_use_case)
+    ],
+):
+    response = await use_case.execute(job_id=job_id)
+
+    if isinstance(response, HttpResponse):
+        return JSONResponse(
+            content=response.model_dump(), status_code=response.status_code
+        )
+
+    return Response(
+        content=response.media.content,
+        media_type=response.media.media_type,
+        headers=attachment_header(response.media.file_name),
+    )
+
+
+@vacancy_router.patch(
+    "/bulk/status/",
+    summary="Route for editing the status of many vacancies.",
+    description=(
+        "Selects vacancies by ids, any status, or by filters, which only match "
+        "IN_PROGRESS vacancies. Vacancies skipped by the filters are not reported."
+    ),
+)
+async def bulk_update_vacancy_status(
+    bulk_status_input: Annotated[BulkStatusUpdateInput, Body(...)],
+    use_case: Annotated[
+        BulkEditVacancyStatusUseCase, Depends(bulk_edit_vacancy_status_use_case)
+    ],
+):
+    response = await use_case.execute(bulk_status_input=bulk_status_input)
+    return JSONResponse(content=response.model_dump(), status_code=response.status_code)
+
+
 @vacancy_router.patch(
     "/{vacancy_id}/status/", summary="Route for editing a vacancy status."
 )
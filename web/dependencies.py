@@ -1,19 +1,34 @@
+import os
 from typing import Annotated
 
 from fastapi import Depends
 
 from adapters.libs.reportlab_adapter import ReportLabAdapter
+from adapters.repositories.asyncpg_vacancy_repository import AsyncpgVacancyRepository
+from adapters.repositories.cached_vacancy_repository import CachedVacancyRepository
 from adapters.repositories.health_repository import HealthRepository
 from adapters.repositories.vacancy_repository import VacancyRepository
+from domain.interfaces.vacancy_repository import IVacancyRepository
+from domain.usecases.bulk_create_vacancies import BulkCreateVacancyUseCase
+from domain.usecases.bulk_edit_vacancy_status import BulkEditVacancyStatusUseCase
+from domain.usecases.create_summary_report_job import CreateSummaryReportJobUseCase
 from domain.usecases.create_vacancy import CreateVacancyUseCase
 from domain.usecases.delete_vacancy import DeleteVacancyUseCase
+from domain.usecases.download_summary_report_job import (
+    DownloadSummaryReportJobUseCase,
+)
 from domain.usecases.download_vacancy_summary import DownloadVacancySummaryUseCase
 from domain.usecases.edit_vacancy_status import EditVacancyStatusUseCase
+from domain.usecases.export_vacancies import ExportVacanciesUseCase
 from domain.usecases.get_health_status import GetHealthStatusUseCase
+from domain.usecases.get_summary_report_job import GetSummaryReportJobUseCase
 from domain.usecases.get_vacancy import GetVacancyUseCase
 from domain.usecases.list_vacancy import ListVacancyUseCase
 from domain.usecases.simulate_vacancy_costs import SimulateVacancyCostsUseCase
 from domain.usecases.update_vacancy import UpdateVacancyUseCase
+from utils.cache_utils import TTLCache
+from utils.executor_utils import BoundedExecutor
+from utils.job_utils import JobManager
 
 
 def reportlab_pdf_adapter():
@@ -21,15 +36,110 @@ def reportlab_pdf_adapter():
     function that injects the dependencies for ReportLabPDFAdapter
     """
 
-    return ReportLabAdapter()
+    return ReportLabAdapter(
+        large_report_rows=int(os.getenv("PDF_LARGE_REPORT_ROWS", "500"))
+    )
 
 
-def vacancy_repository():
+# Shared by every request of the process, shut down in the lifespan.
+pdf_render_executor = BoundedExecutor(
+    kind=os.getenv("PDF_RENDER_EXECUTOR", "process"),
+    max_workers=int(os.getenv("PDF_RENDER_WORKERS", "2")),
+    max_queue=int(os.getenv("PDF_RENDER_QUEUE_SIZE", "8")),
+)
+
+
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Rendered sector summaries, keyed by the sector and a fingerprint of its data.
+summary_pdf_cache = (
+    TTLCache(
+        max_size=int(os.getenv("PDF_CACHE_MAX_SIZE", "256")),
+        ttl=float(os.getenv("PDF_CACHE_TTL_SECONDS", "86400")),
+        max_bytes=PDF_CACHE_MAX_BYTES,
+    )
+    if PDF_CACHE_MAX_BYTES > 0
+    else None
+)
+
+
+def pdf_executor() -> BoundedExecutor:
     """
-    function that injects the dependencies for VacancyRepository
+    function that injects the dependencies for the PDF render executor
     """
 
-    return VacancyRepository()
+    return pdf_render_executor
+
+
+VACANCY_REPOSITORIES = {
+    "tortoise": VacancyRepository,
+    "asyncpg": AsyncpgVacancyRepository,
+}
+
+VACANCY_REPOSITORY_BACKEND = os.getenv("VACANCY_REPOSITORY_BACKEND", "tortoise")
+
+VACANCY_CACHE_TTL_SECONDS = float(os.getenv("VACANCY_CACHE_TTL_SECONDS", "0"))
+
+# One cache per process, shared by every request. Disabled unless a TTL is set.
+vacancy_cache = (
+    TTLCache(
+        max_size=int(os.getenv("VACANCY_CACHE_MAX_SIZE", "1024")),
+        ttl=VACANCY_CACHE_TTL_SECONDS,
+    )
+    if VACANCY_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+
+VACANCY_PAGE_CACHE_TTL_SECONDS = float(
+    os.getenv("VACANCY_PAGE_CACHE_TTL_SECONDS", "300")
+)
+
+# Listing pages are keyed by the vacancy generation, so they are never stale.
+# The TTL and size only bound the memory held by old generations.
+vacancy_page_cache = (
+    TTLCache(
+        max_size=int(os.getenv("VACANCY_PAGE_CACHE_MAX_SIZE", "256")),
+        ttl=VACANCY_PAGE_CACHE_TTL_SECONDS,
+    )
+    if VACANCY_PAGE_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+
+# Background sector summary reports, shut down in the lifespan.
+report_job_manager = JobManager(
+    workers=int(os.getenv("REPORT_JOB_WORKERS", "2")),
+    max_queue=int(os.getenv("REPORT_JOB_QUEUE_SIZE", "16")),
+    results=TTLCache(
+        max_size=int(os.getenv("REPORT_JOB_MAX_RESULTS", "32")),
+        ttl=float(os.getenv("REPORT_JOB_RESULT_TTL_SECONDS", "900")),
+        max_bytes=int(os.getenv("REPORT_JOB_MAX_RESULT_BYTES", str(64 * 1024 * 1024))),
+    ),
+)
+
+
+def report_jobs() -> JobManager:
+    """
+    function that injects the dependencies for the report job manager
+    """
+
+    return report_job_manager
+
+
+def vacancy_repository() -> IVacancyRepository:
+    """
+    function that injects the dependencies for the vacancy repository
+    chosen by VACANCY_REPOSITORY_BACKEND (tortoise or asyncpg),
+    wrapped by the vacancy cache when VACANCY_CACHE_TTL_SECONDS is set
+    """
+
+    repository = VACANCY_REPOSITORIES[VACANCY_REPOSITORY_BACKEND]()
+
+    if vacancy_cache is None:
+        return repository
+
+    return CachedVacancyRepository(repository, vacancy_cache)
 
 
 def health_repository():
@@ -41,7 +151,7 @@ def health_repository():
 
 
 def create_vacancy_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> CreateVacancyUseCase:
     """
     function that injects the dependencies for CreateVacancyUseCase
@@ -50,8 +160,18 @@ def create_vacancy_use_case(
     return CreateVacancyUseCase(repository)
 
 
+def bulk_create_vacancy_use_case(
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
+) -> BulkCreateVacancyUseCase:
+    """
+    function that injects the dependencies for BulkCreateVacancyUseCase
+    """
+
+    return BulkCreateVacancyUseCase(repository)
+
+
 def get_vacancy_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> GetVacancyUseCase:
     """
     function that injects the dependencies for GetVacancyUseCase
@@ -61,7 +181,7 @@ def get_vacancy_use_case(
 
 
 def delete_vacancy_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> DeleteVacancyUseCase:
     """
     function that injects the dependencies for DeleteVacancyUseCase
@@ -71,7 +191,7 @@ def delete_vacancy_use_case(
 
 
 def update_vacancy_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> UpdateVacancyUseCase:
     """
     function that injects the dependencies for UpdateVacancyUseCase
@@ -81,17 +201,27 @@ def update_vacancy_use_case(
 
 
 def list_vacancy_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> ListVacancyUseCase:
     """
     function that injects the dependencies for ListVacancyUseCase
     """
 
-    return ListVacancyUseCase(repository)
+    return ListVacancyUseCase(repository, vacancy_page_cache)
+
+
+def export_vacancies_use_case(
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
+) -> ExportVacanciesUseCase:
+    """
+    function that injects the dependencies for ExportVacanciesUseCase
+    """
+
+    return ExportVacanciesUseCase(repository)
 
 
 def edit_vacancy_status_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> EditVacancyStatusUseCase:
     """
     function that injects the dependencies for EditVacancyStatusUseCase
@@ -100,8 +230,18 @@ def edit_vacancy_status_use_case(
     return EditVacancyStatusUseCase(repository)
 
 
+def bulk_edit_vacancy_status_use_case(
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
+) -> BulkEditVacancyStatusUseCase:
+    """
+    function that injects the dependencies for BulkEditVacancyStatusUseCase
+    """
+
+    return BulkEditVacancyStatusUseCase(repository)
+
+
 def simulate_vacancy_costs_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
 ) -> SimulateVacancyCostsUseCase:
     """
     function that injects the dependencies for SimulateVacancyCostsUseCase
@@ -111,14 +251,51 @@ def simulate_vacancy_costs_use_case(
 
 
 def download_vacancy_summary_costs_use_case(
-    repository: Annotated[VacancyRepository, Depends(vacancy_repository)],
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
     pdf_adapter: Annotated[ReportLabAdapter, Depends(reportlab_pdf_adapter)],
+    executor: Annotated[BoundedExecutor, Depends(pdf_executor)],
 ) -> DownloadVacancySummaryUseCase:
     """
     function that injects the dependencies for DownloadVacancySummaryUseCase
     """
 
-    return DownloadVacancySummaryUseCase(repository, pdf_adapter)
+    return DownloadVacancySummaryUseCase(
+        repository, pdf_adapter, executor, summary_pdf_cache
+    )
+
+
+def create_summary_report_job_use_case(
+    repository: Annotated[IVacancyRepository, Depends(vacancy_repository)],
+    download_use_case: Annotated[
+        DownloadVacancySummaryUseCase, Depends(download_vacancy_summary_costs_use_case)
+    ],
+    jobs: Annotated[JobManager, Depends(report_jobs)],
+) -> CreateSummaryReportJobUseCase:
+    """
+    function that injects the dependencies for CreateSummaryReportJobUseCase
+    """
+
+    return CreateSummaryReportJobUseCase(repository, download_use_case, jobs)
+
+
+def get_summary_report_job_use_case(
+    jobs: Annotated[JobManager, Depends(report_jobs)],
+) -> GetSummaryReportJobUseCase:
+    """
+    function that injects the dependencies for GetSummaryReportJobUseCase
+    """
+
+    return GetSummaryReportJobUseCase(jobs)
+
+
+def download_summary_report_job_use_case(
+    jobs: Annotated[JobManager, Depends(report_jobs)],
+) -> DownloadSummaryReportJobUseCase:
+    """
+    function that injects the dependencies for DownloadSummaryReportJobUseCase
+    """
+
+    return DownloadSummaryReportJobUseCase(jobs)
 
 
 def get_health_status_use_case(
@@ -128,4 +305,15 @@ def get_health_status_use_case(
     function that injects the dependencies for GetHealthStatusUseCase
     """
 
-    return GetHealthStatusUseCase(repository)
+    caches = {
+        name: cache
+        for name, cache in (
+            ("vacancy", vacancy_cache),
+            ("vacancy_pages", vacancy_page_cache),
+            ("summary_pdfs", summary_pdf_cache),
+            ("report_job_results", report_job_manager.results),
+        )
+        if cache is not None
+    }
+
+    return GetHealthStatusUseCase(repository, caches)
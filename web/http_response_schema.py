@@ -1,6 +1,6 @@
-from typing import Any
+from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class HttpResponse(BaseModel):
@@ -8,6 +8,7 @@ class HttpResponse(BaseModel):
 
     status_code: int
     payload: Any
+    etag: Optional[str] = Field(None, exclude=True)
 
 
 class DefaultFileResponse(BaseModel):
@@ -19,6 +20,15 @@ class DefaultFileResponse(BaseModel):
     status_code: int = 200
 
 
+class DefaultStreamResponse(BaseModel):
+    """
+    Default streamed file response schema.
+    """
+
+    media: Any
+    status_code: int = 200
+
+
 class HttpResponseSchema:
     """
     Helper class for HTTP responses.
@@ -54,6 +64,16 @@ class HttpResponseSchema:
 
         return HttpResponse(status_code=400, payload=str(error))
 
+    @staticmethod
+    def conflict(error: Exception) -> HttpResponse:
+        """
+        This method treats a conflict with the current state of a resource
+        :param error: --> Exception caught or raised in the system.
+        :return: HttpResponse object with status_code and payload with the reason of error.
+        """
+
+        return HttpResponse(status_code=409, payload=str(error))
+
     @staticmethod
     def unprocessable_entity(error: Exception) -> HttpResponse:
         """
@@ -95,14 +115,25 @@ class HttpResponseSchema:
         return HttpResponse(status_code=404, payload=str(error))
 
     @staticmethod
-    def ok(data: Any):
+    def ok(data: Any, etag: Optional[str] = None):
         """
         This method treats a successful response from server
         :param data: --> Content to be shown as a success response.
+        :param etag: --> Optional ETag of the content, sent as a header.
         :return: HttpResponse object with status_code and payload with the reason of error.
         """
 
-        return HttpResponse(status_code=200, payload=data)
+        return HttpResponse(status_code=200, payload=data, etag=etag)
+
+    @staticmethod
+    def not_modified(etag: str):
+        """
+        This method treats a conditional request whose content didn't change
+        :param etag: --> Current ETag, matching the one sent by the client.
+        :return: HttpResponse object with status_code and no payload.
+        """
+
+        return HttpResponse(status_code=304, payload=None, etag=etag)
 
     @staticmethod
     def ok_file_response(media: Any) -> DefaultFileResponse:
@@ -112,6 +143,34 @@ class HttpResponseSchema:
 
         return DefaultFileResponse(status_code=200, media=media)
 
+    @staticmethod
+    def ok_stream_response(media: Any) -> DefaultStreamResponse:
+        """
+        This method treats a successful streamed file response from server
+        """
+
+        return DefaultStreamResponse(status_code=200, media=media)
+
+    @staticmethod
+    def accepted(data: Any):
+        """
+        This method treats a request accepted to be processed in the background
+        :param data: --> Content describing the accepted work.
+        :return: HttpResponse object with status_code and payload with the accepted work.
+        """
+
+        return HttpResponse(status_code=202, payload=data)
+
+    @staticmethod
+    def multi_status(data: Any):
+        """
+        This method treats a response whose items had different outcomes
+        :param data: --> Content with the result of each item.
+        :return: HttpResponse object with status_code and payload with the result of each item.
+        """
+
+        return HttpResponse(status_code=207, payload=data)
+
     @staticmethod
     def created(data: Any):
         """